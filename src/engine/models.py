@@ -6,8 +6,9 @@ and their components after processing through the specification engine.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from enum import Enum
+from itertools import islice
 
 import sys
 import os
@@ -256,26 +257,30 @@ Critical Issues: {sum(1 for ec in self.edge_cases if ec.severity == Severity.CRI
 High Priority Items: {sum(1 for ec in self.edge_cases if ec.severity == Severity.HIGH) + sum(1 for c in self.contradictions if c.severity == Severity.HIGH) + sum(1 for gap in self.completeness_gaps if gap.importance == Severity.HIGH)}
 """
 
-    def get_high_priority_issues(self) -> List[str]:
-        """Get a list of high-priority issues that need immediate attention."""
-        issues = []
+    def get_high_priority_issues(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Get a list of high-priority issues that need immediate attention.
 
+        With a limit, scanning stops as soon as that many issues are found.
+        """
+        return list(islice(self._iter_high_priority_issues(), limit))
+
+    def _iter_high_priority_issues(self) -> Iterator[str]:
+        """Yield high-priority issues in report order."""
         # High/Critical edge cases
         for edge_case in self.edge_cases:
             if edge_case.severity in [Severity.HIGH, Severity.CRITICAL]:
-                issues.append(f"Edge Case: {edge_case.description}")
+                yield f"Edge Case: {edge_case.description}"
 
         # High/Critical contradictions
         for contradiction in self.contradictions:
             if contradiction.severity in [Severity.HIGH, Severity.CRITICAL]:
-                issues.append(f"Contradiction: {contradiction.explanation}")
+                yield f"Contradiction: {contradiction.explanation}"
 
         # High/Critical completeness gaps
         for gap in self.completeness_gaps:
             if gap.importance in [Severity.HIGH, Severity.CRITICAL]:
-                issues.append(f"Missing Requirement: {gap.description}")
-
-        return issues
+                yield f"Missing Requirement: {gap.description}"
 
     def get_compression_savings(self) -> float:
         """Calculate the overall compression savings achieved."""
@@ -7,7 +7,7 @@ all processors in sequence to transform analysis results into refined specificat
 
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import traceback
 
 from .models import (
@@ -31,6 +31,9 @@ class SpecificationEngine:
     intelligence about the original prompt.
     """
 
+    # Seconds a health check result is reused before components are probed again
+    HEALTH_CHECK_TTL = 5.0
+
     def __init__(self, config: Optional[EngineConfig] = None):
         """
         Initialize the specification engine.
@@ -52,6 +55,29 @@ class SpecificationEngine:
         # Processing state
         self._processing_state = {}
 
+        # Last health check result, keyed by its TTL and monotonic time bucket
+        self._health_cache: Optional[Tuple[Tuple[float, int], Dict[str, Any]]] = None
+
+    def apply_config(self, config: Optional[EngineConfig] = None) -> None:
+        """
+        Switch the engine to a new configuration without rebuilding it.
+
+        Processors keep their rule engines and pattern tables, which do not
+        depend on configuration, and only pick up their new config sections.
+
+        Args:
+            config: Engine configuration. If None, uses global configuration.
+        """
+        self.config = config or get_config()
+
+        self.edge_case_detector.config = self.config.edge_case_detector
+        self.requirement_compressor.config = self.config.requirement_compressor
+        self.contradiction_finder.config = self.config.contradiction_finder
+        self.completeness_validator.config = self.config.completeness_validator
+
+        # Health reports configuration, so a cached result is now stale
+        self._health_cache = None
+
     def refine_specification(self, analysis: AnalysisResult, context: Dict[str, Any] = None) -> RefinedSpecification:
         """
         Refine a specification by running all processors.
@@ -403,8 +429,36 @@ class SpecificationEngine:
             "plugins": self.plugin_manager.get_plugin_statistics()
         }
 
-    def health_check(self) -> Dict[str, Any]:
-        """Perform a health check on all engine components."""
+    def health_check(self, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Perform a health check on all engine components.
+
+        Results are cached per instance for up to ``ttl`` seconds, so frequent
+        polling does not re-probe every component. The cached dict is shared
+        between callers and should be treated as read-only.
+
+        Args:
+            ttl: Cache lifetime in seconds. If None, uses HEALTH_CHECK_TTL;
+                zero or less always runs a fresh check.
+
+        Returns:
+            Health report with overall status, per-component status and issues
+        """
+        ttl = self.HEALTH_CHECK_TTL if ttl is None else ttl
+        if ttl <= 0:
+            return self._run_health_check()
+
+        key = (ttl, int(time.monotonic() // ttl))
+        cached = self._health_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        health = self._run_health_check()
+        self._health_cache = (key, health)
+        return health
+
+    def _run_health_check(self) -> Dict[str, Any]:
+        """Probe all engine components and build a fresh health report."""
         health = {
             "status": "healthy",
             "components": {},
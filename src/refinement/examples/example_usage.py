@@ -267,8 +267,7 @@ def example_finding_presentation():
     presenter.present_contradictions(contradictions)
 
     # Export findings
-    presenter.export_to_json("findings_example.json")
-    presenter.export_to_markdown("findings_example.md")
+    presenter.export_all("findings_example.json", "findings_example.md")
 
     print("\nFindings exported to JSON and Markdown formats")
 
@@ -6,11 +6,13 @@ presentation → feedback → iteration cycle, making specification refinement f
 collaborating with a senior architect.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import uuid
 import json
+import os
+import tempfile
 from pathlib import Path
 
 from .models import (
@@ -26,6 +28,15 @@ from .presenters.approval_handler import ApprovalHandler
 from ..engine.models import RefinedSpecification
 
 
+# Append-only log of session summaries kept alongside the session files, one
+# JSON record per line; the last record for a file wins
+SESSION_INDEX_FILE = "index.jsonl"
+
+# The log is compacted to one record per session once it holds this many
+# records per live session
+_INDEX_COMPACT_RATIO = 10
+
+
 class RefinementLoop:
     """
     Main orchestrator for interactive specification refinement.
@@ -124,7 +135,7 @@ class RefinementLoop:
                 changes_applied=changes_applied,
                 timestamp=datetime.now()
             )
-            session.iterations.append(iteration)
+            session.add_iteration(iteration)
 
             # Check for convergence
             if self._check_convergence(session):
@@ -226,7 +237,7 @@ class RefinementLoop:
                 changes_applied += 1
 
             # Record the decision
-            session.user_decisions.append(decision)
+            session.add_decision(decision)
 
         return changes_applied
 
@@ -378,8 +389,8 @@ class RefinementLoop:
         """Save session state to disk for resumability."""
         session_file = self.session_dir / f"{session.session_id}.json"
 
-        with open(session_file, 'w') as f:
-            json.dump(session.to_dict(), f, indent=2, default=str)
+        with open(session_file, 'wb') as f:
+            session.dump(f)
 
     def _load_session(self, session_id: str) -> RefinementSession:
         """Load an existing session from disk."""
@@ -388,29 +399,149 @@ class RefinementLoop:
         if not session_file.exists():
             raise FileNotFoundError(f"Session {session_id} not found")
 
-        with open(session_file, 'r') as f:
+        # Session files are UTF-8; reading bytes lets json detect that rather
+        # than decoding with the locale's encoding
+        with open(session_file, 'rb') as f:
             session_data = json.load(f)
 
         return RefinementSession.from_dict(session_data)
 
     def list_sessions(self) -> List[Dict[str, Any]]:
         """List all available refinement sessions."""
+        return self.list_sessions_from_dir(self.session_dir)
+
+    @staticmethod
+    def list_sessions_from_dir(session_dir: Path) -> List[Dict[str, Any]]:
+        """
+        List the refinement sessions saved in session_dir.
+
+        Needs no presenter, generator or handler, so callers that only list
+        sessions need not build a RefinementLoop. Summaries are kept in an index
+        log in the session directory, keyed by file name with the size and
+        mtime they were read at; only session files that are new or changed
+        since then are parsed again, and only their records are appended.
+        """
+        index, record_count = RefinementLoop._load_session_index(session_dir)
+        updated_index = {}
+        new_records = []
         sessions = []
 
-        for session_file in self.session_dir.glob("*.json"):
+        # scandir yields directory entries whose stat result is cached, so each
+        # session file costs one stat, with no per-file Path construction
+        with os.scandir(session_dir) as dir_entries:
+            session_files = [
+                dir_entry for dir_entry in dir_entries
+                if dir_entry.name.endswith(".json")
+            ]
+
+        for session_file in session_files:
             try:
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
-
-                sessions.append({
-                    "session_id": session_data["session_id"],
-                    "created_at": session_data.get("created_at"),
-                    "is_finalized": session_data.get("is_finalized", False),
-                    "iterations": len(session_data.get("iterations", [])),
-                    "last_modified": session_file.stat().st_mtime
-                })
-
-            except (json.JSONDecodeError, KeyError):
+                stat = session_file.stat()
+            except OSError:
                 continue
 
-        return sorted(sessions, key=lambda x: x["last_modified"], reverse=True)
\ No newline at end of file
+            entry = index.get(session_file.name)
+            if (entry is None
+                    or entry.get("mtime_ns") != stat.st_mtime_ns
+                    or entry.get("size") != stat.st_size):
+                try:
+                    with open(session_file, 'rb') as f:
+                        session_data = json.load(f)
+
+                    summary = {
+                        "session_id": session_data["session_id"],
+                        "created_at": session_data.get("created_at"),
+                        "is_finalized": session_data.get("is_finalized", False),
+                        "iterations": len(session_data.get("iterations", [])),
+                        "last_modified": stat.st_mtime
+                    }
+
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                    continue
+
+                entry = {
+                    "file": session_file.name,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "summary": summary
+                }
+                new_records.append(entry)
+
+            updated_index[session_file.name] = entry
+            sessions.append(entry["summary"])
+
+        # Deleted sessions, or a log grown well past the live session count,
+        # trigger a compacting rewrite; otherwise changes are just appended
+        if (index.keys() - updated_index.keys()
+                or record_count + len(new_records) > _INDEX_COMPACT_RATIO * max(len(updated_index), 1)):
+            RefinementLoop._save_session_index(session_dir, updated_index.values())
+        elif new_records:
+            RefinementLoop._append_session_index(session_dir, new_records)
+
+        return sorted(sessions, key=lambda x: x["last_modified"], reverse=True)
+
+    @staticmethod
+    def _load_session_index(session_dir: Path) -> Tuple[Dict[str, Any], int]:
+        """
+        Replay the session index log.
+
+        Returns the latest record per session file and the number of records
+        read; a missing log is empty, and malformed lines or records without a
+        usable summary are skipped, so their session files are parsed again.
+        """
+        index = {}
+        record_count = 0
+        try:
+            with open(session_dir / SESSION_INDEX_FILE, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not RefinementLoop._is_session_index_record(record):
+                        continue
+                    index[record["file"]] = record
+                    record_count += 1
+        except OSError:
+            return {}, 0
+
+        return index, record_count
+
+    @staticmethod
+    def _is_session_index_record(record: Any) -> bool:
+        """Check that an index record has the fields listing relies on."""
+        if not isinstance(record, dict) or not isinstance(record.get("file"), str):
+            return False
+        summary = record.get("summary")
+        return (isinstance(summary, dict)
+                and isinstance(summary.get("session_id"), str)
+                and isinstance(summary.get("last_modified"), (int, float)))
+
+    @staticmethod
+    def _append_session_index(session_dir: Path, records: List[Dict[str, Any]]):
+        """Append records to the session index log."""
+        try:
+            with open(session_dir / SESSION_INDEX_FILE, 'a') as f:
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+        except OSError:
+            # The index only speeds up listing; it is rebuilt from the session files
+            pass
+
+    @staticmethod
+    def _save_session_index(session_dir: Path, records: Iterable[Dict[str, Any]]):
+        """Rewrite the session index log with the given records, replacing it atomically."""
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile('w', dir=session_dir,
+                                             suffix='.tmp', delete=False) as f:
+                tmp_name = f.name
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+            os.replace(tmp_name, session_dir / SESSION_INDEX_FILE)
+        except OSError:
+            # The index only speeds up listing; it is rebuilt from the session
+            # files. Don't leave the partial rewrite behind in the directory.
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
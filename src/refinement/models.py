@@ -5,11 +5,30 @@ This module defines the core data structures used throughout the refinement proc
 including session management, user feedback, and finalized specifications.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from collections import Counter
+from dataclasses import dataclass, field, fields, MISSING
+from functools import lru_cache
+from datetime import date, datetime, time
+from typing import Dict, List, Optional, Any, Union, Callable, ClassVar, Tuple, BinaryIO, Iterator
 from enum import Enum
 import json
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import yaml
+    try:
+        from yaml import CSafeDumper as _YamlDumper  # libyaml-backed emitter
+    except ImportError:
+        from yaml import SafeDumper as _YamlDumper
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
 
 
 class UserDecisionAction(Enum):
@@ -21,6 +40,135 @@ class UserDecisionAction(Enum):
     CLARIFY = "clarify"
 
 
+# Actions that count towards acceptance rates
+_ACCEPTED_ACTIONS = frozenset({UserDecisionAction.ACCEPT, UserDecisionAction.MODIFY})
+
+# Direct value -> member map, skipping Enum.__call__ validation in from_dict
+_ACTION_LOOKUP = UserDecisionAction._value2member_map_
+
+
+_fromiso = datetime.fromisoformat
+
+# Static skeleton of FinalizedSpecification._to_markdown(), parsed once
+_MD_HEADER_TPL = """# Finalized Specification
+
+**Session ID:** {refinement_session_id}
+**Finalized:** {approval_timestamp:%Y-%m-%d %H:%M:%S}
+**Confidence Score:** {confidence_score:.2%}
+**User Acceptance Rate:** {user_acceptance_rate:.2%}
+
+## Requirements ({n_reqs})
+
+"""
+
+
+def _parse_timestamp(value: Union[str, float]) -> datetime:
+    """Parse a serialized timestamp (ISO string, or epoch seconds)."""
+    if isinstance(value, str):
+        return _fromiso(value)
+    return datetime.fromtimestamp(value)
+
+
+def _dump_fields(obj: Any) -> Dict[str, Any]:
+    """Serialize a model by walking its cached field-name tuple."""
+    converters = obj._FIELD_CONVERTERS
+    data = {}
+    for name in obj._FIELD_NAMES:
+        value = getattr(obj, name)
+        if value is not None and name in converters:
+            value = converters[name](value)
+        data[name] = value
+    return data
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    orjson fallback for RefinementSession.dump.
+
+    Models are expanded one level at a time from their field-name tuple, so
+    orjson encodes the session without a fully materialized to_dict() tree.
+    """
+    names = getattr(type(obj), "_FIELD_NAMES", None)
+    if names is not None:
+        return {name: getattr(obj, name) for name in names}
+    return _dump_foreign(obj)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    json fallback for RefinementSession.dump when orjson is unavailable.
+
+    Encodes the types orjson handles natively the way orjson does, so a
+    session file is the same document whichever encoder wrote it.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    return _orjson_default(obj)
+
+
+def _dump_foreign(obj: Any) -> Any:
+    """
+    Serialize a non-model object via its to_dict(), falling back to str().
+
+    JSON-native values such as a plain dict spec pass through unchanged, as
+    orjson would encode them.
+    """
+    if isinstance(obj, (dict, list, tuple, str, int, float, bool)):
+        return obj
+    # Only the attribute lookup is guarded, so AttributeErrors raised inside
+    # to_dict() itself still propagate
+    try:
+        to_dict = obj.to_dict
+    except AttributeError:
+        return str(obj)
+    return to_dict()
+
+
+def _intern_values(items: List[Dict[str, Any]], keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Intern repeated categorical string values in freshly loaded dicts."""
+    for item in items:
+        for key in keys:
+            value = item.get(key)
+            if isinstance(value, str):
+                item[key] = sys.intern(value)
+    return items
+
+
+@lru_cache(maxsize=None)
+def _field_specs(cls: type) -> Tuple[Tuple[str, bool, Any, Any], ...]:
+    """(name, serialized, default, default_factory) for each dataclass field."""
+    serialized = frozenset(cls._FIELD_NAMES)
+    return tuple(
+        (f.name, f.name in serialized, f.default, f.default_factory)
+        for f in fields(cls)
+    )
+
+
+def _load_fields(cls: type, data: Dict[str, Any]) -> Any:
+    """Build a model from a dict produced by _dump_fields.
+
+    Bypasses __init__ so default factories (e.g. datetime.now) only run for
+    keys that are actually missing from ``data``.
+    """
+    parsers = cls._FIELD_PARSERS
+    obj = object.__new__(cls)
+    for name, serialized, default, default_factory in _field_specs(cls):
+        if serialized and name in data:
+            value = data[name]
+            if value is not None and name in parsers:
+                value = parsers[name](value)
+        elif default is not MISSING:
+            value = default
+        elif default_factory is not MISSING:
+            value = default_factory()
+        else:
+            raise KeyError(name)
+        object.__setattr__(obj, name, value)
+    return obj
+
+
 @dataclass
 class UserDecision:
     """Represents a single user decision on a suggestion."""
@@ -32,28 +180,26 @@ class UserDecision:
     custom_content: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
 
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = (
+        "suggestion_id", "suggestion", "action", "reasoning",
+        "modification", "custom_content", "timestamp"
+    )
+    _FIELD_CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "action": lambda action: action.value,
+        "timestamp": datetime.isoformat
+    }
+    _FIELD_PARSERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "suggestion_id": sys.intern,
+        "action": _ACTION_LOOKUP.__getitem__,
+        "timestamp": _parse_timestamp
+    }
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "suggestion_id": self.suggestion_id,
-            "suggestion": self.suggestion,
-            "action": self.action.value,
-            "reasoning": self.reasoning,
-            "modification": self.modification,
-            "custom_content": self.custom_content,
-            "timestamp": self.timestamp.isoformat()
-        }
+        return _dump_fields(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserDecision':
-        return cls(
-            suggestion_id=data["suggestion_id"],
-            suggestion=data["suggestion"],
-            action=UserDecisionAction(data["action"]),
-            reasoning=data.get("reasoning"),
-            modification=data.get("modification"),
-            custom_content=data.get("custom_content"),
-            timestamp=datetime.fromisoformat(data["timestamp"])
-        )
+        return _load_fields(cls, data)
 
 
 @dataclass
@@ -64,34 +210,31 @@ class UserFeedback:
     additional_comments: Optional[str] = None
     wants_to_continue: bool = True
 
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = (
+        "decisions", "overall_satisfaction", "additional_comments", "wants_to_continue"
+    )
+    _FIELD_CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "decisions": lambda decisions: [d.to_dict() for d in decisions]
+    }
+    _FIELD_PARSERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "decisions": lambda decisions: [UserDecision.from_dict(d) for d in decisions]
+    }
+
     def get_acceptance_rate(self) -> float:
         """Calculate the percentage of accepted/modified suggestions."""
         if not self.decisions:
             return 0.0
 
-        accepted = len([
-            d for d in self.decisions
-            if d.action in [UserDecisionAction.ACCEPT, UserDecisionAction.MODIFY]
-        ])
+        accepted = sum(1 for d in self.decisions if d.action in _ACCEPTED_ACTIONS)
 
         return accepted / len(self.decisions)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "decisions": [d.to_dict() for d in self.decisions],
-            "overall_satisfaction": self.overall_satisfaction,
-            "additional_comments": self.additional_comments,
-            "wants_to_continue": self.wants_to_continue
-        }
+        return _dump_fields(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserFeedback':
-        return cls(
-            decisions=[UserDecision.from_dict(d) for d in data["decisions"]],
-            overall_satisfaction=data.get("overall_satisfaction"),
-            additional_comments=data.get("additional_comments"),
-            wants_to_continue=data.get("wants_to_continue", True)
-        )
+        return _load_fields(cls, data)
 
 
 @dataclass
@@ -104,37 +247,43 @@ class RefinementIteration:
     timestamp: datetime
     duration_seconds: Optional[float] = None
 
+    # Acceptance rate memoized by get_metrics(); feedback is settled once the
+    # iteration has been recorded
+    _acceptance_rate: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = (
+        "iteration_number", "suggestions_presented", "user_feedback",
+        "changes_applied", "timestamp", "duration_seconds"
+    )
+    _FIELD_CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "user_feedback": lambda feedback: feedback.to_dict(),
+        "timestamp": datetime.isoformat
+    }
+    _FIELD_PARSERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "user_feedback": lambda data: UserFeedback.from_dict(data),
+        "timestamp": _parse_timestamp
+    }
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get key metrics for this iteration."""
+        if self._acceptance_rate is None:
+            self._acceptance_rate = self.user_feedback.get_acceptance_rate()
+
         return {
             "iteration": self.iteration_number,
             "suggestions_count": self.suggestions_presented,
-            "acceptance_rate": self.user_feedback.get_acceptance_rate(),
+            "acceptance_rate": self._acceptance_rate,
             "changes_applied": self.changes_applied,
             "user_satisfaction": self.user_feedback.overall_satisfaction,
             "duration": self.duration_seconds
         }
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "iteration_number": self.iteration_number,
-            "suggestions_presented": self.suggestions_presented,
-            "user_feedback": self.user_feedback.to_dict(),
-            "changes_applied": self.changes_applied,
-            "timestamp": self.timestamp.isoformat(),
-            "duration_seconds": self.duration_seconds
-        }
+        return _dump_fields(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RefinementIteration':
-        return cls(
-            iteration_number=data["iteration_number"],
-            suggestions_presented=data["suggestions_presented"],
-            user_feedback=UserFeedback.from_dict(data["user_feedback"]),
-            changes_applied=data["changes_applied"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            duration_seconds=data.get("duration_seconds")
-        )
+        return _load_fields(cls, data)
 
 
 @dataclass
@@ -155,6 +304,64 @@ class RefinementSession:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
 
+    # Running aggregates for get_session_metrics(), maintained by
+    # add_iteration()/add_decision() and rebuilt whenever the lists were
+    # changed behind their back (e.g. after from_dict)
+    _accepted_count: int = field(default=0, init=False, repr=False, compare=False)
+    _total_suggestions: int = field(default=0, init=False, repr=False, compare=False)
+    _total_changes: int = field(default=0, init=False, repr=False, compare=False)
+    _counted_iterations: int = field(default=0, init=False, repr=False, compare=False)
+    _counted_decisions: int = field(default=0, init=False, repr=False, compare=False)
+
+    # original_spec is kept as loaded; reconstructing it properly would
+    # require knowing its actual type
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = (
+        "session_id", "original_spec", "iterations", "user_decisions", "current_state",
+        "is_finalized", "finalized_spec", "created_at", "updated_at"
+    )
+    _FIELD_CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "original_spec": _dump_foreign,
+        "iterations": lambda iterations: [i.to_dict() for i in iterations],
+        "user_decisions": lambda decisions: [d.to_dict() for d in decisions],
+        "finalized_spec": lambda spec: spec.to_dict(),
+        "created_at": datetime.isoformat,
+        "updated_at": datetime.isoformat
+    }
+    _FIELD_PARSERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "iterations": lambda iterations: [RefinementIteration.from_dict(i) for i in iterations],
+        "user_decisions": lambda decisions: [UserDecision.from_dict(d) for d in decisions],
+        "finalized_spec": lambda data: FinalizedSpecification.from_dict(data) if data else None,
+        "created_at": _parse_timestamp,
+        "updated_at": _parse_timestamp
+    }
+
+    def add_iteration(self, iteration: 'RefinementIteration'):
+        """Record a completed iteration and update the running totals."""
+        self._sync_counters()
+        self.iterations.append(iteration)
+        self._total_suggestions += iteration.suggestions_presented
+        self._total_changes += iteration.changes_applied
+        self._counted_iterations += 1
+
+    def add_decision(self, decision: UserDecision):
+        """Record a user decision and update the running totals."""
+        self._sync_counters()
+        self.user_decisions.append(decision)
+        if decision.action in _ACCEPTED_ACTIONS:
+            self._accepted_count += 1
+        self._counted_decisions += 1
+
+    def _sync_counters(self):
+        """Rebuild the running totals if the lists were modified directly."""
+        if self._counted_iterations != len(self.iterations):
+            self._total_suggestions = sum(i.suggestions_presented for i in self.iterations)
+            self._total_changes = sum(i.changes_applied for i in self.iterations)
+            self._counted_iterations = len(self.iterations)
+
+        if self._counted_decisions != len(self.user_decisions):
+            self._accepted_count = sum(1 for d in self.user_decisions if d.action in _ACCEPTED_ACTIONS)
+            self._counted_decisions = len(self.user_decisions)
+
     def get_session_metrics(self) -> Dict[str, Any]:
         """Get comprehensive metrics for the entire session."""
         if not self.iterations:
@@ -165,85 +372,119 @@ class RefinementSession:
                 "is_finalized": self.is_finalized
             }
 
-        total_suggestions = sum(i.suggestions_presented for i in self.iterations)
-        total_accepted = len([
-            d for d in self.user_decisions
-            if d.action in [UserDecisionAction.ACCEPT, UserDecisionAction.MODIFY]
-        ])
-
-        acceptance_rate = total_accepted / len(self.user_decisions) if self.user_decisions else 0.0
+        self._sync_counters()
+        acceptance_rate = self._accepted_count / len(self.user_decisions) if self.user_decisions else 0.0
 
         return {
             "session_id": self.session_id,
             "total_iterations": len(self.iterations),
-            "total_suggestions": total_suggestions,
+            "total_suggestions": self._total_suggestions,
             "total_decisions": len(self.user_decisions),
             "overall_acceptance_rate": acceptance_rate,
-            "total_changes": sum(i.changes_applied for i in self.iterations),
+            "total_changes": self._total_changes,
             "is_finalized": self.is_finalized,
             "confidence_score": self.finalized_spec.confidence_score if self.finalized_spec else None,
             "session_duration": (self.updated_at - self.created_at).total_seconds()
         }
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "session_id": self.session_id,
-            "original_spec": self.original_spec.to_dict() if hasattr(self.original_spec, 'to_dict') else str(self.original_spec),
-            "iterations": [i.to_dict() for i in self.iterations],
-            "user_decisions": [d.to_dict() for d in self.user_decisions],
-            "current_state": self.current_state,
-            "is_finalized": self.is_finalized,
-            "finalized_spec": self.finalized_spec.to_dict() if self.finalized_spec else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
-        }
+        return _dump_fields(self)
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'RefinementSession':
-        # Note: This is a simplified version - in practice you'd need to properly
-        # reconstruct the original_spec based on its actual type
-        session = cls(
-            session_id=data["session_id"],
-            original_spec=data["original_spec"],  # Simplified
-            iterations=[RefinementIteration.from_dict(i) for i in data["iterations"]],
-            user_decisions=[UserDecision.from_dict(d) for d in data["user_decisions"]],
-            current_state=data["current_state"],
-            is_finalized=data["is_finalized"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"])
-        )
+    def dump(self, fp: BinaryIO):
+        """
+        Write the session as compact JSON to a binary file object.
 
-        if data.get("finalized_spec"):
-            session.finalized_spec = FinalizedSpecification.from_dict(data["finalized_spec"])
+        Session files are an internal store that is read back far more often
+        than it is inspected, so they carry no indentation; user-facing exports
+        go through FinalizedSpecification.export_to_format instead. Uses
+        orjson's streaming-friendly encoder when available; otherwise json
+        walks the session the same way and writes the same UTF-8 document.
+        """
+        if ORJSON_AVAILABLE:
+            fp.write(orjson.dumps(
+                self,
+                default=_orjson_default,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            fp.write(json.dumps(
+                self,
+                default=_json_default,
+                separators=(',', ':'),
+                ensure_ascii=False
+            ).encode())
 
-        return session
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RefinementSession':
+        return _load_fields(cls, data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class FinalizedSpecification:
     """
     The final, user-approved specification ready for execution planning.
 
     This represents the end result of the refinement process - a specification
     that has been thoroughly reviewed, refined, and approved by the user.
+
+    Fields are ordered hot-first: the scalars read by get_execution_readiness()
+    come before the bulky requirement/edge case lists. Always construct with
+    keyword arguments. Instances are frozen once created; use
+    dataclasses.replace() to derive an adjusted copy.
     """
+    confidence_score: float  # 0.0 to 1.0
+    user_acceptance_rate: float
+    complete_requirement_set: bool
+    total_iterations: int
+    refinement_session_id: str
+    approval_timestamp: datetime
     requirements: List[Dict[str, Any]]
     resolved_edge_cases: List[Dict[str, Any]]
     resolved_contradictions: List[Dict[str, Any]]
-    complete_requirement_set: bool
-    confidence_score: float  # 0.0 to 1.0
-    approval_timestamp: datetime
-    refinement_session_id: str
-    total_iterations: int
-    user_acceptance_rate: float
     ready_for_dispatch: bool = True
 
     # Optional export metadata
     export_formats: List[str] = field(default_factory=lambda: ["json"])
     tags: List[str] = field(default_factory=list)
 
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = (
+        "requirements", "resolved_edge_cases", "resolved_contradictions",
+        "complete_requirement_set", "confidence_score", "approval_timestamp",
+        "ready_for_dispatch", "refinement_session_id", "total_iterations",
+        "user_acceptance_rate", "export_formats", "tags"
+    )
+    _FIELD_CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "approval_timestamp": datetime.isoformat
+    }
+    _FIELD_PARSERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "requirements": lambda reqs: _intern_values(reqs, ("source", "priority")),
+        "resolved_edge_cases": lambda edge_cases: _intern_values(edge_cases, ("related_requirement",)),
+        "approval_timestamp": _parse_timestamp
+    }
+
+    # format name -> exporter, bound below the class definition
+    _EXPORTERS: ClassVar[Dict[str, Callable[['FinalizedSpecification'], str]]]
+
     def get_execution_readiness(self) -> Dict[str, Any]:
         """Assess readiness for execution planning (Phase 4)."""
+        blockers, recommendations, readiness_score = self._analyze_readiness()
+
+        return {
+            "ready_for_execution": readiness_score >= 0.8 and self.ready_for_dispatch,
+            "readiness_score": readiness_score,
+            "blockers": blockers,
+            "recommendations": recommendations
+        }
+
+    def _analyze_readiness(self) -> Tuple[List[str], List[str], float]:
+        """
+        Compute blockers, recommendations and readiness score together.
+
+        Unresolved contradictions are counted in a single pass and shared by
+        the score and the blocker list.
+        """
+        unresolved = sum(1 for c in self.resolved_contradictions if not c.get("resolved", False))
+
         readiness_score = self.confidence_score
 
         # Penalize if not complete
@@ -255,20 +496,9 @@ class FinalizedSpecification:
             readiness_score *= 0.9
 
         # Penalize if unresolved contradictions
-        if self.resolved_contradictions:
-            unresolved = len([c for c in self.resolved_contradictions if not c.get("resolved", False)])
-            if unresolved > 0:
-                readiness_score *= (1.0 - unresolved * 0.1)
-
-        return {
-            "ready_for_execution": readiness_score >= 0.8 and self.ready_for_dispatch,
-            "readiness_score": readiness_score,
-            "blockers": self._identify_execution_blockers(),
-            "recommendations": self._get_execution_recommendations()
-        }
+        if unresolved > 0:
+            readiness_score *= (1.0 - unresolved * 0.1)
 
-    def _identify_execution_blockers(self) -> List[str]:
-        """Identify any remaining blockers for execution."""
         blockers = []
 
         if not self.complete_requirement_set:
@@ -277,20 +507,12 @@ class FinalizedSpecification:
         if self.confidence_score < 0.6:
             blockers.append("Low confidence score")
 
-        unresolved_contradictions = len([
-            c for c in self.resolved_contradictions
-            if not c.get("resolved", False)
-        ])
-        if unresolved_contradictions > 0:
-            blockers.append(f"{unresolved_contradictions} unresolved contradictions")
+        if unresolved > 0:
+            blockers.append(f"{unresolved} unresolved contradictions")
 
         if self.user_acceptance_rate < 0.5:
             blockers.append("Low user acceptance rate")
 
-        return blockers
-
-    def _get_execution_recommendations(self) -> List[str]:
-        """Get recommendations for execution planning."""
         recommendations = []
 
         if self.confidence_score >= 0.9:
@@ -306,7 +528,15 @@ class FinalizedSpecification:
         if len(self.resolved_edge_cases) > 20:
             recommendations.append("Many edge cases - prioritize robust error handling")
 
-        return recommendations
+        return blockers, recommendations, readiness_score
+
+    def _identify_execution_blockers(self) -> List[str]:
+        """Identify any remaining blockers for execution."""
+        return self._analyze_readiness()[0]
+
+    def _get_execution_recommendations(self) -> List[str]:
+        """Get recommendations for execution planning."""
+        return self._analyze_readiness()[1]
 
     def to_execution_graph(self) -> Dict[str, Any]:
         """
@@ -327,148 +557,165 @@ class FinalizedSpecification:
                 "specification_id": self.refinement_session_id,
                 "finalized_at": self.approval_timestamp.isoformat()
             },
-            "execution_hints": {
-                "priority_requirements": self._identify_priority_requirements(),
-                "risk_areas": self._identify_risk_areas(),
-                "validation_points": self._identify_validation_points()
-            }
+            "execution_hints": self._build_execution_hints()
         }
 
-    def _identify_priority_requirements(self) -> List[Dict[str, Any]]:
-        """Identify high-priority requirements for execution planning."""
-        # This would use more sophisticated logic in practice
-        return [req for req in self.requirements if req.get("priority", "medium") == "high"]
+    def _build_execution_hints(self) -> Dict[str, Any]:
+        """
+        Collect priority requirements, risk areas and validation points.
 
-    def _identify_risk_areas(self) -> List[str]:
-        """Identify areas of higher implementation risk."""
-        risk_areas = []
+        Walks requirements and resolved edge cases once each rather than once
+        per hint category.
+        """
+        priority_requirements = []
+        high_conf_points = []
+        has_recent_changes = False
+
+        for req in self.requirements:
+            # This would use more sophisticated logic in practice
+            if req.get("priority", "medium") == "high":
+                priority_requirements.append(req)
+            # Each high-confidence requirement should be validated
+            if req.get("confidence", 0.5) >= 0.8:
+                high_conf_points.append(f"High-priority: {req.get('content', 'Unknown')}")
+            if req.get("source") in ["refinement_suggestion", "user_custom"]:
+                has_recent_changes = True
+
+        validation_points = []
+        edge_case_counts = Counter()
 
-        # Requirements with many associated edge cases
-        edge_case_counts = {}
         for edge_case in self.resolved_edge_cases:
+            # Each resolved edge case should have validation
+            if edge_case.get("handling"):
+                validation_points.append(f"Edge case: {edge_case.get('description', 'Unknown')}")
             related_req = edge_case.get("related_requirement")
             if related_req:
-                edge_case_counts[related_req] = edge_case_counts.get(related_req, 0) + 1
+                edge_case_counts[related_req] += 1
+
+        validation_points.extend(high_conf_points)
+
+        risk_areas = []
 
-        high_risk_reqs = [req for req, count in edge_case_counts.items() if count >= 3]
+        # Requirements with many associated edge cases
+        # Counted requirement names are non-empty, so an empty join means none qualified
+        high_risk_reqs = ', '.join(req for req, count in edge_case_counts.items() if count >= 3)
         if high_risk_reqs:
-            risk_areas.append(f"Requirements with many edge cases: {', '.join(high_risk_reqs)}")
+            risk_areas.append(f"Requirements with many edge cases: {high_risk_reqs}")
 
         # Recently modified requirements
-        recent_changes = [
-            req for req in self.requirements
-            if req.get("source") in ["refinement_suggestion", "user_custom"]
-        ]
-        if recent_changes:
+        if has_recent_changes:
             risk_areas.append("Recently added/modified requirements need extra validation")
 
-        return risk_areas
-
-    def _identify_validation_points(self) -> List[str]:
-        """Identify key validation points for testing."""
-        validation_points = []
+        return {
+            "priority_requirements": priority_requirements,
+            "risk_areas": risk_areas,
+            "validation_points": validation_points
+        }
 
-        # Each resolved edge case should have validation
-        for edge_case in self.resolved_edge_cases:
-            if edge_case.get("handling"):
-                validation_points.append(f"Edge case: {edge_case.get('description', 'Unknown')}")
+    def _identify_priority_requirements(self) -> List[Dict[str, Any]]:
+        """Identify high-priority requirements for execution planning."""
+        return self._build_execution_hints()["priority_requirements"]
 
-        # Each high-confidence requirement should be validated
-        high_conf_reqs = [
-            req for req in self.requirements
-            if req.get("confidence", 0.5) >= 0.8
-        ]
-        for req in high_conf_reqs:
-            validation_points.append(f"High-priority: {req.get('content', 'Unknown')}")
+    def _identify_risk_areas(self) -> List[str]:
+        """Identify areas of higher implementation risk."""
+        return self._build_execution_hints()["risk_areas"]
 
-        return validation_points
+    def _identify_validation_points(self) -> List[str]:
+        """Identify key validation points for testing."""
+        return self._build_execution_hints()["validation_points"]
 
     def export_to_format(self, format_type: str) -> str:
         """Export the finalized specification to various formats."""
-        if format_type == "json":
-            return json.dumps(self.to_dict(), indent=2, default=str)
-        elif format_type == "markdown":
-            return self._to_markdown()
-        elif format_type == "yaml":
-            import yaml
-            return yaml.dump(self.to_dict(), default_flow_style=False)
-        else:
+        exporter = self._EXPORTERS.get(format_type)
+        if exporter is None:
             raise ValueError(f"Unsupported export format: {format_type}")
+        return exporter(self)
 
-    def _to_markdown(self) -> str:
-        """Export to markdown format for documentation."""
-        md = f"""# Finalized Specification
+    def export_to_format_iter(self, format_type: str) -> Iterator[str]:
+        """
+        Export the finalized specification as a sequence of text chunks.
 
-**Session ID:** {self.refinement_session_id}
-**Finalized:** {self.approval_timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-**Confidence Score:** {self.confidence_score:.2%}
-**User Acceptance Rate:** {self.user_acceptance_rate:.2%}
+        Lets callers write large exports to a file as they are produced. Markdown
+        is generated section by section; JSON and YAML come out as one chunk.
+        Unsupported formats and missing exporters raise before anything is yielded.
+        """
+        if format_type == "markdown":
+            return self._iter_markdown()
+        return iter((self.export_to_format(format_type),))
+
+    def _to_json(self) -> str:
+        """Export to JSON."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(self.to_dict(), indent=2, default=str)
+
+    def _to_yaml(self) -> str:
+        """Export to YAML."""
+        if not YAML_AVAILABLE:
+            raise ImportError("PyYAML not installed. Install with: pip install PyYAML")
+        return yaml.dump(self.to_dict(), Dumper=_YamlDumper, default_flow_style=False)
 
-## Requirements ({len(self.requirements)})
+    def _to_markdown(self) -> str:
+        """Export to markdown format for documentation."""
+        return "".join(self._iter_markdown())
 
-"""
-        for i, req in enumerate(self.requirements, 1):
-            md += f"{i}. {req.get('content', 'No description')}\n"
+    def _iter_markdown(self) -> Iterator[str]:
+        """Generate the markdown export one section at a time."""
+        parts = [_MD_HEADER_TPL.format_map({
+            "refinement_session_id": self.refinement_session_id,
+            "approval_timestamp": self.approval_timestamp,
+            "confidence_score": self.confidence_score,
+            "user_acceptance_rate": self.user_acceptance_rate,
+            "n_reqs": len(self.requirements)
+        })]
+        parts.extend([
+            f"{i}. {req.get('content', 'No description')}\n"
+            for i, req in enumerate(self.requirements, 1)
+        ])
+        yield "".join(parts)
 
-        md += f"\n## Resolved Edge Cases ({len(self.resolved_edge_cases)})\n\n"
+        parts = [f"\n## Resolved Edge Cases ({len(self.resolved_edge_cases)})\n\n"]
         for i, edge_case in enumerate(self.resolved_edge_cases, 1):
-            md += f"{i}. **{edge_case.get('description', 'Unknown')}**\n"
+            parts.append(f"{i}. **{edge_case.get('description', 'Unknown')}**\n")
             if edge_case.get('handling'):
-                md += f"   - *Handling:* {edge_case['handling']}\n"
+                parts.append(f"   - *Handling:* {edge_case['handling']}\n")
+        yield "".join(parts)
 
         if self.resolved_contradictions:
-            md += f"\n## Resolved Contradictions ({len(self.resolved_contradictions)})\n\n"
+            parts = [f"\n## Resolved Contradictions ({len(self.resolved_contradictions)})\n\n"]
             for i, contradiction in enumerate(self.resolved_contradictions, 1):
-                md += f"{i}. {contradiction.get('description', 'Unknown')}\n"
+                parts.append(f"{i}. {contradiction.get('description', 'Unknown')}\n")
                 if contradiction.get('resolution'):
-                    md += f"   - *Resolution:* {contradiction['resolution']}\n"
+                    parts.append(f"   - *Resolution:* {contradiction['resolution']}\n")
+            yield "".join(parts)
 
         readiness = self.get_execution_readiness()
-        md += f"\n## Execution Readiness\n\n"
-        md += f"**Ready for Execution:** {'✅ Yes' if readiness['ready_for_execution'] else '❌ No'}\n"
-        md += f"**Readiness Score:** {readiness['readiness_score']:.2%}\n"
+        parts = [
+            "\n## Execution Readiness\n\n",
+            f"**Ready for Execution:** {'✅ Yes' if readiness['ready_for_execution'] else '❌ No'}\n",
+            f"**Readiness Score:** {readiness['readiness_score']:.2%}\n"
+        ]
 
         if readiness['blockers']:
-            md += f"\n**Blockers:**\n"
-            for blocker in readiness['blockers']:
-                md += f"- {blocker}\n"
+            parts.append("\n**Blockers:**\n")
+            parts.extend([f"- {blocker}\n" for blocker in readiness['blockers']])
 
         if readiness['recommendations']:
-            md += f"\n**Recommendations:**\n"
-            for rec in readiness['recommendations']:
-                md += f"- {rec}\n"
+            parts.append("\n**Recommendations:**\n")
+            parts.extend([f"- {rec}\n" for rec in readiness['recommendations']])
 
-        return md
+        yield "".join(parts)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "requirements": self.requirements,
-            "resolved_edge_cases": self.resolved_edge_cases,
-            "resolved_contradictions": self.resolved_contradictions,
-            "complete_requirement_set": self.complete_requirement_set,
-            "confidence_score": self.confidence_score,
-            "approval_timestamp": self.approval_timestamp.isoformat(),
-            "ready_for_dispatch": self.ready_for_dispatch,
-            "refinement_session_id": self.refinement_session_id,
-            "total_iterations": self.total_iterations,
-            "user_acceptance_rate": self.user_acceptance_rate,
-            "export_formats": self.export_formats,
-            "tags": self.tags
-        }
+        return _dump_fields(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FinalizedSpecification':
-        return cls(
-            requirements=data["requirements"],
-            resolved_edge_cases=data["resolved_edge_cases"],
-            resolved_contradictions=data["resolved_contradictions"],
-            complete_requirement_set=data["complete_requirement_set"],
-            confidence_score=data["confidence_score"],
-            approval_timestamp=datetime.fromisoformat(data["approval_timestamp"]),
-            ready_for_dispatch=data.get("ready_for_dispatch", True),
-            refinement_session_id=data["refinement_session_id"],
-            total_iterations=data["total_iterations"],
-            user_acceptance_rate=data["user_acceptance_rate"],
-            export_formats=data.get("export_formats", ["json"]),
-            tags=data.get("tags", [])
-        )
\ No newline at end of file
+        return _load_fields(cls, data)
+
+
+FinalizedSpecification._EXPORTERS = {
+    "json": FinalizedSpecification._to_json,
+    "markdown": FinalizedSpecification._to_markdown,
+    "yaml": FinalizedSpecification._to_yaml
+}
@@ -6,19 +6,60 @@ modify, or provide custom input for suggestions. It implements a smart, non-anno
 interface that respects user time and preferences.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
-from rich.console import Console
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+import copy
+from pathlib import Path
+import hashlib
+import json
+import os
+import tempfile
+from rich.console import Console, Group
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
-from rich.progress import Progress, TaskID
-import questionary
+# questionary (prompt_toolkit) and rich.table are imported where they are
+# used so non-interactive and auto-accept-only runs never load them
 from datetime import datetime
 
 from ..models import UserFeedback, UserDecision, UserDecisionAction
 
 
+# Suggestion type -> batch group used when batch mode is enabled
+_TYPE_TO_GROUP = {
+    'edge_case_handling': 'edge_cases',
+    'contradiction_resolution': 'contradictions',
+    'completeness_addition': 'completeness',
+    'compression_refinement': 'compression'
+}
+
+# Actions that count towards the quick-exit rejection rate
+_QUICK_EXIT_ACTIONS = frozenset({
+    UserDecisionAction.ACCEPT,
+    UserDecisionAction.REJECT,
+    UserDecisionAction.MODIFY
+})
+
+# Order in which suggestion groups are processed
+_GROUP_ORDER = ("auto_accept", "individual", "edge_cases", "contradictions", "completeness", "compression")
+
+
+def _fresh_table(template):
+    """Copy a cached table template, giving it empty columns and no rows."""
+    table = copy.copy(template)
+    table.columns = [column.copy() for column in template.columns]
+    table.rows = []
+    return table
+
+
+@lru_cache(maxsize=128)
+def _confidence_reason(level: str, confidence: float) -> str:
+    """Reasoning text for smart batch decisions; confidences repeat a lot."""
+    return f"{level} confidence ({confidence:.1%})"
+
+
 class ApprovalHandler:
     """
     Manages the interactive approval process for refinement suggestions.
@@ -28,7 +69,32 @@ class ApprovalHandler:
     and keyboard shortcuts for power users.
     """
 
-    def __init__(self, console: Optional[Console] = None):
+    # Static prompt menus, built once rather than on every prompt
+    # (title, shortcut key, action) for the per-suggestion decision menu
+    _DECISION_OPTIONS = (
+        ("✅ Accept", "a", UserDecisionAction.ACCEPT),
+        ("❌ Reject", "r", UserDecisionAction.REJECT),
+        ("✏️  Modify", "m", UserDecisionAction.MODIFY),
+        ("➕ Add Custom", "c", UserDecisionAction.CUSTOM),
+        ("❓ Need More Info", "i", UserDecisionAction.CLARIFY)
+    )
+
+    # (title, batch action) for the batch menu
+    _BATCH_OPTIONS = (
+        ("🔍 Review individually", "individual"),
+        ("✅ Accept all", "all_accept"),
+        ("❌ Reject all", "all_reject"),
+        ("⚡ Smart batch (high confidence only)", "smart_batch")
+    )
+    # Extra batch option offered for specific groups
+    _GROUP_BATCH_OPTIONS = {
+        "edge_cases": ("🛡️ Accept critical only", "critical_only"),
+        "contradictions": ("⚠️ Accept high-severity only", "high_severity_only")
+    }
+
+    _SATISFACTION_CHOICES = ['1', '2', '3', '4', '5']
+
+    def __init__(self, console: Optional[Console] = None, reconfigure: bool = False):
         self.console = console or Console()
         self.user_preferences = {
             'auto_accept_threshold': 0.9,  # Auto-accept suggestions above this confidence
@@ -36,14 +102,17 @@ class ApprovalHandler:
             'batch_mode': False,
             'detailed_explanations': True
         }
-        self.session_stats = {
-            'total_suggestions': 0,
-            'accepted': 0,
-            'rejected': 0,
-            'modified': 0,
-            'custom': 0,
-            'auto_accepted': 0
-        }
+        self._now = datetime.now  # bound once; used for every decision timestamp
+        self.reconfigure = reconfigure
+        self._prefs_path = self._get_preferences_path()
+        self._prefs_loaded = self._load_preferences()
+        # Decisions made by the user, counted per action
+        self.session_stats: Counter = Counter()
+        self._total_suggestions = 0
+        self._auto_accepted = 0
+        # Running totals behind the quick-exit rejection rate
+        self._processed = 0
+        self._rejected = 0
 
     def process_suggestions(self,
                           suggestions: List[Dict[str, Any]],
@@ -58,7 +127,7 @@ class ApprovalHandler:
         Returns:
             UserFeedback containing all user decisions and overall feedback
         """
-        self.session_stats['total_suggestions'] = len(suggestions)
+        self._total_suggestions = len(suggestions)
 
         if not suggestions:
             self.console.print("✅ [green]No suggestions to review - specification looks good![/green]")
@@ -72,6 +141,16 @@ class ApprovalHandler:
         self.console.print(f"\n🔍 [bold cyan]Reviewing {len(suggestions)} Suggestions[/bold cyan]")
         self.console.print("=" * 50)
 
+        # Nothing to ask when every suggestion clears the auto-accept bar and
+        # nobody is at the terminal
+        if self._is_noninteractive() and self._all_auto_acceptable(suggestions):
+            decisions = list(self._auto_accept_suggestions(suggestions))
+            self._show_session_summary()
+            return UserFeedback(
+                decisions=decisions,
+                additional_comments="All suggestions auto-accepted"
+            )
+
         # Get user preferences for this session
         self._configure_session_preferences()
 
@@ -91,8 +170,52 @@ class ApprovalHandler:
             wants_to_continue=overall_feedback.get('continue', True)
         )
 
+    def _is_noninteractive(self) -> bool:
+        """True when running without a TTY or with SPECIFY_NONINTERACTIVE=1."""
+        return os.getenv("SPECIFY_NONINTERACTIVE") == "1" or not os.isatty(0)
+
+    def _all_auto_acceptable(self, suggestions: List[Dict[str, Any]]) -> bool:
+        """Check whether every suggestion meets the auto-accept threshold."""
+        min_confidence = min((s.get('confidence', 0.0) for s in suggestions), default=1.0)
+        return min_confidence >= self.user_preferences['auto_accept_threshold']
+
+    def _get_preferences_path(self) -> Path:
+        """Location of the saved preferences for the current project."""
+        key = hashlib.blake2b(os.getcwd().encode(), digest_size=8).hexdigest()
+        return Path.home() / ".cache" / "specify" / f"prefs_{key}.json"
+
+    def _load_preferences(self) -> bool:
+        """Load preferences saved by a previous run in this project."""
+        try:
+            saved = json.loads(self._prefs_path.read_text())
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(saved, dict):
+            return False
+
+        self.user_preferences.update(
+            (key, value) for key, value in saved.items() if key in self.user_preferences
+        )
+        return True
+
+    def _save_preferences(self):
+        """Write the current preferences to the cache, replacing it atomically."""
+        try:
+            self._prefs_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=self._prefs_path.parent,
+                                             suffix='.tmp', delete=False) as f:
+                json.dump(self.user_preferences, f)
+            os.replace(f.name, self._prefs_path)
+        except OSError:
+            # The cache is a convenience; failing to write it must not stop the review
+            pass
+
     def _configure_session_preferences(self):
         """Configure user preferences for the current session."""
+        if self._prefs_loaded and not self.reconfigure:
+            return
+
         self.console.print("\n⚙️  [dim]Quick Setup (press Enter for defaults)[/dim]")
 
         # Auto-accept threshold
@@ -113,13 +236,14 @@ class ApprovalHandler:
         )
 
         # Batch mode for many suggestions
-        if len(self.session_stats.get('total_suggestions', 0)) > 10:
+        if self._total_suggestions > 10:
             self.user_preferences['batch_mode'] = Confirm.ask(
                 "Use batch mode for similar suggestions?",
                 default=True
             )
 
         self.console.print()
+        self._save_preferences()
 
     def _process_suggestions_intelligently(self,
                                          suggestions: List[Dict[str, Any]],
@@ -133,8 +257,7 @@ class ApprovalHandler:
         for group_name, group_suggestions in suggestion_groups.items():
             if group_name == "auto_accept":
                 # Auto-accept high-confidence suggestions
-                auto_decisions = self._auto_accept_suggestions(group_suggestions)
-                decisions.extend(auto_decisions)
+                decisions.extend(self._auto_accept_suggestions(group_suggestions))
             elif group_name == "individual":
                 # Process individually
                 individual_decisions = self._process_individual_suggestions(group_suggestions, current_state)
@@ -149,67 +272,52 @@ class ApprovalHandler:
     def _group_suggestions_for_processing(self,
                                         suggestions: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Group suggestions for efficient processing."""
-        groups = {
-            "auto_accept": [],
-            "individual": [],
-            "edge_cases": [],
-            "contradictions": [],
-            "completeness": [],
-            "compression": []
-        }
+        threshold = self.user_preferences['auto_accept_threshold']
+        batch_mode = self.user_preferences['batch_mode']
 
-        for suggestion in suggestions:
-            confidence = suggestion.get('confidence', 0.0)
-            suggestion_type = suggestion.get('type', 'individual')
+        # Groups are created in processing order; empty ones are dropped at the end
+        groups = {name: [] for name in _GROUP_ORDER}
+        add_auto = groups["auto_accept"].append
+        add_individual = groups["individual"].append
 
-            # Auto-accept group
-            if confidence >= self.user_preferences['auto_accept_threshold']:
-                groups["auto_accept"].append(suggestion)
+        if batch_mode:
             # Type-based grouping for batch processing
-            elif self.user_preferences['batch_mode']:
-                if suggestion_type == 'edge_case_handling':
-                    groups["edge_cases"].append(suggestion)
-                elif suggestion_type == 'contradiction_resolution':
-                    groups["contradictions"].append(suggestion)
-                elif suggestion_type == 'completeness_addition':
-                    groups["completeness"].append(suggestion)
-                elif suggestion_type == 'compression_refinement':
-                    groups["compression"].append(suggestion)
+            add_by_type = {
+                suggestion_type: groups[group_name].append
+                for suggestion_type, group_name in _TYPE_TO_GROUP.items()
+            }
+            for suggestion in suggestions:
+                if suggestion.get('confidence', 0.0) >= threshold:
+                    add_auto(suggestion)
                 else:
-                    groups["individual"].append(suggestion)
-            else:
-                groups["individual"].append(suggestion)
+                    add_by_type.get(suggestion.get('type'), add_individual)(suggestion)
+        else:
+            for suggestion in suggestions:
+                if suggestion.get('confidence', 0.0) >= threshold:
+                    add_auto(suggestion)
+                else:
+                    add_individual(suggestion)
 
-        # Remove empty groups
-        return {k: v for k, v in groups.items() if v}
+        return {name: group for name, group in groups.items() if group}
+
+    def _auto_accept_suggestions(self, suggestions: List[Dict[str, Any]]) -> Iterator[UserDecision]:
+        """
+        Auto-accept high-confidence suggestions.
 
-    def _auto_accept_suggestions(self, suggestions: List[Dict[str, Any]]) -> List[UserDecision]:
-        """Auto-accept high-confidence suggestions."""
+        The summary is printed and the stats updated straight away; the
+        decisions themselves are produced lazily as the caller consumes them.
+        """
         if not suggestions:
-            return []
+            return iter(())
 
         self.console.print(f"\n🤖 [green]Auto-accepting {len(suggestions)} high-confidence suggestions[/green]")
-
-        decisions = []
-        for suggestion in suggestions:
-            decision = UserDecision(
-                suggestion_id=suggestion['id'],
-                suggestion=suggestion,
-                action=UserDecisionAction.ACCEPT,
-                reasoning="Auto-accepted due to high confidence",
-                timestamp=datetime.now()
-            )
-            decisions.append(decision)
-            self.session_stats['auto_accepted'] += 1
+        self._auto_accepted += len(suggestions)
 
         # Show summary of auto-accepted suggestions
         if self.user_preferences['detailed_explanations']:
-            table = Table(show_header=True, header_style="bold green")
-            table.add_column("Type", style="cyan")
-            table.add_column("Description", style="white")
-            table.add_column("Confidence", style="green")
+            table = _fresh_table(self._auto_accept_table_template())
 
-            for suggestion in suggestions[:5]:  # Show first 5
+            for suggestion in islice(suggestions, 5):  # Show first 5
                 table.add_row(
                     suggestion.get('type', 'Unknown'),
                     suggestion.get('title', 'No title')[:50] + "...",
@@ -222,7 +330,30 @@ class ApprovalHandler:
             panel = Panel(table, title="Auto-Accepted Suggestions", border_style="green")
             self.console.print(panel)
 
-        return decisions
+        # Batch decisions share a single timestamp
+        now = self._now()
+        return (
+            UserDecision(
+                suggestion_id=suggestion['id'],
+                suggestion=suggestion,
+                action=UserDecisionAction.ACCEPT,
+                reasoning="Auto-accepted due to high confidence",
+                timestamp=now
+            )
+            for suggestion in suggestions
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _auto_accept_table_template():
+        """Build the auto-accept summary table's header once."""
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold green")
+        table.add_column("Type", style="cyan")
+        table.add_column("Description", style="white")
+        table.add_column("Confidence", style="green")
+        return table
 
     def _process_individual_suggestions(self,
                                       suggestions: List[Dict[str, Any]],
@@ -231,8 +362,9 @@ class ApprovalHandler:
         decisions = []
 
         for i, suggestion in enumerate(suggestions, 1):
-            self.console.print(f"\n📋 [bold]Suggestion {i} of {len(suggestions)}[/bold]")
-            self._display_suggestion_details(suggestion)
+            # Header and details go out in a single write
+            header = Text.from_markup(f"\n📋 [bold]Suggestion {i} of {len(suggestions)}[/bold]")
+            self.console.print(Group(header, self._display_suggestion_details(suggestion)))
 
             decision = self._get_user_decision_for_suggestion(suggestion, current_state)
             decisions.append(decision)
@@ -245,10 +377,9 @@ class ApprovalHandler:
                 remaining = len(suggestions) - i
                 if self._offer_quick_exit(remaining):
                     # Apply default action to remaining suggestions
-                    default_decisions = self._apply_default_to_remaining(
+                    decisions.extend(self._apply_default_to_remaining(
                         suggestions[i:], UserDecisionAction.REJECT
-                    )
-                    decisions.extend(default_decisions)
+                    ))
                     break
 
         return decisions
@@ -281,8 +412,10 @@ class ApprovalHandler:
             # Custom batch handling
             return self._handle_custom_batch_decision(batch_action, suggestions, current_state)
 
-    def _display_suggestion_details(self, suggestion: Dict[str, Any]):
-        """Display detailed information about a suggestion."""
+    def _display_suggestion_details(self, suggestion: Dict[str, Any]) -> Panel:
+        """Build the detail panel for a suggestion; the caller prints it."""
+        from rich.table import Table
+
         # Create main information table
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Field", style="cyan", width=15)
@@ -308,57 +441,31 @@ class ApprovalHandler:
         # Add examples if available and requested
         if suggestion.get('examples') and self.user_preferences['show_examples']:
             examples_text = Text("\nExamples:", style="bold")
-            for example in suggestion['examples'][:3]:  # Show max 3 examples
+            for example in islice(suggestion['examples'], 3):  # Show max 3 examples
                 examples_text.append(f"\n• {example}", style="dim")
             panel_content.append(examples_text)
 
-        panel = Panel(
-            *panel_content,
+        return Panel(
+            Group(*panel_content),
             title=f"💡 {suggestion.get('type', 'suggestion').replace('_', ' ').title()}",
             border_style=self._get_suggestion_border_style(suggestion),
             expand=False
         )
 
-        self.console.print(panel)
-
     def _get_user_decision_for_suggestion(self,
                                         suggestion: Dict[str, Any],
                                         current_state: Dict[str, Any]) -> UserDecision:
         """Get user decision for a single suggestion."""
-        # Present choices based on suggestion type
-        choices = [
-            "✅ Accept",
-            "❌ Reject",
-            "✏️  Modify",
-            "➕ Add Custom",
-            "❓ Need More Info"
-        ]
-
-        # Add quick shortcuts
-        shortcuts = {
-            'a': "✅ Accept",
-            'r': "❌ Reject",
-            'm': "✏️  Modify",
-            'c': "➕ Add Custom",
-            'i': "❓ Need More Info"
-        }
+        import questionary
 
-        choice = questionary.select(
+        # Choices carry the action as their value, so the answer is the enum itself.
+        # unsafe_ask lets Ctrl-C propagate instead of returning None.
+        action = questionary.select(
             "What would you like to do?",
-            choices=choices,
+            choices=self._decision_choices(),
+            use_shortcuts=True,
             instruction="(Use arrow keys or shortcuts: a/r/m/c/i)"
-        ).ask()
-
-        # Map choice to action
-        action_map = {
-            "✅ Accept": UserDecisionAction.ACCEPT,
-            "❌ Reject": UserDecisionAction.REJECT,
-            "✏️  Modify": UserDecisionAction.MODIFY,
-            "➕ Add Custom": UserDecisionAction.CUSTOM,
-            "❓ Need More Info": UserDecisionAction.CLARIFY
-        }
-
-        action = action_map[choice]
+        ).unsafe_ask()
 
         # Handle specific actions
         reasoning = None
@@ -395,7 +502,18 @@ class ApprovalHandler:
             reasoning=reasoning,
             modification=modification,
             custom_content=custom_content,
-            timestamp=datetime.now()
+            timestamp=self._now()
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _decision_choices() -> Tuple[Any, ...]:
+        """Build the decision menu's questionary choices once."""
+        import questionary
+
+        return tuple(
+            questionary.Choice(title, value=action, shortcut_key=key)
+            for title, key, action in ApprovalHandler._DECISION_OPTIONS
         )
 
     def _get_modification_details(self, suggestion: Dict[str, Any]) -> Dict[str, Any]:
@@ -492,6 +610,8 @@ class ApprovalHandler:
 
     def _display_batch_summary(self, group_name: str, suggestions: List[Dict[str, Any]]):
         """Display summary of batch suggestions."""
+        from rich.table import Table
+
         # Create summary table
         table = Table(show_header=True, header_style="bold yellow")
         table.add_column("#", width=3)
@@ -499,10 +619,11 @@ class ApprovalHandler:
         table.add_column("Confidence", width=10)
         table.add_column("Impact", width=8)
 
-        for i, suggestion in enumerate(suggestions[:10], 1):  # Show first 10
+        for i, suggestion in enumerate(islice(suggestions, 10), 1):  # Show first 10
+            title = suggestion.get('title', 'No title')
             table.add_row(
                 str(i),
-                suggestion.get('title', 'No title')[:35] + ("..." if len(suggestion.get('title', '')) > 35 else ""),
+                title[:35] + "..." if len(title) > 35 else title,
                 f"{suggestion.get('confidence', 0):.0%}",
                 suggestion.get('impact', 'N/A')
             )
@@ -519,41 +640,35 @@ class ApprovalHandler:
 
     def _get_batch_decision(self, group_name: str, suggestions: List[Dict[str, Any]]) -> str:
         """Get user decision for batch processing."""
-        choices = [
-            "🔍 Review individually",
-            "✅ Accept all",
-            "❌ Reject all",
-            "⚡ Smart batch (high confidence only)"
-        ]
+        import questionary
 
-        # Add group-specific choices
-        if group_name == "edge_cases":
-            choices.append("🛡️ Accept critical only")
-        elif group_name == "contradictions":
-            choices.append("⚠️ Accept high-severity only")
-
-        choice = questionary.select(
+        # Choice values are the batch actions themselves; None means cancelled
+        batch_action = questionary.select(
             f"How would you like to handle these {group_name}?",
-            choices=choices
+            choices=self._batch_choices(group_name)
         ).ask()
 
-        # Map choices to actions
-        choice_map = {
-            "🔍 Review individually": "individual",
-            "✅ Accept all": "all_accept",
-            "❌ Reject all": "all_reject",
-            "⚡ Smart batch (high confidence only)": "smart_batch",
-            "🛡️ Accept critical only": "critical_only",
-            "⚠️ Accept high-severity only": "high_severity_only"
-        }
+        return batch_action or "individual"
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _batch_choices(group_name: str) -> Tuple[Any, ...]:
+        """Build the batch menu's questionary choices once per group."""
+        import questionary
 
-        return choice_map.get(choice, "individual")
+        options = ApprovalHandler._BATCH_OPTIONS
+        group_option = ApprovalHandler._GROUP_BATCH_OPTIONS.get(group_name)
+        if group_option:
+            options = (*options, group_option)
+
+        return tuple(questionary.Choice(title, value=action) for title, action in options)
 
     def _apply_action_to_batch(self,
                              suggestions: List[Dict[str, Any]],
                              action: UserDecisionAction,
                              reasoning: str) -> List[UserDecision]:
         """Apply the same action to all suggestions in batch."""
+        now = self._now()
         decisions = []
 
         for suggestion in suggestions:
@@ -562,10 +677,11 @@ class ApprovalHandler:
                 suggestion=suggestion,
                 action=action,
                 reasoning=reasoning,
-                timestamp=datetime.now()
+                timestamp=now
             )
             decisions.append(decision)
-            self._update_session_stats(action)
+
+        self._add_session_stats({action: len(decisions)})
 
         self.console.print(f"✅ Applied {action.value} to {len(suggestions)} suggestions")
         return decisions
@@ -575,7 +691,9 @@ class ApprovalHandler:
                                     suggestions: List[Dict[str, Any]],
                                     current_state: Dict[str, Any]) -> List[UserDecision]:
         """Handle custom batch decision logic."""
+        now = self._now()
         decisions = []
+        action_counts = Counter()
 
         if batch_action == "smart_batch":
             # Accept high confidence, reject low confidence
@@ -584,20 +702,20 @@ class ApprovalHandler:
                 confidence = suggestion.get('confidence', 0.0)
                 if confidence >= high_conf_threshold:
                     action = UserDecisionAction.ACCEPT
-                    reasoning = f"High confidence ({confidence:.1%})"
+                    reasoning = _confidence_reason("High", confidence)
                 else:
                     action = UserDecisionAction.REJECT
-                    reasoning = f"Low confidence ({confidence:.1%})"
+                    reasoning = _confidence_reason("Low", confidence)
 
                 decision = UserDecision(
                     suggestion_id=suggestion['id'],
                     suggestion=suggestion,
                     action=action,
                     reasoning=reasoning,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 decisions.append(decision)
-                self._update_session_stats(action)
+                action_counts[action] += 1
 
         elif batch_action == "critical_only":
             # Accept only critical/high impact suggestions
@@ -615,27 +733,21 @@ class ApprovalHandler:
                     suggestion=suggestion,
                     action=action,
                     reasoning=reasoning,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 decisions.append(decision)
-                self._update_session_stats(action)
+                action_counts[action] += 1
 
+        self._add_session_stats(action_counts)
         return decisions
 
     def _should_offer_quick_exit(self) -> bool:
         """Determine if we should offer quick exit based on user patterns."""
-        total_processed = (
-            self.session_stats['accepted'] +
-            self.session_stats['rejected'] +
-            self.session_stats['modified']
-        )
-
-        if total_processed < 3:
+        if self._processed < 3:
             return False
 
         # If user is rejecting most suggestions, offer quick exit
-        rejection_rate = self.session_stats['rejected'] / total_processed
-        return rejection_rate > 0.7
+        return self._rejected / self._processed > 0.7
 
     def _offer_quick_exit(self, remaining_count: int) -> bool:
         """Offer user option to quick-exit with default action."""
@@ -650,48 +762,32 @@ class ApprovalHandler:
 
     def _apply_default_to_remaining(self,
                                   suggestions: List[Dict[str, Any]],
-                                  default_action: UserDecisionAction) -> List[UserDecision]:
-        """Apply default action to remaining suggestions."""
-        decisions = []
+                                  default_action: UserDecisionAction) -> Iterator[UserDecision]:
+        """Apply default action to remaining suggestions, yielding decisions lazily."""
+        self._add_session_stats({default_action: len(suggestions)})
 
-        for suggestion in suggestions:
-            decision = UserDecision(
+        now = self._now()
+        return (
+            UserDecision(
                 suggestion_id=suggestion['id'],
                 suggestion=suggestion,
                 action=default_action,
                 reasoning="Applied via quick exit",
-                timestamp=datetime.now()
+                timestamp=now
             )
-            decisions.append(decision)
-            self._update_session_stats(default_action)
-
-        return decisions
+            for suggestion in suggestions
+        )
 
     def _collect_overall_feedback(self) -> Dict[str, Any]:
         """Collect overall feedback from user."""
         self.console.print("\n📝 [bold cyan]Overall Feedback[/bold cyan]")
 
         # Satisfaction rating
-        satisfaction = questionary.select(
-            "How satisfied are you with the suggestions?",
-            choices=[
-                "😍 Very satisfied (5/5)",
-                "😊 Satisfied (4/5)",
-                "😐 Neutral (3/5)",
-                "😕 Unsatisfied (2/5)",
-                "😞 Very unsatisfied (1/5)"
-            ]
-        ).ask()
-
-        satisfaction_map = {
-            "😍 Very satisfied (5/5)": 5,
-            "😊 Satisfied (4/5)": 4,
-            "😐 Neutral (3/5)": 3,
-            "😕 Unsatisfied (2/5)": 2,
-            "😞 Very unsatisfied (1/5)": 1
-        }
-
-        satisfaction_score = satisfaction_map.get(satisfaction, 3)
+        satisfaction_score = IntPrompt.ask(
+            "How satisfied are you with the suggestions? (1 = very unsatisfied, 5 = very satisfied)",
+            default=3,
+            choices=self._SATISFACTION_CHOICES
+        )
 
         # Additional comments
         comments = Prompt.ask(
@@ -721,7 +817,7 @@ class ApprovalHandler:
     def _show_session_summary(self):
         """Show summary of the approval session."""
         stats = self.session_stats
-        total = stats['total_suggestions']
+        total = self._total_suggestions
 
         if total == 0:
             return
@@ -729,17 +825,14 @@ class ApprovalHandler:
         self.console.print("\n📊 [bold cyan]Session Summary[/bold cyan]")
 
         # Create summary table
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Action", style="white")
-        table.add_column("Count", justify="right", style="bright_white")
-        table.add_column("Percentage", justify="right", style="dim")
+        table = _fresh_table(self._summary_table_template())
 
         actions = [
-            ("Accepted", stats['accepted'], "green"),
-            ("Auto-accepted", stats['auto_accepted'], "bright_green"),
-            ("Modified", stats['modified'], "yellow"),
-            ("Rejected", stats['rejected'], "red"),
-            ("Custom", stats['custom'], "magenta")
+            ("Accepted", stats[UserDecisionAction.ACCEPT], "green"),
+            ("Auto-accepted", self._auto_accepted, "bright_green"),
+            ("Modified", stats[UserDecisionAction.MODIFY], "yellow"),
+            ("Rejected", stats[UserDecisionAction.REJECT], "red"),
+            ("Custom", stats[UserDecisionAction.CUSTOM], "magenta")
         ]
 
         for action_name, count, color in actions:
@@ -754,7 +847,7 @@ class ApprovalHandler:
         self.console.print(table)
 
         # Overall acceptance rate
-        accepted_total = stats['accepted'] + stats['auto_accepted'] + stats['modified']
+        accepted_total = stats[UserDecisionAction.ACCEPT] + self._auto_accepted + stats[UserDecisionAction.MODIFY]
         acceptance_rate = (accepted_total / total) * 100
 
         if acceptance_rate >= 70:
@@ -769,16 +862,34 @@ class ApprovalHandler:
 
         self.console.print(f"\n{rate_emoji} [bold {rate_color}]Overall Acceptance Rate: {acceptance_rate:.1f}%[/bold {rate_color}]")
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _summary_table_template():
+        """Build the session summary table's header once."""
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("Action", style="white")
+        table.add_column("Count", justify="right", style="bright_white")
+        table.add_column("Percentage", justify="right", style="dim")
+        return table
+
     def _update_session_stats(self, action: UserDecisionAction):
         """Update session statistics."""
-        if action == UserDecisionAction.ACCEPT:
-            self.session_stats['accepted'] += 1
-        elif action == UserDecisionAction.REJECT:
-            self.session_stats['rejected'] += 1
-        elif action == UserDecisionAction.MODIFY:
-            self.session_stats['modified'] += 1
-        elif action == UserDecisionAction.CUSTOM:
-            self.session_stats['custom'] += 1
+        self.session_stats[action] += 1
+        if action in _QUICK_EXIT_ACTIONS:
+            self._processed += 1
+            if action is UserDecisionAction.REJECT:
+                self._rejected += 1
+
+    def _add_session_stats(self, action_counts: Dict[UserDecisionAction, int]):
+        """Fold per-action decision counts into the session statistics at once."""
+        self.session_stats.update(action_counts)
+        for action, count in action_counts.items():
+            if action in _QUICK_EXIT_ACTIONS:
+                self._processed += count
+                if action is UserDecisionAction.REJECT:
+                    self._rejected += count
 
     def _get_suggestion_border_style(self, suggestion: Dict[str, Any]) -> str:
         """Get border style based on suggestion properties."""
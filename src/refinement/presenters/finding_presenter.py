@@ -5,15 +5,153 @@ This module handles the user-facing presentation of edge cases, contradictions,
 completeness gaps, and compressed requirements in a clear, actionable format.
 """
 
-from typing import List, Dict, Any, Optional
-from rich.console import Console
-from rich.table import Table
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from rich.console import Console, Group
+from rich.table import Table, Column
 from rich.panel import Panel
 from rich.text import Text
-from rich.syntax import Syntax
 from rich.tree import Tree
-from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
 import json
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Interned priority names; priorities read from findings are interned too so
+# grouping lookups can match on identity
+_HI, _MED, _LO = sys.intern('high'), sys.intern('medium'), sys.intern('low')
+
+_PRIORITY_COLORS = {
+    _HI: 'red',
+    _MED: 'yellow',
+    _LO: 'green'
+}
+
+_SEVERITY_COLORS = {
+    'critical': 'bright_red',
+    'high': 'red',
+    'medium': 'yellow',
+    'low': 'green'
+}
+
+# Rank of the recognised priorities, highest first
+_PRIORITY_ORDER = {
+    'high': 1,
+    'medium': 2,
+    'low': 3
+}
+
+# Pre-styled cells for the summary tables, so no markup is parsed per row
+_PRIORITY_TEXT = {p: Text.assemble((p.title(), color)) for p, color in _PRIORITY_COLORS.items()}
+
+# (status, priority) badges for a category with no, a few, or many findings
+_CLEAN_BADGES = (Text.assemble(("✓ Clean", "green")), Text.assemble(("None", "dim")))
+_MINOR_BADGES = (Text.assemble(("⚠ Minor", "yellow")), Text.assemble(("Review", "yellow")))
+_MAJOR_BADGES = (Text.assemble(("⚠ Major", "red")), Text.assemble(("Action Needed", "red")))
+
+# (score, color, label) health badges from best to worst
+_HEALTH_LEVELS = (
+    (100, "green", "Excellent"),
+    (85, "yellow", "Good"),
+    (70, "orange1", "Fair"),
+    (50, "red", "Needs Work")
+)
+_HEALTH_TEXT = tuple(
+    (color, Text(f"{score}/100 - {label}", style=f"bold {color}"))
+    for score, color, label in _HEALTH_LEVELS
+)
+
+
+# Column schema shared by every contradiction table; copied per table because
+# rich columns hold their cells
+_CONTRADICTION_COLUMNS = (
+    Column("Aspect", style="cyan", width=15),
+    Column("Details", style="white")
+)
+
+# Markdown report templates. Optional lines are rendered separately and
+# substituted in, empty when the field is missing.
+_EDGE_TMPL = (
+    "### {i}. {description}\n\n"
+    "{context}{impact}"
+    "**Priority:** {priority}\n\n"
+    "{status}"
+)
+_CONTRA_TMPL = (
+    "### {i}. {description}\n\n"
+    "{conflicting}"
+    "**Severity:** {severity}\n\n"
+    "{impact}{status}"
+)
+_GAP_TMPL = "- **{description}**\n{suggestion}\n"
+_COMP_TMPL = (
+    "### Compression {i}\n\n"
+    "**Original Requirements:**\n{originals}"
+    "\n**Compressed To:**\n{compressed}\n\n"
+    "{confidence}"
+)
+
+_MD_CONTEXT = "**Context:** {}\n\n"
+_MD_IMPACT = "**Impact:** {}\n\n"
+_MD_HANDLED = "**Status:** ✅ Handled\n**Handling:** {}\n\n"
+_MD_NOT_HANDLED = "**Status:** ⚠️ Not handled\n\n"
+_MD_CONFLICTING = "**Conflicting Requirements:**\n{}\n"
+_MD_RESOLVED = "**Status:** ✅ Resolved\n"
+_MD_RESOLUTION = "**Resolution:** {}\n\n"
+_MD_UNRESOLVED = "**Status:** ⚠️ Unresolved\n\n"
+_MD_SUGGESTION = "  - *Suggestion:* {}\n"
+_MD_CONFIDENCE = "**Confidence:** {:.1%}\n\n"
+_MD_LIST_ITEM = "- {}\n".format
+
+
+def _intern_priority(priority: Any) -> Any:
+    """Intern a priority string read from a finding; other values pass through."""
+    return sys.intern(priority) if type(priority) is str else priority
+
+
+def _edge_case_row(case: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Pull the displayed fields out of an edge case once.
+
+    Returns (description, context, impact, priority, handled, handling); the
+    screen and markdown renderers both work from these rows.
+    """
+    get = case.get
+    return (
+        get('description', 'Unknown edge case'),
+        get('context'),
+        get('impact'),
+        _intern_priority(get('priority', _MED)),
+        get('handled'),
+        get('handling')
+    )
+
+
+# Contradiction fields and their defaults, unpacked column-wise
+_CONTRADICTION_FIELDS = {
+    'description': 'Unknown contradiction',
+    'conflicting_requirements': None,
+    'severity': 'medium',
+    'impact': None,
+    'resolved': None,
+    'resolution': None
+}
+
+
+def _unpack_findings(records: List[Dict[str, Any]], fields: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Unpack a list of finding dicts into one list per field.
+
+    fields maps each key to its default; renderers then index the columns
+    instead of calling .get() on every record.
+    """
+    return {key: [record.get(key, default) for record in records] for key, default in fields.items()}
 
 
 class FindingPresenter:
@@ -24,9 +162,13 @@ class FindingPresenter:
     Supports multiple output formats and export options.
     """
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, batch_output: bool = False):
         self.console = console or Console()
         self.export_data = {}  # Store data for potential export
+        self._export_cache = {}  # Derived structures reused by the exporters; never serialized
+        self._batch_mode = batch_output  # Write multi-print views to the terminal in one go
+        # Redirected output (files, CI logs) gets plain text instead of rich layouts
+        self._plain = not self.console.is_terminal
 
     def present_edge_cases(self, edge_cases: List[Dict[str, Any]]):
         """Present edge cases in a readable, actionable format."""
@@ -34,51 +176,83 @@ class FindingPresenter:
             self.console.print("✅ [green]No edge cases identified[/green]")
             return
 
-        self.console.print(f"\n🔍 [bold yellow]Edge Cases Identified ({len(edge_cases)})[/bold yellow]")
+        # Extract the displayed fields once; the markdown export reuses the rows
+        rows = [_edge_case_row(case) for case in edge_cases]
 
         # Group edge cases by severity/priority
-        grouped_cases = self._group_edge_cases_by_priority(edge_cases)
+        grouped_cases = self._group_edge_cases_by_priority(rows)
+
+        if self._plain:
+            self._write_plain_edge_cases(len(edge_cases), grouped_cases)
+        else:
+            self._print_edge_case_panels(len(edge_cases), grouped_cases)
+
+        # Store for export
+        self.export_data['edge_cases'] = {
+            'total': len(edge_cases),
+            'by_priority': {p: len(cases) for p, cases in grouped_cases.items()},
+            'details': edge_cases
+        }
+        self._export_cache['edge_cases'] = rows
+
+    def _print_edge_case_panels(self, total: int, grouped_cases: Dict[str, List[Tuple[Any, ...]]]):
+        """Render grouped edge case rows as one panel per priority."""
+        # The whole section is rendered in a single print
+        output = [f"\n🔍 [bold yellow]Edge Cases Identified ({total})[/bold yellow]"]
 
         for priority, cases in grouped_cases.items():
             if not cases:
                 continue
 
-            priority_color = self._get_priority_color(priority)
+            priority_color = _PRIORITY_COLORS.get(priority, 'white')
 
             panel_content = []
-            for i, case in enumerate(cases, 1):
-                case_text = f"[bold]{i}. {case.get('description', 'Unknown edge case')}[/bold]\n"
+            for i, (description, context, impact, _, handled, handling) in enumerate(cases, 1):
+                case_text = f"[bold]{i}. {description}[/bold]\n"
 
                 # Add context if available
-                if case.get('context'):
-                    case_text += f"   [dim]Context:[/dim] {case['context']}\n"
+                if context:
+                    case_text += f"   [dim]Context:[/dim] {context}\n"
 
                 # Add impact assessment
-                if case.get('impact'):
-                    case_text += f"   [dim]Impact:[/dim] {case['impact']}\n"
+                if impact:
+                    case_text += f"   [dim]Impact:[/dim] {impact}\n"
 
                 # Add current handling status
-                if case.get('handled'):
-                    case_text += f"   [green]✓ Handling defined:[/green] {case.get('handling', 'None')}\n"
+                if handled:
+                    case_text += f"   [green]✓ Handling defined:[/green] {handling}\n"
                 else:
                     case_text += f"   [red]⚠ No handling defined[/red]\n"
 
                 panel_content.append(case_text)
 
-            panel = Panel(
+            output.append(Panel(
                 "\n".join(panel_content),
                 title=f"{priority.title()} Priority Edge Cases ({len(cases)})",
                 border_style=priority_color,
                 expand=False
-            )
-            self.console.print(panel)
+            ))
 
-        # Store for export
-        self.export_data['edge_cases'] = {
-            'total': len(edge_cases),
-            'by_priority': {p: len(cases) for p, cases in grouped_cases.items()},
-            'details': edge_cases
-        }
+        self.console.print(Group(*output))
+
+    def _write_plain_edge_cases(self, total: int, grouped_cases: Dict[str, List[Tuple[Any, ...]]]):
+        """Write grouped edge case rows as plain text."""
+        lines = [f"\nEdge Cases Identified ({total})"]
+
+        for priority, cases in grouped_cases.items():
+            if not cases:
+                continue
+
+            lines.append(f"\n{priority.title()} Priority Edge Cases ({len(cases)})")
+            for i, (description, context, impact, _, handled, handling) in enumerate(cases, 1):
+                lines.append(f"  {i}. {description}")
+                if context:
+                    lines.append(f"     Context: {context}")
+                if impact:
+                    lines.append(f"     Impact: {impact}")
+                lines.append(f"     ✓ Handling defined: {handling}" if handled else "     ⚠ No handling defined")
+
+        self._write_plain(lines)
 
     def present_contradictions(self, contradictions: List[Dict[str, Any]]):
         """Present contradictions with clear explanations."""
@@ -86,54 +260,79 @@ class FindingPresenter:
             self.console.print("✅ [green]No contradictions found[/green]")
             return
 
-        self.console.print(f"\n⚠️  [bold red]Contradictions Found ({len(contradictions)})[/bold red]")
+        # The whole section is rendered in a single print
+        output = [f"\n⚠️  [bold red]Contradictions Found ({len(contradictions)})[/bold red]"]
+        lines = [f"\nContradictions Found ({len(contradictions)})"]
+
+        # Unpack once; the markdown export reuses the columns
+        columns = _unpack_findings(contradictions, _CONTRADICTION_FIELDS)
+        resolved_flags = columns['resolved']
+        resolved_count = sum(1 for resolved in resolved_flags if resolved)
+
+        rows = zip(
+            columns['description'],
+            columns['conflicting_requirements'],
+            columns['severity'],
+            columns['impact'],
+            resolved_flags,
+            columns['resolution']
+        )
+        for i, (description, conflicting, severity, impact, resolved, resolution) in enumerate(rows, 1):
+            if self._plain:
+                self._plain_contradiction_lines(
+                    i, description, conflicting, severity, impact, resolved, resolution, lines
+                )
+                continue
 
-        for i, contradiction in enumerate(contradictions, 1):
             # Create a table for each contradiction
-            table = Table(show_header=True, header_style="bold red")
-            table.add_column("Aspect", style="cyan", width=15)
-            table.add_column("Details", style="white")
+            table = Table(
+                *[column.copy() for column in _CONTRADICTION_COLUMNS],
+                show_header=True,
+                header_style="bold red"
+            )
 
-            table.add_row("Description", contradiction.get('description', 'Unknown contradiction'))
+            table.add_row("Description", description)
 
             # Show conflicting requirements
-            if contradiction.get('conflicting_requirements'):
-                req_text = "\n".join([
-                    f"• {req}" for req in contradiction['conflicting_requirements']
-                ])
+            if conflicting:
+                req_text = "\n".join([f"• {req}" for req in conflicting])
                 table.add_row("Conflicting Requirements", req_text)
 
             # Show severity and impact
-            severity = contradiction.get('severity', 'medium')
-            severity_color = self._get_severity_color(severity)
+            severity_color = _SEVERITY_COLORS.get(severity, 'white')
             table.add_row("Severity", f"[{severity_color}]{severity.title()}[/{severity_color}]")
 
-            if contradiction.get('impact'):
-                table.add_row("Impact", contradiction['impact'])
+            if impact:
+                table.add_row("Impact", impact)
 
             # Show resolution status
-            if contradiction.get('resolved'):
+            if resolved:
                 table.add_row("Status", f"[green]✓ Resolved[/green]")
-                if contradiction.get('resolution'):
-                    table.add_row("Resolution", contradiction['resolution'])
+                if resolution:
+                    table.add_row("Resolution", resolution)
             else:
                 table.add_row("Status", f"[red]⚠ Unresolved[/red]")
 
-            panel = Panel(
+            output.append(Panel(
                 table,
                 title=f"Contradiction {i}",
                 border_style="red",
                 expand=False
-            )
-            self.console.print(panel)
+            ))
+
+        if self._plain:
+            self._write_plain(lines)
+        else:
+            self.console.print(Group(*output))
 
         # Store for export
         self.export_data['contradictions'] = {
             'total': len(contradictions),
-            'resolved': len([c for c in contradictions if c.get('resolved', False)]),
-            'unresolved': len([c for c in contradictions if not c.get('resolved', False)]),
+            'resolved': resolved_count,
+            'unresolved': len(contradictions) - resolved_count,
             'details': contradictions
         }
+        self._export_cache['contradictions'] = columns
 
     def present_completeness_gaps(self, gaps: List[Dict[str, Any]]):
         """Present completeness gaps with priority."""
@@ -141,66 +340,92 @@ class FindingPresenter:
             self.console.print("✅ [green]No completeness gaps identified[/green]")
             return
 
-        self.console.print(f"\n📋 [bold blue]Completeness Gaps ({len(gaps)})[/bold blue]")
+        # Bucket gaps by priority instead of sorting them
+        groups = self._group_by_priority(gaps)
 
-        # Sort gaps by priority
-        sorted_gaps = sorted(gaps, key=lambda x: self._get_priority_order(x.get('priority', 'medium')))
+        # Unrecognised priorities are shown between medium and low
+        other_priorities = [p for p in groups if p not in _PRIORITY_ORDER]
+        display_order = (_HI, _MED, *other_priorities, _LO)
 
-        # Create a tree structure for better visualization
-        tree = Tree("🔍 [bold]Missing Requirements[/bold]")
+        if self._plain:
+            self._write_plain_gaps(len(gaps), groups, display_order)
+        else:
+            self._print_gap_tree(len(gaps), groups, display_order)
 
-        current_priority = None
-        priority_node = None
+        # Store for export
+        self.export_data['completeness_gaps'] = {
+            'total': len(gaps),
+            'by_priority': {priority: len(group) for priority, group in groups.items() if group},
+            'details': gaps
+        }
+        self._export_cache['completeness_gaps'] = groups
+
+    def _print_gap_tree(self,
+                        total_gaps: int,
+                        groups: Dict[str, List[Dict[str, Any]]],
+                        display_order: Tuple[str, ...]):
+        """Render grouped gaps as a priority tree followed by a summary table."""
+        header = f"\n📋 [bold blue]Completeness Gaps ({total_gaps})[/bold blue]"
 
-        for gap in sorted_gaps:
-            gap_priority = gap.get('priority', 'medium')
+        # Create a tree structure for better visualization
+        tree = Tree("🔍 [bold]Missing Requirements[/bold]")
 
-            # Create new priority node if needed
-            if gap_priority != current_priority:
-                current_priority = gap_priority
-                priority_color = self._get_priority_color(gap_priority)
-                priority_node = tree.add(f"[{priority_color}]{gap_priority.title()} Priority[/{priority_color}]")
+        for gap_priority in display_order:
+            priority_gaps = groups[gap_priority]
+            if not priority_gaps:
+                continue
 
-            # Add gap to current priority node
-            gap_text = gap.get('description', 'Unknown gap')
-            if gap.get('suggested_requirement'):
-                gap_text += f"\n[dim]Suggestion:[/dim] {gap['suggested_requirement']}"
+            priority_color = _PRIORITY_COLORS.get(gap_priority, 'white')
+            priority_node = tree.add(f"[{priority_color}]{gap_priority.title()} Priority[/{priority_color}]")
 
-            priority_node.add(gap_text)
+            for gap in priority_gaps:
+                gap_text = gap.get('description', 'Unknown gap')
+                suggestion = gap.get('suggested_requirement')
+                if suggestion:
+                    gap_text += f"\n[dim]Suggestion:[/dim] {suggestion}"
 
-        self.console.print(tree)
+                priority_node.add(gap_text)
 
         # Show summary statistics
-        priority_counts = {}
-        for gap in gaps:
-            priority = gap.get('priority', 'medium')
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
-
         summary_table = Table(show_header=True, header_style="bold blue")
         summary_table.add_column("Priority", style="cyan")
         summary_table.add_column("Count", justify="right", style="white")
         summary_table.add_column("Percentage", justify="right", style="dim")
 
-        total_gaps = len(gaps)
-        for priority in ['high', 'medium', 'low']:
-            count = priority_counts.get(priority, 0)
+        for priority, priority_text in _PRIORITY_TEXT.items():
+            count = len(groups[priority])
             percentage = (count / total_gaps * 100) if total_gaps > 0 else 0
-            priority_color = self._get_priority_color(priority)
 
-            summary_table.add_row(
-                f"[{priority_color}]{priority.title()}[/{priority_color}]",
-                str(count),
-                f"{percentage:.1f}%"
-            )
+            summary_table.add_row(priority_text, str(count), f"{percentage:.1f}%")
 
-        self.console.print("\n", summary_table)
+        # Header, tree and summary go out in a single print
+        self.console.print(Group(header, tree, "\n", summary_table))
 
-        # Store for export
-        self.export_data['completeness_gaps'] = {
-            'total': len(gaps),
-            'by_priority': priority_counts,
-            'details': gaps
-        }
+    def _write_plain_gaps(self,
+                          total_gaps: int,
+                          groups: Dict[str, List[Dict[str, Any]]],
+                          display_order: Tuple[str, ...]):
+        """Write grouped gaps and their priority breakdown as plain text."""
+        lines = [f"\nCompleteness Gaps ({total_gaps})", "Missing Requirements"]
+
+        for gap_priority in display_order:
+            priority_gaps = groups[gap_priority]
+            if not priority_gaps:
+                continue
+
+            lines.append(f"  {gap_priority.title()} Priority")
+            for gap in priority_gaps:
+                lines.append(f"    - {gap.get('description', 'Unknown gap')}")
+                suggestion = gap.get('suggested_requirement')
+                if suggestion:
+                    lines.append(f"      Suggestion: {suggestion}")
+
+        lines.append("")
+        for priority in _PRIORITY_COLORS:
+            count = len(groups[priority])
+            lines.append(f"{priority.title()}: {count} ({count / total_gaps * 100:.1f}%)")
+
+        self._write_plain(lines)
 
     def present_compressed_requirements(self, compressed: List[Dict[str, Any]]):
         """Show compressed requirements with before/after comparison."""
@@ -208,55 +433,91 @@ class FindingPresenter:
             self.console.print("✅ [green]No requirements compressed[/green]")
             return
 
-        self.console.print(f"\n🗜️  [bold magenta]Compressed Requirements ({len(compressed)})[/bold magenta]")
+        header = f"\n🗜️  [bold magenta]Compressed Requirements ({len(compressed)})[/bold magenta]"
+        lines = [f"\nCompressed Requirements ({len(compressed)})"]
 
-        for i, compression in enumerate(compressed, 1):
-            # Create side-by-side comparison
-            table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("Original", style="dim", width=40)
-            table.add_column("Compressed", style="bright_white", width=40)
-            table.add_column("Savings", style="green", width=10)
+        # One comparison table for every compression, one row each
+        # Text columns share the free width; the numeric ones never truncate
+        table = Table(show_header=True, header_style="bold magenta", show_lines=True, expand=True)
+        table.add_column("Original", style="dim", ratio=1)
+        table.add_column("Compressed", style="bright_white", ratio=1)
+        table.add_column("Savings", style="green", no_wrap=True, min_width=len("Savings"))
+        table.add_column("Confidence", style="dim", no_wrap=True, min_width=len("Confidence"))
 
+        # Average savings are accumulated while the comparisons are built
+        total_savings = 0.0
+        valid_compressions = 0
+
+        for i, compression in enumerate(compressed, 1):
             original = compression.get('original_requirements', [])
             compressed_req = compression.get('compressed_requirement', '')
 
             # Calculate compression ratio
             original_length = sum(len(req.get('content', '')) for req in original)
             compressed_length = len(compressed_req)
-            savings = f"{(1 - compressed_length/original_length)*100:.1f}%" if original_length > 0 else "N/A"
+            if original_length > 0:
+                savings_pct = (1 - compressed_length/original_length) * 100
+                total_savings += savings_pct
+                valid_compressions += 1
+                savings = f"{savings_pct:.1f}%"
+            else:
+                savings = "N/A"
+
+            confidence = compression.get('confidence')
+
+            if self._plain:
+                lines.append(f"\nCompression {i}")
+                lines.extend(f"  • {req.get('content', 'Unknown')}" for req in original)
+                lines.append(f"  -> {compressed_req}")
+                lines.append(f"  Savings: {savings}")
+                if confidence:
+                    lines.append(f"  Confidence: {confidence:.1%}")
+                continue
 
             # Format original requirements
             original_text = "\n".join([
                 f"• {req.get('content', 'Unknown')}" for req in original
             ])
 
-            table.add_row(original_text, compressed_req, savings)
-
-            # Add confidence and quality metrics
-            if compression.get('confidence'):
-                table.add_row(
-                    "",
-                    f"[dim]Confidence: {compression['confidence']:.1%}[/dim]",
-                    ""
-                )
-
-            panel = Panel(
-                table,
-                title=f"Compression {i}",
-                border_style="magenta",
-                expand=False
+            table.add_row(
+                original_text,
+                compressed_req,
+                savings,
+                f"{confidence:.1%}" if confidence else ""
             )
-            self.console.print(panel)
+
+        if self._plain:
+            self._write_plain(lines)
+        else:
+            # The whole section is rendered in a single print
+            self.console.print(Group(header, Panel(table, border_style="magenta", expand=False)))
 
         # Store for export
         self.export_data['compressed_requirements'] = {
             'total': len(compressed),
-            'average_savings': self._calculate_average_compression_savings(compressed),
+            'average_savings': total_savings / valid_compressions if valid_compressions > 0 else 0.0,
             'details': compressed
         }
 
     def present_summary(self, analysis_results: Dict[str, Any]):
         """Present an overall summary of all findings."""
+        with self._batched_output():
+            self._render_summary(analysis_results)
+
+    def _render_summary(self, analysis_results: Dict[str, Any]):
+        """Print the summary table and health score."""
+        # Add rows for each category
+        categories = [
+            ("Edge Cases", len(analysis_results.get('edge_cases', []))),
+            ("Contradictions", len(analysis_results.get('contradictions', []))),
+            ("Completeness Gaps", len(analysis_results.get('completeness_gaps', []))),
+            ("Compressed Requirements", len(analysis_results.get('compressed_requirements', [])))
+        ]
+
+        if self._plain:
+            self._write_plain_summary(categories)
+            return
+
         self.console.print("\n" + "="*60)
         self.console.print("[bold cyan]📊 ANALYSIS SUMMARY[/bold cyan]")
         self.console.print("="*60)
@@ -268,24 +529,13 @@ class FindingPresenter:
         summary_table.add_column("Status", style="green", width=15)
         summary_table.add_column("Priority", style="yellow", width=15)
 
-        # Add rows for each category
-        categories = [
-            ("Edge Cases", len(analysis_results.get('edge_cases', []))),
-            ("Contradictions", len(analysis_results.get('contradictions', []))),
-            ("Completeness Gaps", len(analysis_results.get('completeness_gaps', []))),
-            ("Compressed Requirements", len(analysis_results.get('compressed_requirements', [])))
-        ]
-
         for category, count in categories:
             if count == 0:
-                status = "[green]✓ Clean[/green]"
-                priority = "[dim]None[/dim]"
+                status, priority = _CLEAN_BADGES
             elif count <= 3:
-                status = "[yellow]⚠ Minor[/yellow]"
-                priority = "[yellow]Review[/yellow]"
+                status, priority = _MINOR_BADGES
             else:
-                status = "[red]⚠ Major[/red]"
-                priority = "[red]Action Needed[/red]"
+                status, priority = _MAJOR_BADGES
 
             summary_table.add_row(category, str(count), status, priority)
 
@@ -294,35 +544,116 @@ class FindingPresenter:
         # Overall health score
         total_issues = sum(count for _, count in categories)
         if total_issues == 0:
-            health_score = 100
-            health_color = "green"
-            health_status = "Excellent"
+            health_color, health_text = _HEALTH_TEXT[0]
         elif total_issues <= 5:
-            health_score = 85
-            health_color = "yellow"
-            health_status = "Good"
+            health_color, health_text = _HEALTH_TEXT[1]
         elif total_issues <= 15:
-            health_score = 70
-            health_color = "orange"
-            health_status = "Fair"
+            health_color, health_text = _HEALTH_TEXT[2]
         else:
-            health_score = 50
-            health_color = "red"
-            health_status = "Needs Work"
+            health_color, health_text = _HEALTH_TEXT[3]
 
         health_panel = Panel(
-            f"[bold {health_color}]{health_score}/100 - {health_status}[/bold {health_color}]\n"
-            f"[dim]Total issues to address: {total_issues}[/dim]",
+            Group(health_text, Text(f"Total issues to address: {total_issues}", style="dim")),
             title="📈 Specification Health Score",
             border_style=health_color,
             expand=False
         )
         self.console.print("\n", health_panel)
 
+    def _write_plain_summary(self, categories: List[Tuple[str, int]]):
+        """Write the category counts and health score as plain text."""
+        lines = ["\n" + "="*60, "ANALYSIS SUMMARY", "="*60]
+
+        for category, count in categories:
+            if count == 0:
+                status, priority = _CLEAN_BADGES
+            elif count <= 3:
+                status, priority = _MINOR_BADGES
+            else:
+                status, priority = _MAJOR_BADGES
+
+            lines.append(f"{category}: {count} - {status.plain} ({priority.plain})")
+
+        total_issues = sum(count for _, count in categories)
+        if total_issues == 0:
+            _, health_text = _HEALTH_TEXT[0]
+        elif total_issues <= 5:
+            _, health_text = _HEALTH_TEXT[1]
+        elif total_issues <= 15:
+            _, health_text = _HEALTH_TEXT[2]
+        else:
+            _, health_text = _HEALTH_TEXT[3]
+
+        lines.append(f"\nSpecification Health Score: {health_text.plain}")
+        lines.append(f"Total issues to address: {total_issues}")
+        self._write_plain(lines)
+
+    @contextmanager
+    def _batched_output(self):
+        """
+        Capture everything printed inside the block and write it out at once.
+
+        Only active in batch mode; otherwise output goes straight through.
+        """
+        if not self._batch_mode:
+            yield
+            return
+
+        capture = self.console.capture()
+        try:
+            with capture:
+                yield
+        finally:
+            # Whatever was rendered is still written if the block raises
+            self.console.file.write(capture.get())
+            self.console.file.flush()
+
+    def _write_plain(self, lines: List[str]):
+        """Write plain-text lines to the console's file in a single call."""
+        self.console.file.write("\n".join(lines) + "\n")
+
+    def _plain_contradiction_lines(self,
+                                   index: int,
+                                   description: str,
+                                   conflicting: Optional[List[str]],
+                                   severity: str,
+                                   impact: Optional[str],
+                                   resolved: Any,
+                                   resolution: Optional[str],
+                                   lines: List[str]):
+        """Append the plain-text form of a contradiction to lines."""
+        lines.append(f"\nContradiction {index}: {description}")
+
+        if conflicting:
+            lines.append("  Conflicting Requirements:")
+            lines.extend(f"    • {req}" for req in conflicting)
+
+        lines.append(f"  Severity: {severity.title()}")
+
+        if impact:
+            lines.append(f"  Impact: {impact}")
+
+        if not resolved:
+            lines.append("  Status: ⚠ Unresolved")
+            return
+
+        lines.append("  Status: ✓ Resolved")
+        if resolution:
+            lines.append(f"  Resolution: {resolution}")
+
     def export_to_json(self, filename: str):
         """Export all findings to JSON format."""
-        with open(filename, 'w') as f:
-            json.dump(self.export_data, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            # orjson encodes straight to bytes; default only sees unsupported types
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.export_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(self.export_data, f, indent=2, default=str)
 
         self.console.print(f"\n💾 [green]Exported findings to {filename}[/green]")
 
@@ -335,215 +666,192 @@ class FindingPresenter:
 
         self.console.print(f"\n💾 [green]Exported markdown report to {filename}[/green]")
 
-    def _group_edge_cases_by_priority(self, edge_cases: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Group edge cases by priority level."""
-        groups = {'high': [], 'medium': [], 'low': []}
-
-        for case in edge_cases:
-            priority = case.get('priority', 'medium')
+    def export_all(self, json_path: str, md_path: str):
+        """
+        Export findings to both JSON and markdown.
+
+        The two exports only read export_data, so they run side by side; the
+        JSON write overlaps with building the markdown report.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.export_to_json, json_path),
+                executor.submit(self.export_to_markdown, md_path)
+            ]
+            # Surface any export error in the caller
+            for future in futures:
+                future.result()
+
+    def _group_edge_cases_by_priority(self, rows: List[Tuple[Any, ...]]) -> Dict[str, List[Tuple[Any, ...]]]:
+        """Group edge case rows (see _edge_case_row) by priority level."""
+        groups = {_HI: [], _MED: [], _LO: []}
+
+        for row in rows:
+            priority = row[3]
             if priority in groups:
-                groups[priority].append(case)
+                groups[priority].append(row)
             else:
-                groups['medium'].append(case)  # Default to medium
+                groups[_MED].append(row)  # Default to medium
 
         return groups
 
-    def _get_priority_color(self, priority: str) -> str:
-        """Get color for priority level."""
-        colors = {
-            'high': 'red',
-            'medium': 'yellow',
-            'low': 'green'
-        }
-        return colors.get(priority, 'white')
-
-    def _get_severity_color(self, severity: str) -> str:
-        """Get color for severity level."""
-        colors = {
-            'critical': 'bright_red',
-            'high': 'red',
-            'medium': 'yellow',
-            'low': 'green'
-        }
-        return colors.get(severity, 'white')
-
-    def _get_priority_order(self, priority: str) -> int:
-        """Get numeric order for priority sorting."""
-        order = {
-            'high': 1,
-            'medium': 2,
-            'low': 3
-        }
-        return order.get(priority, 2)
-
-    def _calculate_average_compression_savings(self, compressed: List[Dict[str, Any]]) -> float:
-        """Calculate average compression savings percentage."""
-        if not compressed:
-            return 0.0
-
-        total_savings = 0
-        valid_compressions = 0
+    def _group_by_priority(self, gaps: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Group gaps by priority in a single pass.
 
-        for compression in compressed:
-            original = compression.get('original_requirements', [])
-            compressed_req = compression.get('compressed_requirement', '')
-
-            original_length = sum(len(req.get('content', '')) for req in original)
-            compressed_length = len(compressed_req)
+        'high', 'medium' and 'low' are always present, in that order; any other
+        priority value gets its own group after them.
+        """
+        groups = {_HI: [], _MED: [], _LO: []}
 
-            if original_length > 0:
-                savings = (1 - compressed_length/original_length) * 100
-                total_savings += savings
-                valid_compressions += 1
+        for gap in gaps:
+            priority = _intern_priority(gap.get('priority', _MED))
+            group = groups.get(priority)
+            if group is None:
+                group = groups[priority] = []
+            group.append(gap)
 
-        return total_savings / valid_compressions if valid_compressions > 0 else 0.0
+        return groups
 
     def _generate_markdown_report(self) -> str:
         """Generate a comprehensive markdown report."""
-        md = "# Specification Analysis Report\n\n"
-        md += f"Generated on: {self._get_current_timestamp()}\n\n"
+        # Built as a list of parts and joined once at the end
+        parts = []
+        append = parts.append
+
+        append("# Specification Analysis Report\n\n")
+        append(f"Generated on: {self._get_current_timestamp()}\n\n")
 
         # Executive Summary
-        md += "## Executive Summary\n\n"
-        total_issues = sum([
-            self.export_data.get('edge_cases', {}).get('total', 0),
-            self.export_data.get('contradictions', {}).get('total', 0),
-            self.export_data.get('completeness_gaps', {}).get('total', 0)
-        ])
-
-        md += f"- **Total Issues Identified:** {total_issues}\n"
-        md += f"- **Edge Cases:** {self.export_data.get('edge_cases', {}).get('total', 0)}\n"
-        md += f"- **Contradictions:** {self.export_data.get('contradictions', {}).get('total', 0)}\n"
-        md += f"- **Completeness Gaps:** {self.export_data.get('completeness_gaps', {}).get('total', 0)}\n"
-        md += f"- **Requirements Compressed:** {self.export_data.get('compressed_requirements', {}).get('total', 0)}\n\n"
+        append("## Executive Summary\n\n")
+        edge_total = self.export_data.get('edge_cases', {}).get('total', 0)
+        contradiction_total = self.export_data.get('contradictions', {}).get('total', 0)
+        gap_total = self.export_data.get('completeness_gaps', {}).get('total', 0)
+        total_issues = edge_total + contradiction_total + gap_total
+
+        append(f"- **Total Issues Identified:** {total_issues}\n")
+        append(f"- **Edge Cases:** {edge_total}\n")
+        append(f"- **Contradictions:** {contradiction_total}\n")
+        append(f"- **Completeness Gaps:** {gap_total}\n")
+        append(f"- **Requirements Compressed:** {self.export_data.get('compressed_requirements', {}).get('total', 0)}\n\n")
 
         # Detailed sections for each category
         if self.export_data.get('edge_cases'):
-            md += self._markdown_section_edge_cases()
+            self._markdown_section_edge_cases(append)
 
         if self.export_data.get('contradictions'):
-            md += self._markdown_section_contradictions()
+            self._markdown_section_contradictions(append)
 
         if self.export_data.get('completeness_gaps'):
-            md += self._markdown_section_gaps()
+            self._markdown_section_gaps(append)
 
         if self.export_data.get('compressed_requirements'):
-            md += self._markdown_section_compressed()
-
-        return md
-
-    def _markdown_section_edge_cases(self) -> str:
-        """Generate markdown section for edge cases."""
-        md = "## Edge Cases\n\n"
-
-        edge_data = self.export_data['edge_cases']
-        details = edge_data.get('details', [])
-
-        for i, case in enumerate(details, 1):
-            md += f"### {i}. {case.get('description', 'Unknown edge case')}\n\n"
+            self._markdown_section_compressed(append)
 
-            if case.get('context'):
-                md += f"**Context:** {case['context']}\n\n"
+        return "".join(parts)
 
-            if case.get('impact'):
-                md += f"**Impact:** {case['impact']}\n\n"
+    def _markdown_section_edge_cases(self, append: Callable[[str], None]):
+        """Append the markdown section for edge cases."""
+        append("## Edge Cases\n\n")
 
-            priority = case.get('priority', 'medium')
-            md += f"**Priority:** {priority.title()}\n\n"
+        # Reuse the rows extracted when the edge cases were presented
+        rows = self._export_cache.get('edge_cases')
+        if rows is None:
+            rows = [_edge_case_row(case) for case in self.export_data['edge_cases'].get('details', [])]
 
-            if case.get('handled'):
-                md += f"**Status:** ✅ Handled\n"
-                md += f"**Handling:** {case.get('handling', 'None specified')}\n\n"
+        for i, (description, context, impact, priority, handled, handling) in enumerate(rows, 1):
+            if handled:
+                status = _MD_HANDLED.format(handling if handling is not None else 'None specified')
             else:
-                md += f"**Status:** ⚠️ Not handled\n\n"
-
-        return md
-
-    def _markdown_section_contradictions(self) -> str:
-        """Generate markdown section for contradictions."""
-        md = "## Contradictions\n\n"
-
-        contradiction_data = self.export_data['contradictions']
-        details = contradiction_data.get('details', [])
-
-        for i, contradiction in enumerate(details, 1):
-            md += f"### {i}. {contradiction.get('description', 'Unknown contradiction')}\n\n"
-
-            if contradiction.get('conflicting_requirements'):
-                md += "**Conflicting Requirements:**\n"
-                for req in contradiction['conflicting_requirements']:
-                    md += f"- {req}\n"
-                md += "\n"
-
-            severity = contradiction.get('severity', 'medium')
-            md += f"**Severity:** {severity.title()}\n\n"
-
-            if contradiction.get('impact'):
-                md += f"**Impact:** {contradiction['impact']}\n\n"
-
-            if contradiction.get('resolved'):
-                md += f"**Status:** ✅ Resolved\n"
-                if contradiction.get('resolution'):
-                    md += f"**Resolution:** {contradiction['resolution']}\n\n"
+                status = _MD_NOT_HANDLED
+
+            append(_EDGE_TMPL.format_map({
+                'i': i,
+                'description': description,
+                'context': _MD_CONTEXT.format(context) if context else '',
+                'impact': _MD_IMPACT.format(impact) if impact else '',
+                'priority': priority.title(),
+                'status': status
+            }))
+
+    def _markdown_section_contradictions(self, append: Callable[[str], None]):
+        """Append the markdown section for contradictions."""
+        append("## Contradictions\n\n")
+
+        # Reuse the columns unpacked when the contradictions were presented
+        columns = self._export_cache.get('contradictions')
+        if columns is None:
+            columns = _unpack_findings(self.export_data['contradictions'].get('details', []), _CONTRADICTION_FIELDS)
+
+        rows = zip(
+            columns['description'],
+            columns['conflicting_requirements'],
+            columns['severity'],
+            columns['impact'],
+            columns['resolved'],
+            columns['resolution']
+        )
+        for i, (description, conflicting, severity, impact, resolved, resolution) in enumerate(rows, 1):
+            if resolved:
+                status = _MD_RESOLVED + (_MD_RESOLUTION.format(resolution) if resolution else '')
             else:
-                md += f"**Status:** ⚠️ Unresolved\n\n"
-
-        return md
-
-    def _markdown_section_gaps(self) -> str:
-        """Generate markdown section for completeness gaps."""
-        md = "## Completeness Gaps\n\n"
-
-        gap_data = self.export_data['completeness_gaps']
-        details = gap_data.get('details', [])
-
-        # Group by priority
-        priority_groups = {'high': [], 'medium': [], 'low': []}
-        for gap in details:
-            priority = gap.get('priority', 'medium')
-            if priority in priority_groups:
-                priority_groups[priority].append(gap)
-
-        for priority in ['high', 'medium', 'low']:
+                status = _MD_UNRESOLVED
+
+            append(_CONTRA_TMPL.format_map({
+                'i': i,
+                'description': description,
+                'conflicting': _MD_CONFLICTING.format(''.join(map(_MD_LIST_ITEM, conflicting))) if conflicting else '',
+                'severity': severity.title(),
+                'impact': _MD_IMPACT.format(impact) if impact else '',
+                'status': status
+            }))
+
+    def _markdown_section_gaps(self, append: Callable[[str], None]):
+        """Append the markdown section for completeness gaps."""
+        append("## Completeness Gaps\n\n")
+
+        # Reuse the grouping made when the gaps were presented
+        priority_groups = self._export_cache.get('completeness_gaps')
+        if priority_groups is None:
+            details = self.export_data['completeness_gaps'].get('details', [])
+            priority_groups = self._group_by_priority(details)
+
+        for priority in (_HI, _MED, _LO):
             gaps = priority_groups[priority]
             if not gaps:
                 continue
 
-            md += f"### {priority.title()} Priority Gaps\n\n"
+            append(f"### {priority.title()} Priority Gaps\n\n")
 
             for gap in gaps:
-                md += f"- **{gap.get('description', 'Unknown gap')}**\n"
-                if gap.get('suggested_requirement'):
-                    md += f"  - *Suggestion:* {gap['suggested_requirement']}\n"
-                md += "\n"
-
-        return md
+                suggestion = gap.get('suggested_requirement')
+                append(_GAP_TMPL.format_map({
+                    'description': gap.get('description', 'Unknown gap'),
+                    'suggestion': _MD_SUGGESTION.format(suggestion) if suggestion else ''
+                }))
 
-    def _markdown_section_compressed(self) -> str:
-        """Generate markdown section for compressed requirements."""
-        md = "## Compressed Requirements\n\n"
+    def _markdown_section_compressed(self, append: Callable[[str], None]):
+        """Append the markdown section for compressed requirements."""
+        append("## Compressed Requirements\n\n")
 
         compressed_data = self.export_data['compressed_requirements']
         details = compressed_data.get('details', [])
         avg_savings = compressed_data.get('average_savings', 0)
 
-        md += f"**Average Compression Savings:** {avg_savings:.1f}%\n\n"
+        append(f"**Average Compression Savings:** {avg_savings:.1f}%\n\n")
 
         for i, compression in enumerate(details, 1):
-            md += f"### Compression {i}\n\n"
-
-            md += "**Original Requirements:**\n"
-            original = compression.get('original_requirements', [])
-            for req in original:
-                md += f"- {req.get('content', 'Unknown')}\n"
-
-            md += "\n**Compressed To:**\n"
-            md += f"{compression.get('compressed_requirement', 'Unknown')}\n\n"
-
-            if compression.get('confidence'):
-                md += f"**Confidence:** {compression['confidence']:.1%}\n\n"
-
-        return md
+            get = compression.get
+            confidence = get('confidence')
+
+            append(_COMP_TMPL.format_map({
+                'i': i,
+                'originals': ''.join([
+                    _MD_LIST_ITEM(req.get('content', 'Unknown')) for req in get('original_requirements', [])
+                ]),
+                'compressed': get('compressed_requirement', 'Unknown'),
+                'confidence': _MD_CONFIDENCE.format(confidence) if confidence else ''
+            }))
 
     def _get_current_timestamp(self) -> str:
         """Get current timestamp for reports."""
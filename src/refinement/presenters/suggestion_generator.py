@@ -5,16 +5,632 @@ This module generates context-aware suggestions for handling edge cases, resolvi
 contradictions, filling completeness gaps, and refining compressed requirements.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable, Mapping, FrozenSet, Iterable, Iterator
+import heapq
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 from dataclasses import dataclass
+from collections import OrderedDict
+import asyncio
+import itertools
+import threading
 import uuid
 from datetime import datetime
 import re
+import sys
+
+
+# Default bound on concurrent analyses in the asuggest_* methods
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Number of compression refinement results kept per generator
+_REFINEMENT_CACHE_SIZE = 256
+
+# Edge case keyword buckets, matched in a single scan; each match reports its
+# bucket through lastgroup
+_EDGE_CASE_PATTERN = re.compile(
+    r'(?P<null>null|empty|missing)'
+    r'|(?P<boundary>boundary|limit|range)'
+    r'|(?P<concurrent>concurrent|parallel|race)'
+    r'|(?P<network>network|timeout|connection)'
+    r'|(?P<validation>user|input|validation)'
+)
+
+# 'must' anywhere in a requirement, matched without lowercasing a copy
+_MUST_PATTERN = re.compile(r'must', re.IGNORECASE)
+
+# Contradiction terms; some resolutions need two terms to co-occur
+_CONTRADICTION_PATTERN = re.compile(
+    r'(?P<priority>priority|precedence)'
+    r'|(?P<performance>performance)'
+    r'|(?P<security>security)'
+    r'|(?P<user>user)'
+    r'|(?P<elevated>admin|system)'
+)
+
+# Completeness gap keyword areas
+_GAP_PATTERN = re.compile(
+    r'(?P<error_handling>error|exception)'
+    r'|(?P<security>security|auth)'
+    r'|(?P<performance>performance|scalability)'
+    r'|(?P<usability>usability|accessibility)'
+    r'|(?P<observability>monitoring|logging)'
+)
+
+# Clause separators for the clarity check. The conjunctions are lookaheads so
+# overlapping matches such as ' and or ' are still seen, as with substring tests.
+_CLARITY_PATTERN = re.compile(r'(?P<comma>,)|(?=(?P<and> and ))|(?=(?P<or> or ))')
+
+
+def _intern_level(value: Any) -> Any:
+    """
+    Intern an impact/effort level read from a finding.
+
+    Template levels are literals and already interned; levels taken from
+    findings are fresh strings, interned so scoring lookups match on identity.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _truncate(text: str, limit: int = 50) -> str:
+    """Shorten text for a suggestion title, adding '...' only when something was cut."""
+    return text if len(text) <= limit else text[:limit] + '...'
 
 
-@dataclass
+def _compression_stats(original_reqs: List[Dict[str, Any]]) -> Tuple[int, List[str]]:
+    """
+    Walk a compression's original requirements once.
+
+    Returns the total content length and the contents that state a 'must',
+    which are the key details used when expanding the compression.
+    """
+    original_length = 0
+    key_details = []
+    has_must = _MUST_PATTERN.search
+
+    for req in original_reqs:
+        content = req.get('content', '')
+        original_length += len(content)
+        # Extract key phrases (very simplified)
+        if has_must(content):
+            key_details.append(content)
+
+    return original_length, key_details
+
+
+# Ranking weights: 30% confidence, 40% impact, 20% effort (lower effort scores
+# higher) and 10% suggestion type. The level weights are pre-multiplied into
+# read-only lookup tables so scoring is three lookups and a sum.
+_CONFIDENCE_WEIGHT = 0.3
+_IMPACT_WEIGHT = 0.4
+_EFFORT_WEIGHT = 0.2
+_TYPE_WEIGHT = 0.1
+_IMPACT_WEIGHTS = MappingProxyType({
+    level: score * _IMPACT_WEIGHT for level, score in {'high': 1.0, 'medium': 0.6, 'low': 0.3}.items()
+})
+_EFFORT_WEIGHTS = MappingProxyType({
+    level: score * _EFFORT_WEIGHT for level, score in {'low': 1.0, 'medium': 0.7, 'high': 0.4}.items()
+})
+_TYPE_WEIGHTS = MappingProxyType({
+    suggestion_type: score * _TYPE_WEIGHT
+    for suggestion_type, score in {
+        'contradiction_resolution': 1.0,  # Highest priority
+        'edge_case_handling': 0.8,
+        'completeness_addition': 0.6,
+        'compression_refinement': 0.4    # Lowest priority
+    }.items()
+})
+# Extra ranking rationale for the suggestion types that warrant one
+_TYPE_RATIONALE = {
+    'contradiction_resolution': ", critical contradiction",
+    'edge_case_handling': ", important edge case"
+}
+
+
+@lru_cache(maxsize=512)
+def _score(confidence: float, impact: str, effort: str, suggestion_type: str) -> float:
+    """
+    Weighted score for one combination of ranking fields.
+
+    Unknown levels score as medium and unknown types as completeness additions.
+    """
+    return round(
+        confidence * _CONFIDENCE_WEIGHT +
+        _IMPACT_WEIGHTS.get(impact, _IMPACT_WEIGHTS['medium']) +
+        _EFFORT_WEIGHTS.get(effort, _EFFORT_WEIGHTS['medium']) +
+        _TYPE_WEIGHTS.get(suggestion_type, _TYPE_WEIGHTS['completeness_addition']),
+        3
+    )
+
+
+def _score_batch(suggestions: List[Dict[str, Any]]) -> List[float]:
+    """
+    Score a batch of suggestions in one pass.
+
+    Impact, effort and type are small enums and confidences come from a
+    handful of templates, so most suggestions are a _score cache hit.
+    """
+    return [
+        _score(
+            suggestion.get('confidence', 0.5),
+            suggestion.get('impact', 'medium'),
+            suggestion.get('effort', 'medium'),
+            suggestion.get('type', 'completeness_addition')
+        )
+        for suggestion in suggestions
+    ]
+
+
+# Keyword classification depends only on the description, and the same
+# findings come back on every refinement iteration, so it is memoized on the
+# raw description; each distinct description is lowercased once.
+@lru_cache(maxsize=1024)
+def _edge_case_buckets(description: str) -> FrozenSet[str]:
+    """Return the keyword buckets matched by an edge case description."""
+    return frozenset(match.lastgroup for match in _EDGE_CASE_PATTERN.finditer(description.lower()))
+
+
+@lru_cache(maxsize=1024)
+def _contradiction_patterns(description: str) -> FrozenSet[str]:
+    """Return the resolution patterns matched by a contradiction description."""
+    terms = {match.lastgroup for match in _CONTRADICTION_PATTERN.finditer(description.lower())}
+    patterns = set()
+
+    if 'priority' in terms:
+        patterns.add('priority')
+
+    if 'performance' in terms and 'security' in terms:
+        patterns.add('performance_security')
+
+    if 'user' in terms and 'elevated' in terms:
+        patterns.add('role_based')
+
+    return frozenset(patterns)
+
+
+@lru_cache(maxsize=1024)
+def _gap_patterns(description: str) -> FrozenSet[str]:
+    """Return the requirement areas matched by a gap description."""
+    return frozenset(match.lastgroup for match in _GAP_PATTERN.finditer(description.lower()))
+
+
+# Static strategy templates. They are shared read-only mappings, so the
+# _suggest_* helpers return them without building new dicts on every call.
+_NULL_HANDLING = (
+    MappingProxyType({
+        'strategy': 'null_value_handling',
+        'description': 'Implement comprehensive null/empty value handling',
+        'implementation': 'Add validation and default value mechanisms',
+        'confidence': 0.85,
+        'impact': 'high',
+        'effort': 'low',
+        'rationale': 'Null/empty values are common sources of errors and should be handled explicitly',
+        'examples': (
+            'Validate input parameters before processing',
+            'Provide sensible defaults for optional fields',
+            'Return clear error messages for required missing values'
+        )
+    }),
+    MappingProxyType({
+        'strategy': 'graceful_degradation',
+        'description': 'Implement graceful degradation for missing data',
+        'implementation': 'Design fallback behavior when data is unavailable',
+        'confidence': 0.75,
+        'impact': 'medium',
+        'effort': 'medium',
+        'rationale': 'System should continue functioning even with partial data',
+        'examples': (
+            'Use cached data when fresh data is unavailable',
+            'Display partial results with appropriate warnings',
+            'Implement retry mechanisms with exponential backoff'
+        )
+    }),
+)
+
+_BOUNDARY_HANDLING = (
+    MappingProxyType({
+        'strategy': 'boundary_validation',
+        'description': 'Implement strict boundary validation and limits',
+        'implementation': 'Add input validation for all boundary conditions',
+        'confidence': 0.90,
+        'impact': 'high',
+        'effort': 'low',
+        'rationale': 'Boundary conditions are critical for system stability and security',
+        'examples': (
+            'Validate array indices before access',
+            'Check memory limits before allocation',
+            'Implement rate limiting for API calls'
+        )
+    }),
+    MappingProxyType({
+        'strategy': 'dynamic_scaling',
+        'description': 'Implement dynamic scaling for resource limits',
+        'implementation': 'Design system to handle varying load conditions',
+        'confidence': 0.70,
+        'impact': 'high',
+        'effort': 'high',
+        'rationale': 'Dynamic scaling provides better resource utilization and user experience',
+        'examples': (
+            'Auto-scale server capacity based on demand',
+            'Implement pagination for large data sets',
+            'Use streaming for large file processing'
+        )
+    }),
+)
+
+_CONCURRENCY_HANDLING = (
+    MappingProxyType({
+        'strategy': 'synchronization',
+        'description': 'Implement proper synchronization mechanisms',
+        'implementation': 'Add locks, semaphores, or atomic operations',
+        'confidence': 0.80,
+        'impact': 'high',
+        'effort': 'medium',
+        'rationale': 'Concurrency issues can lead to data corruption and system instability',
+        'examples': (
+            'Use database transactions for data consistency',
+            'Implement optimistic locking for concurrent updates',
+            'Add mutex locks for shared resource access'
+        )
+    }),
+    MappingProxyType({
+        'strategy': 'immutable_design',
+        'description': 'Design with immutable data structures',
+        'implementation': 'Use immutable objects to prevent race conditions',
+        'confidence': 0.75,
+        'impact': 'medium',
+        'effort': 'high',
+        'rationale': 'Immutable design eliminates many concurrency issues at the architectural level',
+        'examples': (
+            'Use immutable data structures in multi-threaded code',
+            'Implement event sourcing for state changes',
+            'Design stateless services where possible'
+        )
+    }),
+)
+
+_NETWORK_HANDLING = (
+    MappingProxyType({
+        'strategy': 'timeout_and_retry',
+        'description': 'Implement timeout and retry mechanisms',
+        'implementation': 'Add configurable timeouts and exponential backoff',
+        'confidence': 0.85,
+        'impact': 'high',
+        'effort': 'low',
+        'rationale': 'Network issues are common and require robust error handling',
+        'examples': (
+            'Set appropriate timeouts for all network calls',
+            'Implement exponential backoff for retries',
+            'Add circuit breaker pattern for failing services'
+        )
+    }),
+    MappingProxyType({
+        'strategy': 'offline_capability',
+        'description': 'Implement offline capability and data synchronization',
+        'implementation': 'Add local caching and sync mechanisms',
+        'confidence': 0.70,
+        'impact': 'medium',
+        'effort': 'high',
+        'rationale': 'Offline capability improves user experience during network issues',
+        'examples': (
+            'Cache data locally for offline access',
+            'Implement conflict resolution for sync',
+            'Provide clear offline mode indicators'
+        )
+    }),
+)
+
+_VALIDATION_HANDLING = (
+    MappingProxyType({
+        'strategy': 'comprehensive_validation',
+        'description': 'Implement comprehensive input validation',
+        'implementation': 'Add validation at all system boundaries',
+        'confidence': 0.90,
+        'impact': 'high',
+        'effort': 'medium',
+        'rationale': 'Input validation is critical for security and data integrity',
+        'examples': (
+            'Validate all user inputs on both client and server',
+            'Sanitize inputs to prevent injection attacks',
+            'Provide clear validation error messages'
+        )
+    }),
+    MappingProxyType({
+        'strategy': 'progressive_validation',
+        'description': 'Implement progressive validation and user guidance',
+        'implementation': 'Add real-time validation with helpful feedback',
+        'confidence': 0.75,
+        'impact': 'medium',
+        'effort': 'medium',
+        'rationale': 'Progressive validation improves user experience and reduces errors',
+        'examples': (
+            'Show validation errors as user types',
+            'Provide suggestions for valid inputs',
+            'Use progressive disclosure for complex forms'
+        )
+    }),
+)
+
+_GENERIC_HANDLING = (
+    MappingProxyType({
+        'strategy': 'defensive_programming',
+        'description': 'Implement defensive programming practices',
+        'implementation': 'Add comprehensive error checking and logging',
+        'confidence': 0.70,
+        'impact': 'medium',
+        'effort': 'low',
+        'rationale': 'Defensive programming helps catch and handle unexpected conditions',
+        'examples': (
+            'Add assertions for critical assumptions',
+            'Implement comprehensive logging',
+            'Add health checks and monitoring'
+        )
+    }),
+    MappingProxyType({
+        'strategy': 'graceful_error_handling',
+        'description': 'Implement graceful error handling and recovery',
+        'implementation': 'Add user-friendly error handling with recovery options',
+        'confidence': 0.75,
+        'impact': 'medium',
+        'effort': 'medium',
+        'rationale': 'Good error handling improves user experience and system reliability',
+        'examples': (
+            'Provide clear error messages to users',
+            'Implement automatic recovery where possible',
+            'Add manual recovery options for users'
+        )
+    }),
+)
+
+_PRIORITY_RESOLUTION = MappingProxyType({
+    'strategy': 'priority_hierarchy',
+    'description': 'Establish clear priority hierarchy for conflicting requirements',
+    'details': 'Define which requirement takes precedence in conflict situations',
+    'confidence': 0.80,
+    'impact': 'high',
+    'effort': 'low',
+    'rationale': 'Clear priorities help resolve conflicts consistently',
+    'examples': (
+        'Security requirements override performance requirements',
+        'User safety takes precedence over convenience features',
+        'Core functionality priority over nice-to-have features'
+    )
+})
+
+_PERFORMANCE_SECURITY_BALANCE = MappingProxyType({
+    'strategy': 'configurable_balance',
+    'description': 'Implement configurable balance between performance and security',
+    'details': 'Allow system configuration to adjust performance/security trade-offs',
+    'confidence': 0.75,
+    'impact': 'medium',
+    'effort': 'high',
+    'rationale': 'Different environments may require different performance/security balances',
+    'examples': (
+        'Configurable encryption levels',
+        'Performance vs security profiles',
+        'Runtime security policy adjustments'
+    )
+})
+
+_ROLE_BASED_RESOLUTION = MappingProxyType({
+    'strategy': 'role_based_requirements',
+    'description': 'Implement role-based requirement differentiation',
+    'details': 'Define different requirements for different user roles',
+    'confidence': 0.85,
+    'impact': 'medium',
+    'effort': 'medium',
+    'rationale': 'Different user roles often have legitimately different requirements',
+    'examples': (
+        'Admin users have access to advanced features',
+        'Regular users have simplified interfaces',
+        'Power users get configurable options'
+    )
+})
+
+_REQUIREMENTS_MERGE = MappingProxyType({
+    'strategy': 'unified_requirement',
+    'description': 'Merge contradictory requirements into unified requirement',
+    'details': 'Combine the best aspects of conflicting requirements',
+    'confidence': 0.70,
+    'impact': 'medium',
+    'effort': 'medium',
+    'rationale': 'Sometimes contradictions can be resolved by finding a unified approach',
+    'examples': (
+        'Combine fast and secure by using optimized secure algorithms',
+        'Merge simple and powerful by providing layered interfaces',
+        'Unite flexible and consistent through configuration templates'
+    )
+})
+
+_CONDITIONAL_REQUIREMENTS = MappingProxyType({
+    'strategy': 'conditional_logic',
+    'description': 'Implement conditional logic to handle conflicting requirements',
+    'details': 'Apply different requirements based on context or conditions',
+    'confidence': 0.75,
+    'impact': 'medium',
+    'effort': 'medium',
+    'rationale': 'Context-sensitive requirements can resolve many contradictions',
+    'examples': (
+        'Different behavior for different environments',
+        'Time-based requirement activation',
+        'Load-based performance adjustments'
+    )
+})
+
+_ERROR_HANDLING_REQUIREMENT = MappingProxyType({
+    'title': 'Comprehensive Error Handling',
+    'description': 'Add comprehensive error handling and recovery mechanisms',
+    'requirement': MappingProxyType({
+        'type': 'error_handling',
+        'content': 'System must implement comprehensive error handling with clear error messages, logging, and recovery mechanisms',
+        'priority': 'high',
+        'category': 'reliability'
+    }),
+    'requirement_type': 'non_functional',
+    'justification': 'Proper error handling is essential for system reliability and user experience',
+    'confidence': 0.85,
+    'impact': 'high',
+    'effort': 'medium',
+    'rationale': 'Missing error handling leads to poor user experience and difficult debugging',
+    'examples': (
+        'Implement global exception handling',
+        'Add structured error logging',
+        'Provide user-friendly error messages'
+    )
+})
+
+_SECURITY_REQUIREMENT = MappingProxyType({
+    'title': 'Security and Authentication',
+    'description': 'Add comprehensive security and authentication requirements',
+    'requirement': MappingProxyType({
+        'type': 'security',
+        'content': 'System must implement secure authentication, authorization, and data protection mechanisms',
+        'priority': 'high',
+        'category': 'security'
+    }),
+    'requirement_type': 'non_functional',
+    'justification': 'Security is critical for protecting user data and system integrity',
+    'confidence': 0.90,
+    'impact': 'high',
+    'effort': 'high',
+    'rationale': 'Security gaps expose the system to significant risks',
+    'examples': (
+        'Implement multi-factor authentication',
+        'Add role-based access control',
+        'Encrypt sensitive data at rest and in transit'
+    )
+})
+
+_PERFORMANCE_REQUIREMENT = MappingProxyType({
+    'title': 'Performance and Scalability',
+    'description': 'Add specific performance and scalability requirements',
+    'requirement': MappingProxyType({
+        'type': 'performance',
+        'content': 'System must meet specific performance benchmarks and scale to handle expected load',
+        'priority': 'medium',
+        'category': 'performance'
+    }),
+    'requirement_type': 'non_functional',
+    'justification': 'Performance requirements ensure good user experience under load',
+    'confidence': 0.80,
+    'impact': 'medium',
+    'effort': 'medium',
+    'rationale': 'Performance gaps lead to poor user experience and scalability issues',
+    'examples': (
+        'Response time under 200ms for common operations',
+        'Support for 10,000 concurrent users',
+        'Database queries optimized for performance'
+    )
+})
+
+_USABILITY_REQUIREMENT = MappingProxyType({
+    'title': 'Usability and Accessibility',
+    'description': 'Add usability and accessibility requirements',
+    'requirement': MappingProxyType({
+        'type': 'usability',
+        'content': 'System must provide intuitive user interface and meet accessibility standards',
+        'priority': 'medium',
+        'category': 'usability'
+    }),
+    'requirement_type': 'non_functional',
+    'justification': 'Usability requirements ensure the system is accessible to all users',
+    'confidence': 0.75,
+    'impact': 'medium',
+    'effort': 'medium',
+    'rationale': 'Usability gaps make the system difficult to use and potentially inaccessible',
+    'examples': (
+        'Meet WCAG 2.1 accessibility standards',
+        'Intuitive navigation and user flows',
+        'Responsive design for mobile devices'
+    )
+})
+
+_OBSERVABILITY_REQUIREMENT = MappingProxyType({
+    'title': 'Monitoring and Observability',
+    'description': 'Add comprehensive monitoring and observability requirements',
+    'requirement': MappingProxyType({
+        'type': 'observability',
+        'content': 'System must provide comprehensive monitoring, logging, and alerting capabilities',
+        'priority': 'medium',
+        'category': 'operational'
+    }),
+    'requirement_type': 'non_functional',
+    'justification': 'Observability is essential for maintaining and debugging the system',
+    'confidence': 0.80,
+    'impact': 'medium',
+    'effort': 'low',
+    'rationale': 'Missing observability makes the system difficult to maintain and debug',
+    'examples': (
+        'Structured application logging',
+        'Performance and health monitoring',
+        'Automated alerting for critical issues'
+    )
+})
+
+
+# Static parts of the input-dependent suggestions; the per-call fields are
+# merged in by the _suggest_* helpers
+_GENERIC_REQUIREMENT = MappingProxyType({
+    'requirement_type': 'functional',
+    'justification': 'Addresses identified completeness gap in specification',
+    'confidence': 0.60,
+    'effort': 'medium',
+    'rationale': 'Completeness gaps should be addressed to ensure comprehensive coverage',
+    'examples': ()
+})
+
+# Shape of the requirement a generic suggestion proposes; every field but
+# 'type' is filled in from the gap
+_GENERIC_REQUIREMENT_SPEC = MappingProxyType({
+    'type': 'functional',
+    'content': '',
+    'priority': 'medium',
+    'category': 'general'
+})
+
+_DECOMPRESS_REFINEMENT = MappingProxyType({
+    'title': 'Reduce Compression',
+    'description': 'Expand compressed requirement to preserve important details',
+    'improvement_type': 'detail_preservation',
+    'quality_gain': 'Better preserves original intent and details',
+    'confidence': 0.75,
+    'impact': 'medium',
+    'effort': 'low',
+    'rationale': 'Overly aggressive compression can lose important details'
+})
+
+_DETAIL_RECOVERY_REFINEMENT = MappingProxyType({
+    'title': 'Recover Lost Details',
+    'description': 'Add back important details that were lost in compression',
+    'improvement_type': 'detail_recovery',
+    'quality_gain': 'Restores important details while maintaining conciseness',
+    'confidence': 0.80,
+    'impact': 'medium',
+    'effort': 'low',
+    'rationale': 'Important details should not be lost during compression'
+})
+
+_CLARITY_REFINEMENT = MappingProxyType({
+    'title': 'Improve Clarity',
+    'description': 'Improve clarity and readability of compressed requirement',
+    'improvement_type': 'clarity_improvement',
+    'quality_gain': 'Better readability and understanding',
+    'confidence': 0.70,
+    'impact': 'low',
+    'effort': 'low',
+    'rationale': 'Clear requirements are easier to understand and implement'
+})
+
+
+@dataclass(slots=True)
 class Suggestion:
-    """Represents a single improvement suggestion."""
+    """
+    Represents a single improvement suggestion.
+
+    SuggestionGenerator emits plain dicts with these keys rather than
+    instances, so keep the two in step. Slotted, as callers holding many
+    suggestions as records pay no per-instance __dict__.
+    """
     id: str
     type: str  # edge_case_handling, contradiction_resolution, etc.
     title: str
@@ -38,166 +654,297 @@ class SuggestionGenerator:
 
     def __init__(self, llm_client=None):
         self.llm_client = llm_client  # Placeholder for LLM integration
-        self.suggestion_templates = self._load_suggestion_templates()
-        self.domain_patterns = self._load_domain_patterns()
+
+        # Suggestion ids only need to be unique per generator: a random prefix
+        # plus a counter avoids a uuid4 per suggestion
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = itertools.count()
+
+        # Matched pattern -> strategy dispatch, in the order suggestions are listed
+        self._contradiction_dispatch = (
+            ('priority', self._suggest_priority_resolution),
+            ('performance_security', self._suggest_performance_security_balance),
+            ('role_based', self._suggest_role_based_resolution)
+        )
+        self._gap_dispatch = (
+            ('error_handling', self._suggest_error_handling_requirement),
+            ('security', self._suggest_security_requirement),
+            ('performance', self._suggest_performance_requirement),
+            ('usability', self._suggest_usability_requirement),
+            ('observability', self._suggest_observability_requirement)
+        )
+
+        # Compressions tend to come back unchanged across refinement iterations;
+        # their refinements are kept in a small LRU. The lock covers the
+        # concurrent asuggest_* path.
+        self._refinement_cache: OrderedDict = OrderedDict()
+        self._refinement_cache_lock = threading.Lock()
+
+    # Templates and domain patterns are loaded on first use rather than at
+    # construction, so generators that never need them never pay for the load
+    @cached_property
+    def suggestion_templates(self) -> Dict[str, Any]:
+        return self._load_suggestion_templates()
+
+    @cached_property
+    def domain_patterns(self) -> Dict[str, Any]:
+        return self._load_domain_patterns()
 
     def suggest_edge_case_handling(self, edge_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate suggestions for handling identified edge cases."""
-        suggestions = []
+        return list(self.isuggest_edge_case_handling(edge_cases))
+
+    def suggest_contradiction_resolutions(self, contradictions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate suggestions for resolving contradictions."""
+        return list(self.isuggest_contradiction_resolutions(contradictions))
 
+    def suggest_completeness_improvements(self, gaps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate suggestions for filling completeness gaps."""
+        return list(self.isuggest_completeness_improvements(gaps))
+
+    def suggest_compression_refinements(self, compressed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate suggestions for refining compressed requirements."""
+        return list(self.isuggest_compression_refinements(compressed))
+
+    def isuggest_edge_case_handling(self, edge_cases: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield edge case handling suggestions as each edge case is analyzed."""
         for edge_case in edge_cases:
             if edge_case.get('handled'):
                 continue  # Skip already handled cases
 
             # Analyze the edge case to determine handling strategy
             handling_suggestions = self._analyze_edge_case_handling(edge_case)
+            yield from self._edge_case_suggestions(edge_case, handling_suggestions)
 
-            for handling in handling_suggestions:
-                suggestion = Suggestion(
-                    id=str(uuid.uuid4()),
-                    type="edge_case_handling",
-                    title=f"Handle: {edge_case.get('description', 'Unknown case')[:50]}...",
-                    description=handling['description'],
-                    content={
-                        'edge_case_id': edge_case.get('id'),
-                        'edge_case': edge_case,
-                        'handling_strategy': handling['strategy'],
-                        'implementation': handling['implementation']
-                    },
-                    confidence=handling['confidence'],
-                    impact=handling['impact'],
-                    effort=handling['effort'],
-                    rationale=handling['rationale'],
-                    examples=handling.get('examples'),
-                    related_items=handling.get('related_items')
-                )
-
-                suggestions.append(suggestion.__dict__)
-
-        return suggestions
-
-    def suggest_contradiction_resolutions(self, contradictions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate suggestions for resolving contradictions."""
-        suggestions = []
-
+    def isuggest_contradiction_resolutions(self, contradictions: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield contradiction resolution suggestions as each contradiction is analyzed."""
         for contradiction in contradictions:
             if contradiction.get('resolved'):
                 continue  # Skip already resolved contradictions
 
             # Analyze the contradiction to determine resolution strategies
             resolution_suggestions = self._analyze_contradiction_resolution(contradiction)
+            yield from self._contradiction_suggestions(contradiction, resolution_suggestions)
 
-            for resolution in resolution_suggestions:
-                suggestion = Suggestion(
-                    id=str(uuid.uuid4()),
-                    type="contradiction_resolution",
-                    title=f"Resolve: {contradiction.get('description', 'Unknown contradiction')[:50]}...",
-                    description=resolution['description'],
-                    content={
-                        'contradiction_id': contradiction.get('id'),
-                        'contradiction': contradiction,
-                        'resolution_strategy': resolution['strategy'],
-                        'resolution_details': resolution['details'],
-                        'affected_requirements': resolution.get('affected_requirements', [])
-                    },
-                    confidence=resolution['confidence'],
-                    impact=resolution['impact'],
-                    effort=resolution['effort'],
-                    rationale=resolution['rationale'],
-                    examples=resolution.get('examples'),
-                    related_items=resolution.get('related_items')
-                )
-
-                suggestions.append(suggestion.__dict__)
-
-        return suggestions
-
-    def suggest_completeness_improvements(self, gaps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate suggestions for filling completeness gaps."""
-        suggestions = []
-
+    def isuggest_completeness_improvements(self, gaps: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield completeness suggestions as each gap is analyzed."""
         for gap in gaps:
             # Analyze the gap to suggest specific requirements
             improvement_suggestions = self._analyze_completeness_gap(gap)
+            yield from self._completeness_suggestions(gap, improvement_suggestions)
+
+    def isuggest_compression_refinements(self, compressed: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield compression refinement suggestions as each compression is analyzed."""
+        for compression in compressed:
+            # Analyze compression quality and suggest improvements
+            refinement_suggestions = self._analyze_compression_refinement(compression)
+            yield from self._compression_suggestions(compression, refinement_suggestions)
 
-            for improvement in improvement_suggestions:
-                suggestion = Suggestion(
-                    id=str(uuid.uuid4()),
-                    type="completeness_addition",
-                    title=f"Add: {improvement['title']}",
-                    description=improvement['description'],
-                    content={
-                        'gap_id': gap.get('id'),
-                        'gap': gap,
-                        'new_requirement': improvement['requirement'],
-                        'requirement_type': improvement['requirement_type'],
-                        'justification': improvement['justification']
-                    },
-                    confidence=improvement['confidence'],
-                    impact=improvement['impact'],
-                    effort=improvement['effort'],
-                    rationale=improvement['rationale'],
-                    examples=improvement.get('examples'),
-                    related_items=improvement.get('related_items')
-                )
-
-                suggestions.append(suggestion.__dict__)
+    async def asuggest_edge_case_handling(self,
+                                          edge_cases: List[Dict[str, Any]],
+                                          max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Async variant of suggest_edge_case_handling that analyzes edge cases concurrently."""
+        pending = [edge_case for edge_case in edge_cases if not edge_case.get('handled')]
+        results = await self._analyze_concurrently(self._analyze_edge_case_handling, pending, max_concurrency)
 
+        suggestions = []
+        for edge_case, handling_suggestions in zip(pending, results):
+            suggestions.extend(self._edge_case_suggestions(edge_case, handling_suggestions))
         return suggestions
 
-    def suggest_compression_refinements(self, compressed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate suggestions for refining compressed requirements."""
+    async def asuggest_contradiction_resolutions(self,
+                                                 contradictions: List[Dict[str, Any]],
+                                                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Async variant of suggest_contradiction_resolutions that analyzes contradictions concurrently."""
+        pending = [contradiction for contradiction in contradictions if not contradiction.get('resolved')]
+        results = await self._analyze_concurrently(self._analyze_contradiction_resolution, pending, max_concurrency)
+
         suggestions = []
+        for contradiction, resolution_suggestions in zip(pending, results):
+            suggestions.extend(self._contradiction_suggestions(contradiction, resolution_suggestions))
+        return suggestions
 
-        for compression in compressed:
-            # Analyze compression quality and suggest improvements
-            refinement_suggestions = self._analyze_compression_refinement(compression)
+    async def asuggest_completeness_improvements(self,
+                                                 gaps: List[Dict[str, Any]],
+                                                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Async variant of suggest_completeness_improvements that analyzes gaps concurrently."""
+        results = await self._analyze_concurrently(self._analyze_completeness_gap, gaps, max_concurrency)
 
-            for refinement in refinement_suggestions:
-                suggestion = Suggestion(
-                    id=str(uuid.uuid4()),
-                    type="compression_refinement",
-                    title=f"Refine: {refinement['title']}",
-                    description=refinement['description'],
-                    content={
-                        'compression_id': compression.get('id'),
-                        'original_compression': compression,
-                        'refined_requirement': refinement['refined_requirement'],
-                        'improvement_type': refinement['improvement_type'],
-                        'quality_gain': refinement['quality_gain']
-                    },
-                    confidence=refinement['confidence'],
-                    impact=refinement['impact'],
-                    effort=refinement['effort'],
-                    rationale=refinement['rationale'],
-                    examples=refinement.get('examples'),
-                    related_items=refinement.get('related_items')
-                )
-
-                suggestions.append(suggestion.__dict__)
+        suggestions = []
+        for gap, improvement_suggestions in zip(gaps, results):
+            suggestions.extend(self._completeness_suggestions(gap, improvement_suggestions))
+        return suggestions
 
+    async def asuggest_compression_refinements(self,
+                                               compressed: List[Dict[str, Any]],
+                                               max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Async variant of suggest_compression_refinements that analyzes compressions concurrently."""
+        results = await self._analyze_concurrently(self._analyze_compression_refinement, compressed, max_concurrency)
+
+        suggestions = []
+        for compression, refinement_suggestions in zip(compressed, results):
+            suggestions.extend(self._compression_suggestions(compression, refinement_suggestions))
         return suggestions
 
-    def rank_suggestions(self, suggestions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _analyze_concurrently(self,
+                                    analyze: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+                                    items: List[Dict[str, Any]],
+                                    max_concurrency: int) -> List[List[Dict[str, Any]]]:
+        """
+        Run an _analyze_* helper over items concurrently, preserving order.
+
+        Each call runs in the default executor so blocking (LLM-backed)
+        analysis overlaps; the semaphore bounds the number in flight.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(item: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await loop.run_in_executor(None, analyze, item)
+
+        return await asyncio.gather(*(run(item) for item in items))
+
+    def _next_suggestion_id(self) -> str:
+        """Return a new suggestion id, unique within this generator."""
+        return f"{self._id_prefix}-{next(self._id_counter)}"
+
+    def _edge_case_suggestions(self,
+                               edge_case: Dict[str, Any],
+                               handling_suggestions: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield suggestion dicts for an edge case from its handling strategies."""
+        # Shared by every suggestion for this edge case
+        title = f"Handle: {_truncate(edge_case.get('description') or 'Unknown case')}"
+
+        for handling in handling_suggestions:
+            yield {
+                'id': self._next_suggestion_id(),
+                'type': 'edge_case_handling',
+                'title': title,
+                'description': handling['description'],
+                'content': {
+                    'edge_case_id': edge_case.get('id'),
+                    'edge_case': edge_case,
+                    'handling_strategy': handling['strategy'],
+                    'implementation': handling['implementation']
+                },
+                'confidence': handling['confidence'],
+                'impact': handling['impact'],
+                'effort': handling['effort'],
+                'rationale': handling['rationale'],
+                'examples': handling.get('examples'),
+                'related_items': handling.get('related_items')
+            }
+
+    def _contradiction_suggestions(self,
+                                   contradiction: Dict[str, Any],
+                                   resolution_suggestions: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield suggestion dicts for a contradiction from its resolution strategies."""
+        # Shared by every suggestion for this contradiction
+        title = f"Resolve: {_truncate(contradiction.get('description') or 'Unknown contradiction')}"
+
+        for resolution in resolution_suggestions:
+            yield {
+                'id': self._next_suggestion_id(),
+                'type': 'contradiction_resolution',
+                'title': title,
+                'description': resolution['description'],
+                'content': {
+                    'contradiction_id': contradiction.get('id'),
+                    'contradiction': contradiction,
+                    'resolution_strategy': resolution['strategy'],
+                    'resolution_details': resolution['details'],
+                    'affected_requirements': resolution.get('affected_requirements', [])
+                },
+                'confidence': resolution['confidence'],
+                'impact': resolution['impact'],
+                'effort': resolution['effort'],
+                'rationale': resolution['rationale'],
+                'examples': resolution.get('examples'),
+                'related_items': resolution.get('related_items')
+            }
+
+    def _completeness_suggestions(self,
+                                  gap: Dict[str, Any],
+                                  improvement_suggestions: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield suggestion dicts for a completeness gap from its proposed requirements."""
+        for improvement in improvement_suggestions:
+            yield {
+                'id': self._next_suggestion_id(),
+                'type': 'completeness_addition',
+                'title': f"Add: {improvement['title']}",
+                'description': improvement['description'],
+                'content': {
+                    'gap_id': gap.get('id'),
+                    'gap': gap,
+                    'new_requirement': dict(improvement['requirement']),  # Templates are read-only
+                    'requirement_type': improvement['requirement_type'],
+                    'justification': improvement['justification']
+                },
+                'confidence': improvement['confidence'],
+                'impact': improvement['impact'],
+                'effort': improvement['effort'],
+                'rationale': improvement['rationale'],
+                'examples': improvement.get('examples'),
+                'related_items': improvement.get('related_items')
+            }
+
+    def _compression_suggestions(self,
+                                 compression: Dict[str, Any],
+                                 refinement_suggestions: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield suggestion dicts for a compression from its proposed refinements."""
+        for refinement in refinement_suggestions:
+            yield {
+                'id': self._next_suggestion_id(),
+                'type': 'compression_refinement',
+                'title': f"Refine: {refinement['title']}",
+                'description': refinement['description'],
+                'content': {
+                    'compression_id': compression.get('id'),
+                    'original_compression': compression,
+                    'refined_requirement': refinement['refined_requirement'],
+                    'improvement_type': refinement['improvement_type'],
+                    'quality_gain': refinement['quality_gain']
+                },
+                'confidence': refinement['confidence'],
+                'impact': refinement['impact'],
+                'effort': refinement['effort'],
+                'rationale': refinement['rationale'],
+                'examples': refinement.get('examples'),
+                'related_items': refinement.get('related_items')
+            }
+
+    def rank_suggestions(self,
+                         suggestions: Iterable[Dict[str, Any]],
+                         top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Rank suggestions by confidence, impact, and effort to prioritize user review.
 
         Uses a weighted scoring system to surface the most valuable suggestions first.
+        Accepts any iterable, including the isuggest_* generators; with top_k only
+        the best k suggestions are selected and returned.
         """
-        scored_suggestions = []
+        suggestions = list(suggestions)
+        get_rationale = self._get_ranking_rationale
 
-        for suggestion in suggestions:
-            score = self._calculate_suggestion_score(suggestion)
+        # Scores are kept in a list parallel to the suggestions, so ordering
+        # sorts plain indices on floats instead of reading 'score' from each dict
+        scores = _score_batch(suggestions)
+        for suggestion, score in zip(suggestions, scores):
             suggestion['score'] = score
-            suggestion['rank_rationale'] = self._get_ranking_rationale(suggestion, score)
-            scored_suggestions.append(suggestion)
+            suggestion['rank_rationale'] = get_rationale(suggestion, score)
 
-        # Sort by score (highest first)
-        ranked_suggestions = sorted(scored_suggestions, key=lambda x: x['score'], reverse=True)
+        # Sort by score (highest first); a heap avoids a full sort when only the top few are wanted
+        indices = range(len(suggestions))
+        if top_k is not None:
+            order = heapq.nlargest(top_k, indices, key=scores.__getitem__)
+        else:
+            order = sorted(indices, key=scores.__getitem__, reverse=True)
+        ranked_suggestions = [suggestions[i] for i in order]
 
         # Add rank information
-        for i, suggestion in enumerate(ranked_suggestions):
-            suggestion['rank'] = i + 1
+        for rank, suggestion in enumerate(ranked_suggestions, 1):
+            suggestion['rank'] = rank
 
         return ranked_suggestions
 
@@ -205,24 +952,22 @@ class SuggestionGenerator:
         """Analyze an edge case and suggest handling strategies."""
         handling_strategies = []
 
-        case_description = edge_case.get('description', '').lower()
-        case_context = edge_case.get('context', '').lower()
-        case_impact = edge_case.get('impact', 'medium')
+        # Pattern-based strategy selection from one (memoized) pass over the description
+        buckets = _edge_case_buckets(edge_case.get('description', ''))
 
-        # Pattern-based strategy selection
-        if any(keyword in case_description for keyword in ['null', 'empty', 'missing']):
+        if 'null' in buckets:
             handling_strategies.extend(self._suggest_null_handling(edge_case))
 
-        if any(keyword in case_description for keyword in ['boundary', 'limit', 'range']):
+        if 'boundary' in buckets:
             handling_strategies.extend(self._suggest_boundary_handling(edge_case))
 
-        if any(keyword in case_description for keyword in ['concurrent', 'parallel', 'race']):
+        if 'concurrent' in buckets:
             handling_strategies.extend(self._suggest_concurrency_handling(edge_case))
 
-        if any(keyword in case_description for keyword in ['network', 'timeout', 'connection']):
+        if 'network' in buckets:
             handling_strategies.extend(self._suggest_network_handling(edge_case))
 
-        if any(keyword in case_description for keyword in ['user', 'input', 'validation']):
+        if 'validation' in buckets:
             handling_strategies.extend(self._suggest_validation_handling(edge_case))
 
         # If no specific patterns match, provide generic strategies
@@ -231,202 +976,35 @@ class SuggestionGenerator:
 
         return handling_strategies
 
-    def _suggest_null_handling(self, edge_case: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _suggest_null_handling(self, edge_case: Dict[str, Any]) -> Tuple[Mapping[str, Any], ...]:
         """Suggest strategies for null/empty/missing value edge cases."""
-        return [{
-            'strategy': 'null_value_handling',
-            'description': 'Implement comprehensive null/empty value handling',
-            'implementation': 'Add validation and default value mechanisms',
-            'confidence': 0.85,
-            'impact': 'high',
-            'effort': 'low',
-            'rationale': 'Null/empty values are common sources of errors and should be handled explicitly',
-            'examples': [
-                'Validate input parameters before processing',
-                'Provide sensible defaults for optional fields',
-                'Return clear error messages for required missing values'
-            ]
-        }, {
-            'strategy': 'graceful_degradation',
-            'description': 'Implement graceful degradation for missing data',
-            'implementation': 'Design fallback behavior when data is unavailable',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'System should continue functioning even with partial data',
-            'examples': [
-                'Use cached data when fresh data is unavailable',
-                'Display partial results with appropriate warnings',
-                'Implement retry mechanisms with exponential backoff'
-            ]
-        }]
-
-    def _suggest_boundary_handling(self, edge_case: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return _NULL_HANDLING
+
+    def _suggest_boundary_handling(self, edge_case: Dict[str, Any]) -> Tuple[Mapping[str, Any], ...]:
         """Suggest strategies for boundary/limit edge cases."""
-        return [{
-            'strategy': 'boundary_validation',
-            'description': 'Implement strict boundary validation and limits',
-            'implementation': 'Add input validation for all boundary conditions',
-            'confidence': 0.90,
-            'impact': 'high',
-            'effort': 'low',
-            'rationale': 'Boundary conditions are critical for system stability and security',
-            'examples': [
-                'Validate array indices before access',
-                'Check memory limits before allocation',
-                'Implement rate limiting for API calls'
-            ]
-        }, {
-            'strategy': 'dynamic_scaling',
-            'description': 'Implement dynamic scaling for resource limits',
-            'implementation': 'Design system to handle varying load conditions',
-            'confidence': 0.70,
-            'impact': 'high',
-            'effort': 'high',
-            'rationale': 'Dynamic scaling provides better resource utilization and user experience',
-            'examples': [
-                'Auto-scale server capacity based on demand',
-                'Implement pagination for large data sets',
-                'Use streaming for large file processing'
-            ]
-        }]
-
-    def _suggest_concurrency_handling(self, edge_case: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return _BOUNDARY_HANDLING
+
+    def _suggest_concurrency_handling(self, edge_case: Dict[str, Any]) -> Tuple[Mapping[str, Any], ...]:
         """Suggest strategies for concurrency edge cases."""
-        return [{
-            'strategy': 'synchronization',
-            'description': 'Implement proper synchronization mechanisms',
-            'implementation': 'Add locks, semaphores, or atomic operations',
-            'confidence': 0.80,
-            'impact': 'high',
-            'effort': 'medium',
-            'rationale': 'Concurrency issues can lead to data corruption and system instability',
-            'examples': [
-                'Use database transactions for data consistency',
-                'Implement optimistic locking for concurrent updates',
-                'Add mutex locks for shared resource access'
-            ]
-        }, {
-            'strategy': 'immutable_design',
-            'description': 'Design with immutable data structures',
-            'implementation': 'Use immutable objects to prevent race conditions',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'high',
-            'rationale': 'Immutable design eliminates many concurrency issues at the architectural level',
-            'examples': [
-                'Use immutable data structures in multi-threaded code',
-                'Implement event sourcing for state changes',
-                'Design stateless services where possible'
-            ]
-        }]
-
-    def _suggest_network_handling(self, edge_case: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return _CONCURRENCY_HANDLING
+
+    def _suggest_network_handling(self, edge_case: Dict[str, Any]) -> Tuple[Mapping[str, Any], ...]:
         """Suggest strategies for network-related edge cases."""
-        return [{
-            'strategy': 'timeout_and_retry',
-            'description': 'Implement timeout and retry mechanisms',
-            'implementation': 'Add configurable timeouts and exponential backoff',
-            'confidence': 0.85,
-            'impact': 'high',
-            'effort': 'low',
-            'rationale': 'Network issues are common and require robust error handling',
-            'examples': [
-                'Set appropriate timeouts for all network calls',
-                'Implement exponential backoff for retries',
-                'Add circuit breaker pattern for failing services'
-            ]
-        }, {
-            'strategy': 'offline_capability',
-            'description': 'Implement offline capability and data synchronization',
-            'implementation': 'Add local caching and sync mechanisms',
-            'confidence': 0.70,
-            'impact': 'medium',
-            'effort': 'high',
-            'rationale': 'Offline capability improves user experience during network issues',
-            'examples': [
-                'Cache data locally for offline access',
-                'Implement conflict resolution for sync',
-                'Provide clear offline mode indicators'
-            ]
-        }]
-
-    def _suggest_validation_handling(self, edge_case: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return _NETWORK_HANDLING
+
+    def _suggest_validation_handling(self, edge_case: Dict[str, Any]) -> Tuple[Mapping[str, Any], ...]:
         """Suggest strategies for user input validation edge cases."""
-        return [{
-            'strategy': 'comprehensive_validation',
-            'description': 'Implement comprehensive input validation',
-            'implementation': 'Add validation at all system boundaries',
-            'confidence': 0.90,
-            'impact': 'high',
-            'effort': 'medium',
-            'rationale': 'Input validation is critical for security and data integrity',
-            'examples': [
-                'Validate all user inputs on both client and server',
-                'Sanitize inputs to prevent injection attacks',
-                'Provide clear validation error messages'
-            ]
-        }, {
-            'strategy': 'progressive_validation',
-            'description': 'Implement progressive validation and user guidance',
-            'implementation': 'Add real-time validation with helpful feedback',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'Progressive validation improves user experience and reduces errors',
-            'examples': [
-                'Show validation errors as user types',
-                'Provide suggestions for valid inputs',
-                'Use progressive disclosure for complex forms'
-            ]
-        }]
-
-    def _suggest_generic_handling(self, edge_case: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return _VALIDATION_HANDLING
+
+    def _suggest_generic_handling(self, edge_case: Dict[str, Any]) -> Tuple[Mapping[str, Any], ...]:
         """Suggest generic strategies for unclassified edge cases."""
-        return [{
-            'strategy': 'defensive_programming',
-            'description': 'Implement defensive programming practices',
-            'implementation': 'Add comprehensive error checking and logging',
-            'confidence': 0.70,
-            'impact': 'medium',
-            'effort': 'low',
-            'rationale': 'Defensive programming helps catch and handle unexpected conditions',
-            'examples': [
-                'Add assertions for critical assumptions',
-                'Implement comprehensive logging',
-                'Add health checks and monitoring'
-            ]
-        }, {
-            'strategy': 'graceful_error_handling',
-            'description': 'Implement graceful error handling and recovery',
-            'implementation': 'Add user-friendly error handling with recovery options',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'Good error handling improves user experience and system reliability',
-            'examples': [
-                'Provide clear error messages to users',
-                'Implement automatic recovery where possible',
-                'Add manual recovery options for users'
-            ]
-        }]
+        return _GENERIC_HANDLING
 
     def _analyze_contradiction_resolution(self, contradiction: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze a contradiction and suggest resolution strategies."""
-        conflicting_reqs = contradiction.get('conflicting_requirements', [])
-        description = contradiction.get('description', '').lower()
-
-        resolutions = []
-
         # Pattern-based resolution strategies
-        if 'priority' in description or 'precedence' in description:
-            resolutions.append(self._suggest_priority_resolution(contradiction))
-
-        if 'performance' in description and 'security' in description:
-            resolutions.append(self._suggest_performance_security_balance(contradiction))
-
-        if 'user' in description and ('admin' in description or 'system' in description):
-            resolutions.append(self._suggest_role_based_resolution(contradiction))
+        patterns = _contradiction_patterns(contradiction.get('description', ''))
+        resolutions = [suggest(contradiction) for pattern, suggest in self._contradiction_dispatch if pattern in patterns]
 
         # Generic resolution strategies
         resolutions.append(self._suggest_requirements_merge(contradiction))
@@ -434,113 +1012,31 @@ class SuggestionGenerator:
 
         return resolutions
 
-    def _suggest_priority_resolution(self, contradiction: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_priority_resolution(self, contradiction: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest priority-based resolution for contradictions."""
-        return {
-            'strategy': 'priority_hierarchy',
-            'description': 'Establish clear priority hierarchy for conflicting requirements',
-            'details': 'Define which requirement takes precedence in conflict situations',
-            'confidence': 0.80,
-            'impact': 'high',
-            'effort': 'low',
-            'rationale': 'Clear priorities help resolve conflicts consistently',
-            'examples': [
-                'Security requirements override performance requirements',
-                'User safety takes precedence over convenience features',
-                'Core functionality priority over nice-to-have features'
-            ]
-        }
+        return _PRIORITY_RESOLUTION
 
-    def _suggest_performance_security_balance(self, contradiction: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_performance_security_balance(self, contradiction: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest balanced approach for performance vs security contradictions."""
-        return {
-            'strategy': 'configurable_balance',
-            'description': 'Implement configurable balance between performance and security',
-            'details': 'Allow system configuration to adjust performance/security trade-offs',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'high',
-            'rationale': 'Different environments may require different performance/security balances',
-            'examples': [
-                'Configurable encryption levels',
-                'Performance vs security profiles',
-                'Runtime security policy adjustments'
-            ]
-        }
+        return _PERFORMANCE_SECURITY_BALANCE
 
-    def _suggest_role_based_resolution(self, contradiction: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_role_based_resolution(self, contradiction: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest role-based resolution for user vs admin contradictions."""
-        return {
-            'strategy': 'role_based_requirements',
-            'description': 'Implement role-based requirement differentiation',
-            'details': 'Define different requirements for different user roles',
-            'confidence': 0.85,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'Different user roles often have legitimately different requirements',
-            'examples': [
-                'Admin users have access to advanced features',
-                'Regular users have simplified interfaces',
-                'Power users get configurable options'
-            ]
-        }
+        return _ROLE_BASED_RESOLUTION
 
-    def _suggest_requirements_merge(self, contradiction: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_requirements_merge(self, contradiction: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest merging contradictory requirements into a unified requirement."""
-        return {
-            'strategy': 'unified_requirement',
-            'description': 'Merge contradictory requirements into unified requirement',
-            'details': 'Combine the best aspects of conflicting requirements',
-            'confidence': 0.70,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'Sometimes contradictions can be resolved by finding a unified approach',
-            'examples': [
-                'Combine fast and secure by using optimized secure algorithms',
-                'Merge simple and powerful by providing layered interfaces',
-                'Unite flexible and consistent through configuration templates'
-            ]
-        }
+        return _REQUIREMENTS_MERGE
 
-    def _suggest_conditional_requirements(self, contradiction: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_conditional_requirements(self, contradiction: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest conditional resolution for contradictions."""
-        return {
-            'strategy': 'conditional_logic',
-            'description': 'Implement conditional logic to handle conflicting requirements',
-            'details': 'Apply different requirements based on context or conditions',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'Context-sensitive requirements can resolve many contradictions',
-            'examples': [
-                'Different behavior for different environments',
-                'Time-based requirement activation',
-                'Load-based performance adjustments'
-            ]
-        }
+        return _CONDITIONAL_REQUIREMENTS
 
     def _analyze_completeness_gap(self, gap: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze a completeness gap and suggest specific requirements."""
-        gap_description = gap.get('description', '').lower()
-        gap_category = gap.get('category', 'general')
-
-        improvements = []
-
         # Pattern-based gap analysis
-        if 'error' in gap_description or 'exception' in gap_description:
-            improvements.append(self._suggest_error_handling_requirement(gap))
-
-        if 'security' in gap_description or 'auth' in gap_description:
-            improvements.append(self._suggest_security_requirement(gap))
-
-        if 'performance' in gap_description or 'scalability' in gap_description:
-            improvements.append(self._suggest_performance_requirement(gap))
-
-        if 'usability' in gap_description or 'accessibility' in gap_description:
-            improvements.append(self._suggest_usability_requirement(gap))
-
-        if 'monitoring' in gap_description or 'logging' in gap_description:
-            improvements.append(self._suggest_observability_requirement(gap))
+        patterns = _gap_patterns(gap.get('description', ''))
+        improvements = [suggest(gap) for area, suggest in self._gap_dispatch if area in patterns]
 
         # Generic gap filling
         if not improvements:
@@ -548,146 +1044,45 @@ class SuggestionGenerator:
 
         return improvements
 
-    def _suggest_error_handling_requirement(self, gap: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_error_handling_requirement(self, gap: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest error handling requirements for gaps."""
-        return {
-            'title': 'Comprehensive Error Handling',
-            'description': 'Add comprehensive error handling and recovery mechanisms',
-            'requirement': {
-                'type': 'error_handling',
-                'content': 'System must implement comprehensive error handling with clear error messages, logging, and recovery mechanisms',
-                'priority': 'high',
-                'category': 'reliability'
-            },
-            'requirement_type': 'non_functional',
-            'justification': 'Proper error handling is essential for system reliability and user experience',
-            'confidence': 0.85,
-            'impact': 'high',
-            'effort': 'medium',
-            'rationale': 'Missing error handling leads to poor user experience and difficult debugging',
-            'examples': [
-                'Implement global exception handling',
-                'Add structured error logging',
-                'Provide user-friendly error messages'
-            ]
-        }
+        return _ERROR_HANDLING_REQUIREMENT
 
-    def _suggest_security_requirement(self, gap: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_security_requirement(self, gap: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest security requirements for gaps."""
-        return {
-            'title': 'Security and Authentication',
-            'description': 'Add comprehensive security and authentication requirements',
-            'requirement': {
-                'type': 'security',
-                'content': 'System must implement secure authentication, authorization, and data protection mechanisms',
-                'priority': 'high',
-                'category': 'security'
-            },
-            'requirement_type': 'non_functional',
-            'justification': 'Security is critical for protecting user data and system integrity',
-            'confidence': 0.90,
-            'impact': 'high',
-            'effort': 'high',
-            'rationale': 'Security gaps expose the system to significant risks',
-            'examples': [
-                'Implement multi-factor authentication',
-                'Add role-based access control',
-                'Encrypt sensitive data at rest and in transit'
-            ]
-        }
+        return _SECURITY_REQUIREMENT
 
-    def _suggest_performance_requirement(self, gap: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_performance_requirement(self, gap: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest performance requirements for gaps."""
-        return {
-            'title': 'Performance and Scalability',
-            'description': 'Add specific performance and scalability requirements',
-            'requirement': {
-                'type': 'performance',
-                'content': 'System must meet specific performance benchmarks and scale to handle expected load',
-                'priority': 'medium',
-                'category': 'performance'
-            },
-            'requirement_type': 'non_functional',
-            'justification': 'Performance requirements ensure good user experience under load',
-            'confidence': 0.80,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'Performance gaps lead to poor user experience and scalability issues',
-            'examples': [
-                'Response time under 200ms for common operations',
-                'Support for 10,000 concurrent users',
-                'Database queries optimized for performance'
-            ]
-        }
+        return _PERFORMANCE_REQUIREMENT
 
-    def _suggest_usability_requirement(self, gap: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_usability_requirement(self, gap: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest usability requirements for gaps."""
-        return {
-            'title': 'Usability and Accessibility',
-            'description': 'Add usability and accessibility requirements',
-            'requirement': {
-                'type': 'usability',
-                'content': 'System must provide intuitive user interface and meet accessibility standards',
-                'priority': 'medium',
-                'category': 'usability'
-            },
-            'requirement_type': 'non_functional',
-            'justification': 'Usability requirements ensure the system is accessible to all users',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'medium',
-            'rationale': 'Usability gaps make the system difficult to use and potentially inaccessible',
-            'examples': [
-                'Meet WCAG 2.1 accessibility standards',
-                'Intuitive navigation and user flows',
-                'Responsive design for mobile devices'
-            ]
-        }
+        return _USABILITY_REQUIREMENT
 
-    def _suggest_observability_requirement(self, gap: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_observability_requirement(self, gap: Dict[str, Any]) -> Mapping[str, Any]:
         """Suggest observability requirements for gaps."""
-        return {
-            'title': 'Monitoring and Observability',
-            'description': 'Add comprehensive monitoring and observability requirements',
-            'requirement': {
-                'type': 'observability',
-                'content': 'System must provide comprehensive monitoring, logging, and alerting capabilities',
-                'priority': 'medium',
-                'category': 'operational'
-            },
-            'requirement_type': 'non_functional',
-            'justification': 'Observability is essential for maintaining and debugging the system',
-            'confidence': 0.80,
-            'impact': 'medium',
-            'effort': 'low',
-            'rationale': 'Missing observability makes the system difficult to maintain and debug',
-            'examples': [
-                'Structured application logging',
-                'Performance and health monitoring',
-                'Automated alerting for critical issues'
-            ]
-        }
+        return _OBSERVABILITY_REQUIREMENT
 
     def _suggest_generic_requirement(self, gap: Dict[str, Any]) -> Dict[str, Any]:
         """Suggest generic requirements for unclassified gaps."""
+        # Each gap field is read once up front
         gap_description = gap.get('description', 'Missing requirement')
+        priority = gap.get('priority', 'medium')
+        category = gap.get('category', 'general')
+        impact = _intern_level(gap.get('impact', 'medium'))
 
         return {
-            'title': f"Address: {gap_description[:50]}...",
+            **_GENERIC_REQUIREMENT,
+            'title': f"Address: {_truncate(gap_description)}",
             'description': f"Add requirement to address identified gap: {gap_description}",
             'requirement': {
-                'type': 'functional',
+                **_GENERIC_REQUIREMENT_SPEC,
                 'content': f"System must address the following requirement: {gap_description}",
-                'priority': gap.get('priority', 'medium'),
-                'category': gap.get('category', 'general')
+                'priority': priority,
+                'category': category
             },
-            'requirement_type': 'functional',
-            'justification': 'Addresses identified completeness gap in specification',
-            'confidence': 0.60,
-            'impact': gap.get('impact', 'medium'),
-            'effort': 'medium',
-            'rationale': 'Completeness gaps should be addressed to ensure comprehensive coverage',
-            'examples': []
+            'impact': impact
         }
 
     def _analyze_compression_refinement(self, compression: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -696,125 +1091,80 @@ class SuggestionGenerator:
         original_reqs = compression.get('original_requirements', [])
         confidence = compression.get('confidence', 0.5)
 
-        refinements = []
-
-        # Check if compression is too aggressive (low confidence)
-        if confidence < 0.7:
-            refinements.append(self._suggest_decompress_refinement(compression))
-
-        # Check if important details were lost
-        if self._check_detail_loss(original_reqs, compressed_req):
-            refinements.append(self._suggest_detail_recovery(compression))
+        # One pass over the originals serves both the detail-loss check and the expansion
+        original_length, key_details = _compression_stats(original_reqs)
+
+        # Everything the refinements depend on; only the first two key details are used
+        cache_key = (compressed_req, confidence < 0.7, original_length, tuple(key_details[:2]))
+        with self._refinement_cache_lock:
+            cached = self._refinement_cache.get(cache_key)
+            if cached is not None:
+                self._refinement_cache.move_to_end(cache_key)
+                return list(cached)
+
+        # All three checks are evaluated up front; a refinement is only built
+        # when its check holds
+        refinements = [
+            build(*args)
+            for needed, build, args in (
+                # Compression is too aggressive (low confidence)
+                (confidence < 0.7, self._suggest_decompress_refinement, (compression, key_details)),
+                # Important details were lost
+                (self._check_detail_loss(original_length, compressed_req),
+                 self._suggest_detail_recovery, (compression,)),
+                # Compression can be improved
+                (self._check_clarity_improvement(compressed_req),
+                 self._suggest_clarity_improvement, (compression,))
+            )
+            if needed
+        ]
 
-        # Check if compression can be improved
-        if self._check_clarity_improvement(compressed_req):
-            refinements.append(self._suggest_clarity_improvement(compression))
+        with self._refinement_cache_lock:
+            self._refinement_cache[cache_key] = tuple(refinements)
+            if len(self._refinement_cache) > _REFINEMENT_CACHE_SIZE:
+                self._refinement_cache.popitem(last=False)
 
         return refinements
 
-    def _suggest_decompress_refinement(self, compression: Dict[str, Any]) -> Dict[str, Any]:
+    def _suggest_decompress_refinement(self, compression: Dict[str, Any], key_details: List[str]) -> Dict[str, Any]:
         """Suggest decompressing overly aggressive compression."""
         return {
-            'title': 'Reduce Compression',
-            'description': 'Expand compressed requirement to preserve important details',
-            'refined_requirement': self._expand_compressed_requirement(compression),
-            'improvement_type': 'detail_preservation',
-            'quality_gain': 'Better preserves original intent and details',
-            'confidence': 0.75,
-            'impact': 'medium',
-            'effort': 'low',
-            'rationale': 'Overly aggressive compression can lose important details'
+            **_DECOMPRESS_REFINEMENT,
+            'refined_requirement': self._expand_compressed_requirement(compression, key_details)
         }
 
     def _suggest_detail_recovery(self, compression: Dict[str, Any]) -> Dict[str, Any]:
         """Suggest recovering lost details from compression."""
-        return {
-            'title': 'Recover Lost Details',
-            'description': 'Add back important details that were lost in compression',
-            'refined_requirement': self._recover_lost_details(compression),
-            'improvement_type': 'detail_recovery',
-            'quality_gain': 'Restores important details while maintaining conciseness',
-            'confidence': 0.80,
-            'impact': 'medium',
-            'effort': 'low',
-            'rationale': 'Important details should not be lost during compression'
-        }
+        return {**_DETAIL_RECOVERY_REFINEMENT, 'refined_requirement': self._recover_lost_details(compression)}
 
     def _suggest_clarity_improvement(self, compression: Dict[str, Any]) -> Dict[str, Any]:
         """Suggest improving clarity of compressed requirement."""
-        return {
-            'title': 'Improve Clarity',
-            'description': 'Improve clarity and readability of compressed requirement',
-            'refined_requirement': self._improve_compression_clarity(compression),
-            'improvement_type': 'clarity_improvement',
-            'quality_gain': 'Better readability and understanding',
-            'confidence': 0.70,
-            'impact': 'low',
-            'effort': 'low',
-            'rationale': 'Clear requirements are easier to understand and implement'
-        }
+        return {**_CLARITY_REFINEMENT, 'refined_requirement': self._improve_compression_clarity(compression)}
 
     def _calculate_suggestion_score(self, suggestion: Dict[str, Any]) -> float:
         """Calculate a composite score for suggestion ranking."""
-        confidence = suggestion.get('confidence', 0.5)
-
-        # Impact scoring
-        impact_scores = {'high': 1.0, 'medium': 0.6, 'low': 0.3}
-        impact_score = impact_scores.get(suggestion.get('impact', 'medium'), 0.6)
-
-        # Effort scoring (lower effort = higher score)
-        effort_scores = {'low': 1.0, 'medium': 0.7, 'high': 0.4}
-        effort_score = effort_scores.get(suggestion.get('effort', 'medium'), 0.7)
-
-        # Type priority scoring
-        type_scores = {
-            'contradiction_resolution': 1.0,  # Highest priority
-            'edge_case_handling': 0.8,
-            'completeness_addition': 0.6,
-            'compression_refinement': 0.4    # Lowest priority
-        }
-        type_score = type_scores.get(suggestion.get('type', 'completeness_addition'), 0.6)
-
-        # Weighted composite score
-        score = (
-            confidence * 0.3 +      # 30% weight on confidence
-            impact_score * 0.4 +    # 40% weight on impact
-            effort_score * 0.2 +    # 20% weight on effort (inverted)
-            type_score * 0.1        # 10% weight on type priority
-        )
-
-        return round(score, 3)
+        return _score_batch([suggestion])[0]
 
     def _get_ranking_rationale(self, suggestion: Dict[str, Any], score: float) -> str:
         """Generate explanation for suggestion ranking."""
-        confidence = suggestion.get('confidence', 0.5)
-        impact = suggestion.get('impact', 'medium')
-        effort = suggestion.get('effort', 'medium')
-        suggestion_type = suggestion.get('type', 'unknown')
-
-        rationale_parts = []
+        get = suggestion.get
+        confidence = get('confidence', 0.5)
 
         if confidence >= 0.8:
-            rationale_parts.append("high confidence")
+            confidence_tier = "high confidence"
         elif confidence >= 0.6:
-            rationale_parts.append("medium confidence")
+            confidence_tier = "medium confidence"
         else:
-            rationale_parts.append("lower confidence")
-
-        rationale_parts.append(f"{impact} impact")
-        rationale_parts.append(f"{effort} effort")
-
-        if suggestion_type == 'contradiction_resolution':
-            rationale_parts.append("critical contradiction")
-        elif suggestion_type == 'edge_case_handling':
-            rationale_parts.append("important edge case")
+            confidence_tier = "lower confidence"
 
-        return f"Ranked due to: {', '.join(rationale_parts)} (score: {score})"
+        return (
+            f"Ranked due to: {confidence_tier}, {get('impact', 'medium')} impact, "
+            f"{get('effort', 'medium')} effort{_TYPE_RATIONALE.get(get('type', 'unknown'), '')} (score: {score})"
+        )
 
-    def _check_detail_loss(self, original_reqs: List[Dict[str, Any]], compressed_req: str) -> bool:
+    def _check_detail_loss(self, original_length: int, compressed_req: str) -> bool:
         """Check if important details were lost in compression."""
         # Simple heuristic: if compressed requirement is much shorter, details might be lost
-        original_length = sum(len(req.get('content', '')) for req in original_reqs)
         compressed_length = len(compressed_req)
 
         # If compression is more than 70%, might have lost details
@@ -822,29 +1172,32 @@ class SuggestionGenerator:
 
     def _check_clarity_improvement(self, compressed_req: str) -> bool:
         """Check if clarity of compressed requirement can be improved."""
-        # Simple heuristics for clarity issues
-        clarity_issues = [
-            len(compressed_req.split()) > 50,  # Too long
-            compressed_req.count(',') > 5,     # Too many clauses
-            ' and ' in compressed_req and ' or ' in compressed_req,  # Mixed logic
-            not compressed_req.strip().endswith('.'),  # No proper ending
-        ]
-
-        return any(clarity_issues)
-
-    def _expand_compressed_requirement(self, compression: Dict[str, Any]) -> str:
-        """Expand an overly compressed requirement."""
-        original_reqs = compression.get('original_requirements', [])
+        # Simple heuristics for clarity issues, stopping at the first one found.
+        # More than 50 words needs at least 101 characters, so the split is
+        # only paid for long requirements.
+        if len(compressed_req) > 100 and len(compressed_req.split()) > 50:  # Too long
+            return True
+
+        # Too many clauses or mixed logic, tallied in a single scan
+        commas = 0
+        conjunctions = set()
+        for match in _CLARITY_PATTERN.finditer(compressed_req):
+            if match.lastgroup == 'comma':
+                commas += 1
+                if commas > 5:
+                    return True
+            else:
+                conjunctions.add(match.lastgroup)
+                if len(conjunctions) == 2:
+                    return True
+
+        return not compressed_req.rstrip().endswith('.')  # No proper ending
+
+    def _expand_compressed_requirement(self, compression: Dict[str, Any], key_details: List[str]) -> str:
+        """Expand an overly compressed requirement with key details from its originals."""
         compressed_req = compression.get('compressed_requirement', '')
 
         # Simple expansion strategy: add back key details from originals
-        key_details = []
-        for req in original_reqs:
-            content = req.get('content', '')
-            # Extract key phrases (very simplified)
-            if 'must' in content.lower():
-                key_details.append(content)
-
         if key_details:
             return f"{compressed_req} Specifically: {'; '.join(key_details[:2])}"
         else:
@@ -864,15 +1217,17 @@ class SuggestionGenerator:
         improved = compressed_req
 
         # Add proper punctuation
-        if not improved.strip().endswith('.'):
+        if not improved.rstrip().endswith('.'):
             improved += '.'
 
-        # Break up long sentences
-        if len(improved.split()) > 30:
-            # Find a good break point (very simplified)
+        # Break up long sentences; more than 30 words needs over 60 characters,
+        # so shorter requirements are never split into words
+        if len(improved) > 60:
             words = improved.split()
-            mid_point = len(words) // 2
-            improved = ' '.join(words[:mid_point]) + '. ' + ' '.join(words[mid_point:])
+            if len(words) > 30:
+                # Find a good break point (very simplified)
+                mid_point = len(words) // 2
+                improved = ' '.join(words[:mid_point]) + '. ' + ' '.join(words[mid_point:])
 
         return improved
 
@@ -7,19 +7,20 @@ session management, and multi-format export capabilities.
 """
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
-from rich.layout import Layout
-from rich.live import Live
-import questionary
-from typing import Optional, Dict, Any, List
+# questionary (prompt_toolkit) is imported where sessions are picked, so the
+# sessions and export commands never load it
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 import json
+import mmap
+import os
 from datetime import datetime
+from functools import lru_cache
 import sys
 
 from ..interactive_loop import RefinementLoop
@@ -28,6 +29,72 @@ from ..presenters.suggestion_generator import SuggestionGenerator
 from ..presenters.approval_handler import ApprovalHandler
 from ..models import FinalizedSpecification
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Files at least this large are parsed from a memory map rather than read into
+# a bytes copy first; below it the mapping costs more than the copy it saves
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _load_json(path) -> Any:
+    """Parse a JSON file, with orjson when it is available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+    with open(path, 'rb') as f:
+        return json.load(f)
+
+
+# Characters of an export kept for the optional preview
+_PREVIEW_CHARS = 2000
+
+
+# Fixed status cells for the session and summary tables, built once as Text so
+# rendering a table does not run the markup parser over them for every row
+_FINALIZED = Text("✅ Finalized")
+_IN_PROGRESS = Text("🔄 In Progress")
+_HIGH = Text("✅ High")
+_MEDIUM = Text("⚠️ Medium")
+_LOW = Text("❌ Low")
+_COMPLETE = Text("✅ Complete")
+_PARTIAL = Text("⚠️ Partial")
+_EFFICIENT = Text("✅ Efficient")
+_EXTENDED = Text("⚠️ Extended")
+_READY = Text("✅ Ready")
+_NOT_READY = Text("❌ Not Ready")
+
+
+def _short_id(session_id: str, length: int = 8) -> str:
+    """Abbreviate a session id for display."""
+    return f"{session_id[:length]}..."
+
+
+# Session timestamps never change once written, so each is formatted once per
+# process however often the session table is redrawn
+@lru_cache(maxsize=256)
+def _format_created_at(created_at: str) -> str:
+    """Format an ISO creation timestamp for the sessions table."""
+    try:
+        created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    except ValueError:
+        return created_at[:16]  # Fallback
+    return created_dt.strftime('%Y-%m-%d %H:%M')
+
+
+@lru_cache(maxsize=256)
+def _format_modified_at(last_modified: float) -> str:
+    """Format a file modification time for the sessions table."""
+    return datetime.fromtimestamp(last_modified).strftime('%Y-%m-%d %H:%M')
+
 
 class RefinementCLI:
     """
@@ -37,16 +104,22 @@ class RefinementCLI:
     session management, and export capabilities.
     """
 
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.console = Console()
+        # Print tracebacks for unexpected errors (also enabled by SPECIFY_DEBUG=1)
+        self.verbose = verbose
         self.current_session = None
         self.session_dir = Path.home() / ".specify" / "sessions"
         self.session_dir.mkdir(parents=True, exist_ok=True)
+        # Session file name -> (mtime_ns, parsed data), so a session is only
+        # parsed again once it has been written since it was last read
+        self._session_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
     def run_refinement(self,
                       refined_spec,
                       session_id: Optional[str] = None,
-                      export_format: str = "json") -> FinalizedSpecification:
+                      export_format: str = "json",
+                      reconfigure: bool = False) -> FinalizedSpecification:
         """
         Run the interactive refinement process with rich CLI interface.
 
@@ -54,6 +127,7 @@ class RefinementCLI:
             refined_spec: RefinedSpecification from Phase 2
             session_id: Optional session ID to resume
             export_format: Format for final export (json, markdown, yaml)
+            reconfigure: Ask the setup questions even if preferences were saved
 
         Returns:
             FinalizedSpecification ready for Phase 4
@@ -63,9 +137,9 @@ class RefinementCLI:
             self._show_welcome_banner()
 
             # Setup components
-            presenter = FindingPresenter(self.console)
+            presenter = FindingPresenter(self.console, batch_output=True)
             suggestion_generator = SuggestionGenerator()
-            approval_handler = ApprovalHandler(self.console)
+            approval_handler = ApprovalHandler(self.console, reconfigure=reconfigure)
 
             refinement_loop = RefinementLoop(
                 presenter=presenter,
@@ -80,31 +154,15 @@ class RefinementCLI:
             else:
                 session_id = self._handle_session_selection(refinement_loop)
 
-            # Run the main refinement process
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=self.console,
-                transient=True
-            ) as progress:
-
-                # Initialize progress task
-                task = progress.add_task(
-                    "Starting refinement...",
-                    total=100
-                )
-
-                # Start refinement
-                progress.update(task, advance=10, description="Analyzing specification...")
-
-                finalized_spec = refinement_loop.start_refinement(
-                    refined_spec=refined_spec,
-                    session_id=session_id
-                )
+            # Run the main refinement process. The loop prompts the user as it
+            # goes, so a status line is printed up front instead of keeping a
+            # live progress display redrawing around those prompts.
+            self.console.print("[dim]Analyzing specification...[/dim]")
 
-                progress.update(task, advance=90, description="Finalizing specification...")
+            finalized_spec = refinement_loop.start_refinement(
+                refined_spec=refined_spec,
+                session_id=session_id
+            )
 
             # Show completion and export
             self._show_completion_summary(finalized_spec)
@@ -124,18 +182,13 @@ class RefinementCLI:
         """List all available refinement sessions."""
         self._show_sessions_banner()
 
-        refinement_loop = RefinementLoop(
-            presenter=FindingPresenter(),
-            suggestion_generator=SuggestionGenerator(),
-            approval_handler=ApprovalHandler(),
-            session_dir=self.session_dir
-        )
-
-        sessions = refinement_loop.list_sessions()
+        sessions = RefinementLoop.list_sessions_from_dir(self.session_dir)
 
         if not sessions:
-            self.console.print("📭 [yellow]No refinement sessions found[/yellow]")
-            self.console.print("   Start a new refinement to create your first session.")
+            self.console.print(
+                "📭 [yellow]No refinement sessions found[/yellow]\n"
+                "   Start a new refinement to create your first session."
+            )
             return []
 
         # Display sessions in a nice table
@@ -148,29 +201,21 @@ class RefinementCLI:
 
         for session in sessions:
             # Format status
-            status = "✅ Finalized" if session.get('is_finalized') else "🔄 In Progress"
+            status = _FINALIZED if session.get('is_finalized') else _IN_PROGRESS
 
             # Format dates
             created_at = session.get('created_at', 'Unknown')
-            if created_at != 'Unknown':
-                try:
-                    created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    created_str = created_dt.strftime('%Y-%m-%d %H:%M')
-                except:
-                    created_str = created_at[:16]  # Fallback
+            if isinstance(created_at, str) and created_at != 'Unknown':
+                created_str = _format_created_at(created_at)
             else:
                 created_str = 'Unknown'
 
             # Format last modified
             last_modified = session.get('last_modified', 0)
-            if last_modified:
-                modified_dt = datetime.fromtimestamp(last_modified)
-                modified_str = modified_dt.strftime('%Y-%m-%d %H:%M')
-            else:
-                modified_str = 'Unknown'
+            modified_str = _format_modified_at(last_modified) if last_modified else 'Unknown'
 
             table.add_row(
-                session['session_id'][:8] + "...",
+                _short_id(session['session_id']),
                 created_str,
                 status,
                 str(session.get('iterations', 0)),
@@ -188,19 +233,16 @@ class RefinementCLI:
 
     def resume_session(self, session_id: str):
         """Resume a specific refinement session."""
-        self.console.print(f"🔄 [cyan]Resuming session {session_id[:8]}...[/cyan]")
+        self.console.print(f"🔄 [cyan]Resuming session {_short_id(session_id)}[/cyan]")
 
         try:
             # Load and show session info
-            session_file = self.session_dir / f"{session_id}.json"
+            session_data = self._load_session_data(session_id)
 
-            if not session_file.exists():
+            if session_data is None:
                 self.console.print(f"❌ [red]Session {session_id} not found[/red]")
                 return None
 
-            with open(session_file, 'r') as f:
-                session_data = json.load(f)
-
             # Show session summary
             self._show_session_info(session_data)
 
@@ -217,15 +259,12 @@ class RefinementCLI:
     def export_session(self, session_id: str, format_type: str = "json", output_path: Optional[str] = None):
         """Export a finalized session to various formats."""
         try:
-            session_file = self.session_dir / f"{session_id}.json"
+            session_data = self._load_session_data(session_id)
 
-            if not session_file.exists():
+            if session_data is None:
                 self.console.print(f"❌ [red]Session {session_id} not found[/red]")
                 return
 
-            with open(session_file, 'r') as f:
-                session_data = json.load(f)
-
             if not session_data.get('is_finalized', False):
                 self.console.print(f"⚠️  [yellow]Session is not finalized yet[/yellow]")
                 if not Confirm.ask("Export anyway?", default=False):
@@ -252,6 +291,24 @@ class RefinementCLI:
         except Exception as e:
             self.console.print(f"❌ [red]Export failed: {e}[/red]")
 
+    def _load_session_data(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a saved session's data, or None if there is no such session."""
+        session_file = self.session_dir / f"{session_id}.json"
+
+        try:
+            mtime_ns = session_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._session_cache.get(session_file.name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        session_data = _load_json(session_file)
+
+        self._session_cache[session_file.name] = (mtime_ns, session_data)
+        return session_data
+
     def _show_welcome_banner(self):
         """Show welcome banner for refinement process."""
         banner_text = Text()
@@ -265,7 +322,7 @@ class RefinementCLI:
             padding=(1, 2)
         )
 
-        self.console.print("\n", panel)
+        self.console.print(Group("\n", panel))
 
     def _show_sessions_banner(self):
         """Show banner for session management."""
@@ -280,12 +337,14 @@ class RefinementCLI:
             padding=(1, 2)
         )
 
-        self.console.print("\n", panel)
+        self.console.print(Group("\n", panel))
 
     def _show_session_resume(self, session_id: str):
         """Show session resume information."""
-        self.console.print(f"\n🔄 [cyan]Resuming refinement session[/cyan]")
-        self.console.print(f"   Session ID: [bright_white]{session_id[:8]}...[/bright_white]")
+        self.console.print(
+            "\n🔄 [cyan]Resuming refinement session[/cyan]\n"
+            f"   Session ID: [bright_white]{_short_id(session_id)}[/bright_white]"
+        )
 
     def _handle_session_selection(self, refinement_loop: RefinementLoop) -> Optional[str]:
         """Handle session selection or creation."""
@@ -299,6 +358,8 @@ class RefinementCLI:
                 "📋 List all sessions"
             ]
 
+            import questionary
+
             choice = questionary.select(
                 "What would you like to do?",
                 choices=choices
@@ -319,32 +380,28 @@ class RefinementCLI:
         if not sessions:
             return None
 
-        # Prepare choices
-        choices = []
+        # Choice text -> session id; the first session wins if two texts collide
+        choices: Dict[str, Optional[str]] = {}
         for session in sessions[:10]:  # Show max 10 recent sessions
             session_id = session['session_id']
             created_at = session.get('created_at', 'Unknown')
             status = "✅" if session.get('is_finalized') else "🔄"
             iterations = session.get('iterations', 0)
 
-            choice_text = f"{status} {session_id[:8]}... ({iterations} iterations) - {created_at[:10]}"
-            choices.append((choice_text, session_id))
+            choice_text = f"{status} {_short_id(session_id)} ({iterations} iterations) - {created_at[:10]}"
+            choices.setdefault(choice_text, session_id)
 
-        choices.append(("❌ Cancel", None))
+        choices.setdefault("❌ Cancel", None)
 
         # Get selection
-        choice_texts = [choice[0] for choice in choices]
+        import questionary
+
         selected = questionary.select(
             "Select session to resume:",
-            choices=choice_texts
+            choices=list(choices)
         ).ask()
 
-        # Find corresponding session ID
-        for choice_text, session_id in choices:
-            if choice_text == selected:
-                return session_id
-
-        return None
+        return choices.get(selected)
 
     def _show_session_info(self, session_data: Dict[str, Any]):
         """Show detailed information about a session."""
@@ -358,7 +415,7 @@ class RefinementCLI:
         is_finalized = session_data.get('is_finalized', False)
         iterations = len(session_data.get('iterations', []))
 
-        table.add_row("Session ID", session_id[:16] + "...")
+        table.add_row("Session ID", _short_id(session_id, 16))
         table.add_row("Created", created_at[:19] if created_at != 'Unknown' else 'Unknown')
         table.add_row("Status", "✅ Finalized" if is_finalized else "🔄 In Progress")
         table.add_row("Iterations", str(iterations))
@@ -384,8 +441,6 @@ class RefinementCLI:
         if not finalized_spec:
             return
 
-        self.console.print("\n🎉 [bold green]Refinement Complete![/bold green]")
-
         # Create summary table
         table = Table(show_header=True, header_style="bold green")
         table.add_column("Metric", style="cyan")
@@ -401,30 +456,30 @@ class RefinementCLI:
         table.add_row(
             "Confidence Score",
             f"{confidence:.1%}",
-            "✅ High" if confidence >= 0.8 else "⚠️ Medium" if confidence >= 0.6 else "❌ Low"
+            _HIGH if confidence >= 0.8 else _MEDIUM if confidence >= 0.6 else _LOW
         )
 
         table.add_row(
             "Requirements",
             str(requirements_count),
-            "✅ Complete" if finalized_spec.complete_requirement_set else "⚠️ Partial"
+            _COMPLETE if finalized_spec.complete_requirement_set else _PARTIAL
         )
 
         table.add_row(
             "User Acceptance",
             f"{acceptance_rate:.1%}",
-            "✅ High" if acceptance_rate >= 0.7 else "⚠️ Medium" if acceptance_rate >= 0.5 else "❌ Low"
+            _HIGH if acceptance_rate >= 0.7 else _MEDIUM if acceptance_rate >= 0.5 else _LOW
         )
 
         table.add_row(
             "Refinement Iterations",
             str(iterations),
-            "✅ Efficient" if iterations <= 3 else "⚠️ Extended"
+            _EFFICIENT if iterations <= 3 else _EXTENDED
         )
 
         # Execution readiness
         readiness = finalized_spec.get_execution_readiness()
-        ready_status = "✅ Ready" if readiness['ready_for_execution'] else "❌ Not Ready"
+        ready_status = _READY if readiness['ready_for_execution'] else _NOT_READY
 
         table.add_row(
             "Execution Ready",
@@ -438,19 +493,20 @@ class RefinementCLI:
             border_style="green"
         )
 
-        self.console.print(panel)
+        # The whole summary is assembled first and written in a single print
+        output = ["\n🎉 [bold green]Refinement Complete![/bold green]", panel]
 
         # Show any blockers
         if readiness.get('blockers'):
-            self.console.print("\n⚠️  [yellow]Execution Blockers:[/yellow]")
-            for blocker in readiness['blockers']:
-                self.console.print(f"   • {blocker}")
+            output.append("\n⚠️  [yellow]Execution Blockers:[/yellow]")
+            output.extend(f"   • {blocker}" for blocker in readiness['blockers'])
 
         # Show recommendations
         if readiness.get('recommendations'):
-            self.console.print("\n💡 [cyan]Recommendations:[/cyan]")
-            for rec in readiness['recommendations']:
-                self.console.print(f"   • {rec}")
+            output.append("\n💡 [cyan]Recommendations:[/cyan]")
+            output.extend(f"   • {rec}" for rec in readiness['recommendations'])
+
+        self.console.print(Group(*output))
 
     def _handle_export(self, finalized_spec: FinalizedSpecification, export_format: str):
         """Handle specification export."""
@@ -465,16 +521,26 @@ class RefinementCLI:
         filename = f"finalized_spec_{session_id}_{timestamp}.{export_format}"
 
         try:
-            export_content = finalized_spec.export_to_format(export_format)
-
-            with open(filename, 'w') as f:
-                f.write(export_content)
+            chunks = finalized_spec.export_to_format_iter(export_format)
+
+            # Chunks are written as they are produced, so the full export is
+            # never held in memory; only the head needed for a preview is kept
+            # (one character past the limit shows whether it was truncated)
+            preview_parts = []
+            preview_len = 0
+            with open(filename, 'w', buffering=1 << 16) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    if preview_len <= _PREVIEW_CHARS:
+                        head = chunk[:_PREVIEW_CHARS + 1 - preview_len]
+                        preview_parts.append(head)
+                        preview_len += len(head)
 
             self.console.print(f"✅ [green]Exported to {filename}[/green]")
 
             # Offer to open file
             if Confirm.ask("View exported file?", default=False):
-                self._show_export_preview(export_content, export_format)
+                self._show_export_preview("".join(preview_parts), export_format)
 
         except Exception as e:
             self.console.print(f"❌ [red]Export failed: {e}[/red]")
@@ -482,8 +548,8 @@ class RefinementCLI:
     def _show_export_preview(self, content: str, format_type: str):
         """Show preview of exported content."""
         # Limit preview length
-        preview_content = content[:2000]
-        if len(content) > 2000:
+        preview_content = content[:_PREVIEW_CHARS]
+        if len(content) > _PREVIEW_CHARS:
             preview_content += "\n... (truncated)"
 
         # Apply syntax highlighting based on format
@@ -498,23 +564,36 @@ class RefinementCLI:
 
     def _handle_interruption(self):
         """Handle keyboard interruption gracefully."""
-        self.console.print("\n\n⚠️  [yellow]Refinement interrupted![/yellow]")
-        self.console.print("   Your progress has been saved automatically.")
-        self.console.print("   Use 'specify resume <session-id>' to continue later.")
+        self.console.print(
+            "\n\n⚠️  [yellow]Refinement interrupted![/yellow]\n"
+            "   Your progress has been saved automatically.\n"
+            "   Use 'specify resume <session-id>' to continue later."
+        )
 
     def _handle_error(self, error: Exception):
         """Handle unexpected errors."""
-        self.console.print(f"\n❌ [red]Unexpected error occurred:[/red]")
-        self.console.print(f"   {str(error)}")
-
-        if Confirm.ask("Show detailed error information?", default=False):
+        # The traceback is only formatted when asked for up front, so the
+        # default error path neither walks the stack nor prompts
+        if self.verbose or os.getenv("SPECIFY_DEBUG") == "1":
             import traceback
-            self.console.print("\n[dim]" + traceback.format_exc() + "[/dim]")
+            self.console.print(
+                f"\n❌ [red]Unexpected error occurred:[/red]\n   {str(error)}\n"
+                "\n[dim]" + traceback.format_exc() + "[/dim]"
+            )
+        else:
+            self.console.print(
+                f"\n❌ [red]Unexpected error occurred:[/red]\n   {str(error)}\n"
+                "   [dim]Run with --verbose or SPECIFY_DEBUG=1 for details.[/dim]"
+            )
 
     def _export_json(self, session_data: Dict[str, Any], output_path: str):
         """Export session data as JSON."""
-        with open(output_path, 'w') as f:
-            json.dump(session_data, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(session_data, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(session_data, f, indent=2, default=str)
 
     def _export_markdown(self, session_data: Dict[str, Any], output_path: str):
         """Export session data as Markdown."""
@@ -524,13 +603,13 @@ class RefinementCLI:
         if finalized_spec_data:
             # Create FinalizedSpecification object for markdown export
             finalized_spec = FinalizedSpecification.from_dict(finalized_spec_data)
-            markdown_content = finalized_spec._to_markdown()
+            markdown_chunks = finalized_spec.export_to_format_iter("markdown")
         else:
             # Fallback markdown generation
-            markdown_content = self._generate_fallback_markdown(session_data)
+            markdown_chunks = (self._generate_fallback_markdown(session_data),)
 
-        with open(output_path, 'w') as f:
-            f.write(markdown_content)
+        with open(output_path, 'w', buffering=1 << 16) as f:
+            f.writelines(markdown_chunks)
 
     def _export_yaml(self, session_data: Dict[str, Any], output_path: str):
         """Export session data as YAML."""
@@ -578,6 +657,20 @@ specify resume {session_id}
         return md
 
 
+# Shared by the click commands so repeated invocations in one process (e.g.
+# scripts driving the group) reuse one Console and session directory setup
+_cli: Optional[RefinementCLI] = None
+
+
+def _get_cli(verbose: bool = False) -> RefinementCLI:
+    """Return the RefinementCLI shared by the click commands, creating it on first use."""
+    global _cli
+    if _cli is None:
+        _cli = RefinementCLI()
+    _cli.verbose = verbose
+    return _cli
+
+
 # CLI Commands using Click
 @click.group()
 def refinement_cli():
@@ -589,21 +682,23 @@ def refinement_cli():
 @click.option('--session-id', help='Resume specific session')
 @click.option('--export-format', default='json', type=click.Choice(['json', 'markdown', 'yaml']),
               help='Export format for finalized specification')
+@click.option('--reconfigure', is_flag=True, help='Ignore saved review preferences and ask again')
+@click.option('--verbose', is_flag=True, help='Show full tracebacks for unexpected errors')
 @click.argument('spec_file', type=click.Path(exists=True))
-def refine(spec_file, session_id, export_format):
+def refine(spec_file, session_id, export_format, reconfigure, verbose):
     """Start interactive refinement of a specification."""
-    cli = RefinementCLI()
+    cli = _get_cli(verbose)
 
     # Load specification (this would be integrated with Phase 2 output)
     try:
-        with open(spec_file, 'r') as f:
-            spec_data = json.load(f)
+        spec_data = _load_json(spec_file)
 
         # This would normally be a RefinedSpecification object from Phase 2
         finalized_spec = cli.run_refinement(
             refined_spec=spec_data,
             session_id=session_id,
-            export_format=export_format
+            export_format=export_format,
+            reconfigure=reconfigure
         )
 
         if finalized_spec:
@@ -618,15 +713,16 @@ def refine(spec_file, session_id, export_format):
 @refinement_cli.command()
 def sessions():
     """List all refinement sessions."""
-    cli = RefinementCLI()
+    cli = _get_cli()
     cli.list_sessions()
 
 
 @refinement_cli.command()
 @click.argument('session_id')
-def resume(session_id):
+@click.option('--verbose', is_flag=True, help='Show full tracebacks for unexpected errors')
+def resume(session_id, verbose):
     """Resume a specific refinement session."""
-    cli = RefinementCLI()
+    cli = _get_cli(verbose)
     result = cli.resume_session(session_id)
 
     if result:
@@ -643,7 +739,7 @@ def resume(session_id):
 @click.option('--output', 'output_path', help='Output file path')
 def export(session_id, format_type, output_path):
     """Export a refinement session."""
-    cli = RefinementCLI()
+    cli = _get_cli()
     cli.export_session(session_id, format_type, output_path)
 
 
@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 """
-Test script for the Specification Engine (Phase 2).
+Tests for the Specification Engine (Phase 2).
 
-This script demonstrates the engine's capabilities and validates the build.
+The tests are independent, so they can be sharded across cores with
+pytest-xdist: ``pytest -n auto test_engine.py``. Pass ``-s`` to see the
+results report.
 """
 
 import sys
 import os
 import time
+from operator import attrgetter
+
+import pytest
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from analyzer.models import AnalysisResult
-from engine import SpecificationEngine, get_engine_info
+from engine import SpecificationEngine, get_config, get_engine_info
+from engine.models import RefinedSpecification
+
+# Mode timings: untimed warmup runs first, then the best of the timed runs
+WARMUP_RUNS = 1
+TIMED_RUNS = 5
 
 
 def create_sample_analysis() -> AnalysisResult:
@@ -41,14 +51,27 @@ def create_sample_analysis() -> AnalysisResult:
     )
 
 
-def test_engine_basic():
+@pytest.fixture(scope="session")
+def sample_analysis() -> AnalysisResult:
+    """Sample analysis built once per session; the engine only reads its input."""
+    return create_sample_analysis()
+
+
+# Fields shown for each finding in the results report, read in one call per item
+_EDGE_CASE_FIELDS = attrgetter('category.value', 'description', 'severity.value', 'confidence', 'suggested_handling')
+_CONTRADICTION_FIELDS = attrgetter('explanation', 'severity.value', 'confidence', 'suggested_resolution')
+_GAP_FIELDS = attrgetter('category', 'description', 'importance.value', 'confidence', 'suggested_requirement')
+_COMPRESSION_FIELDS = attrgetter('original_requirements', 'compression_ratio', 'compressed_text')
+
+
+def test_engine_basic(sample_analysis):
     """Test basic engine functionality."""
     print("=" * 60)
     print("TESTING SPECIFICATION ENGINE - BASIC FUNCTIONALITY")
     print("=" * 60)
 
     # Create sample data
-    analysis = create_sample_analysis()
+    analysis = sample_analysis
     print(f"\nInput Analysis:")
     print(f"Intent: {analysis.intent}")
     print(f"Requirements: {len(analysis.explicit_requirements)} explicit, {len(analysis.implicit_assumptions)} implicit")
@@ -64,98 +87,125 @@ def test_engine_basic():
     print(f"Version: {info['version']}")
     print(f"Health Status: {info['health']['status']}")
     print(f"Available Processors: {', '.join(info['processors'])}")
+    assert info['health']['status'] == "healthy"
+    assert len(info['processors']) == 4
 
     # Refine specification
     print("\nRefining specification...")
     refined_spec = engine.refine_specification(analysis)
-
-    # Display results
-    print("\n" + "=" * 60)
-    print("SPECIFICATION REFINEMENT RESULTS")
-    print("=" * 60)
-    print(refined_spec.summary())
-
-    # Detailed results
-    print("\nDETAILED RESULTS:")
-    print("-" * 30)
+    assert isinstance(refined_spec, RefinedSpecification)
+    assert 0.0 <= refined_spec.confidence_score <= 1.0
+
+    # Display results; lines are collected and written in one go
+    out = [
+        "\n" + "=" * 60,
+        "SPECIFICATION REFINEMENT RESULTS",
+        "=" * 60,
+        refined_spec.summary(),
+        "\nDETAILED RESULTS:",
+        "-" * 30
+    ]
 
     if refined_spec.edge_cases:
-        print(f"\nEDGE CASES DETECTED ({len(refined_spec.edge_cases)}):")
-        for i, edge_case in enumerate(refined_spec.edge_cases[:5], 1):  # Show first 5
-            print(f"{i}. [{edge_case.category.value}] {edge_case.description}")
-            print(f"   Severity: {edge_case.severity.value}, Confidence: {edge_case.confidence:.2f}")
-            print(f"   Suggested: {edge_case.suggested_handling}")
+        out.append(f"\nEDGE CASES DETECTED ({len(refined_spec.edge_cases)}):")
+        edge_cases = map(_EDGE_CASE_FIELDS, refined_spec.edge_cases[:5])  # Show first 5
+        for i, (category, description, severity, confidence, handling) in enumerate(edge_cases, 1):
+            out.append(f"{i}. [{category}] {description}")
+            out.append(f"   Severity: {severity}, Confidence: {confidence:.2f}")
+            out.append(f"   Suggested: {handling}")
 
     if refined_spec.contradictions:
-        print(f"\nCONTRADICTIONS FOUND ({len(refined_spec.contradictions)}):")
-        for i, contradiction in enumerate(refined_spec.contradictions[:3], 1):  # Show first 3
-            print(f"{i}. {contradiction.explanation}")
-            print(f"   Severity: {contradiction.severity.value}, Confidence: {contradiction.confidence:.2f}")
-            print(f"   Resolution: {contradiction.suggested_resolution}")
+        out.append(f"\nCONTRADICTIONS FOUND ({len(refined_spec.contradictions)}):")
+        contradictions = map(_CONTRADICTION_FIELDS, refined_spec.contradictions[:3])  # Show first 3
+        for i, (explanation, severity, confidence, resolution) in enumerate(contradictions, 1):
+            out.append(f"{i}. {explanation}")
+            out.append(f"   Severity: {severity}, Confidence: {confidence:.2f}")
+            out.append(f"   Resolution: {resolution}")
 
     if refined_spec.completeness_gaps:
-        print(f"\nCOMPLETENESS GAPS ({len(refined_spec.completeness_gaps)}):")
-        for i, gap in enumerate(refined_spec.completeness_gaps[:5], 1):  # Show first 5
-            print(f"{i}. [{gap.category}] {gap.description}")
-            print(f"   Importance: {gap.importance.value}, Confidence: {gap.confidence:.2f}")
-            print(f"   Suggested: {gap.suggested_requirement}")
+        out.append(f"\nCOMPLETENESS GAPS ({len(refined_spec.completeness_gaps)}):")
+        gaps = map(_GAP_FIELDS, refined_spec.completeness_gaps[:5])  # Show first 5
+        for i, (category, description, importance, confidence, suggested) in enumerate(gaps, 1):
+            out.append(f"{i}. [{category}] {description}")
+            out.append(f"   Importance: {importance}, Confidence: {confidence:.2f}")
+            out.append(f"   Suggested: {suggested}")
 
     if refined_spec.compressed_requirements:
-        print(f"\nREQUIREMENT COMPRESSIONS ({len(refined_spec.compressed_requirements)}):")
-        for i, compression in enumerate(refined_spec.compressed_requirements[:3], 1):  # Show first 3
-            print(f"{i}. Compressed {len(compression.original_requirements)} requirements")
-            print(f"   Compression ratio: {compression.compression_ratio:.2f}")
-            print(f"   Result: {compression.compressed_text}")
+        out.append(f"\nREQUIREMENT COMPRESSIONS ({len(refined_spec.compressed_requirements)}):")
+        compressions = map(_COMPRESSION_FIELDS, refined_spec.compressed_requirements[:3])  # Show first 3
+        for i, (originals, ratio, compressed_text) in enumerate(compressions, 1):
+            out.append(f"{i}. Compressed {len(originals)} requirements")
+            out.append(f"   Compression ratio: {ratio:.2f}")
+            out.append(f"   Result: {compressed_text}")
 
     # High priority issues
     high_priority = refined_spec.get_high_priority_issues()
     if high_priority:
-        print(f"\nHIGH PRIORITY ISSUES ({len(high_priority)}):")
-        for i, issue in enumerate(high_priority[:3], 1):
-            print(f"{i}. {issue}")
+        out.append(f"\nHIGH PRIORITY ISSUES ({len(high_priority)}):")
+        out.extend(f"{i}. {issue}" for i, issue in enumerate(high_priority[:3], 1))
 
     # Compression savings
     compression_savings = refined_spec.get_compression_savings()
     if compression_savings > 0:
-        print(f"\nCompression Savings: {compression_savings:.1%}")
+        out.append(f"\nCompression Savings: {compression_savings:.1%}")
 
-    print("\nProcessing Metrics:")
     metrics = refined_spec.processing_metrics
-    print(f"- Processing time: {metrics.processing_time_seconds:.2f}s")
-    print(f"- Processors run: {', '.join(metrics.processors_run)}")
-    print(f"- Total issues found: {metrics.total_issues_found}")
-
-    return refined_spec
+    out.extend([
+        "\nProcessing Metrics:",
+        f"- Processing time: {metrics.processing_time_seconds:.2f}s",
+        f"- Processors run: {', '.join(metrics.processors_run)}",
+        f"- Total issues found: {metrics.total_issues_found}"
+    ])
+    sys.stdout.write("\n".join(out) + "\n")
+
+    assert len(metrics.processors_run) == 4
+    assert metrics.total_issues_found == (
+        len(refined_spec.edge_cases) + len(refined_spec.contradictions) + len(refined_spec.completeness_gaps)
+    )
 
 
-def test_engine_modes():
+def test_engine_modes(sample_analysis):
     """Test different processing modes."""
     print("\n" + "=" * 60)
     print("TESTING DIFFERENT PROCESSING MODES")
     print("=" * 60)
 
-    analysis = create_sample_analysis()
+    analysis = sample_analysis
     modes = ["fast", "balanced"]  # Skip "intelligent" as it requires actual LLM
 
-    for mode in modes:
-        print(f"\nTesting {mode.upper()} mode...")
-
-        # Update configuration for this mode
-        from engine import update_config
-        update_config({"mode": mode})
-
-        # Create engine and process
-        engine = SpecificationEngine()
-        start_time = time.time()
-        refined_spec = engine.refine_specification(analysis)
-        end_time = time.time()
+    # Build the engine once; each mode only swaps its configuration
+    from engine import update_config
+    engine = SpecificationEngine()
+    original_mode = get_config().mode.value
 
-        print(f"Mode: {mode}")
-        print(f"Processing time: {end_time - start_time:.2f}s")
-        print(f"Edge cases: {len(refined_spec.edge_cases)}")
-        print(f"Contradictions: {len(refined_spec.contradictions)}")
-        print(f"Gaps: {len(refined_spec.completeness_gaps)}")
-        print(f"Confidence: {refined_spec.confidence_score:.2f}")
+    try:
+        for mode in modes:
+            print(f"\nTesting {mode.upper()} mode...")
+
+            # Update configuration for this mode
+            update_config({"mode": mode})
+            engine.apply_config()
+            assert engine.config.mode.value == mode
+
+            for _ in range(WARMUP_RUNS):
+                engine.refine_specification(analysis)
+
+            times = []
+            for _ in range(TIMED_RUNS):
+                start_time = time.perf_counter()
+                refined_spec = engine.refine_specification(analysis)
+                times.append(time.perf_counter() - start_time)
+
+            print(f"Mode: {mode}")
+            print(f"Processing time: {min(times):.4f}s (best of {TIMED_RUNS})")
+            print(f"Edge cases: {len(refined_spec.edge_cases)}")
+            print(f"Contradictions: {len(refined_spec.contradictions)}")
+            print(f"Gaps: {len(refined_spec.completeness_gaps)}")
+            print(f"Confidence: {refined_spec.confidence_score:.2f}")
+            assert isinstance(refined_spec, RefinedSpecification)
+    finally:
+        # Leave the global configuration as the other tests expect it
+        update_config({"mode": original_mode})
 
 
 def test_engine_health():
@@ -181,42 +231,10 @@ def test_engine_health():
     for name, status in health['components'].items():
         print(f"  {name}: {status.get('status', 'unknown')}")
 
-
-def main():
-    """Main test function."""
-    print("SPECIFICATION ENGINE (PHASE 2) - BUILD VERIFICATION")
-    print("=" * 60)
-
-    try:
-
-        # Test basic functionality
-        refined_spec = test_engine_basic()
-
-        # Test different modes
-        test_engine_modes()
-
-        # Test health check
-        test_engine_health()
-
-        print("\n" + "=" * 60)
-        print("BUILD VERIFICATION SUCCESSFUL!")
-        print("=" * 60)
-        print("✓ All processors functional")
-        print("✓ Rule engine operational")
-        print("✓ Configuration system working")
-        print("✓ Plugin architecture ready")
-        print("✓ Data models validated")
-        print("\nThe Specification Engine (Phase 2) is ready for production use.")
-
-        return True
-
-    except Exception as e:
-        print(f"\n❌ BUILD VERIFICATION FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    assert health['status'] == "healthy"
+    for name in ("edge_case_detector", "requirement_compressor", "contradiction_finder", "completeness_validator"):
+        assert health['components'][name]['status'] == "healthy"
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
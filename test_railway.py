@@ -1,17 +1,31 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 import uvicorn
 
-app = FastAPI()
+# Routes returning plain data are encoded with orjson
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Static bodies, encoded once; only a lightweight Response wraps them per request
+_OK_BODY = b'{"status":"ok"}'
+_HEALTHY_BODY = b'{"status":"healthy"}'
 
 @app.get("/")
 def read_root():
-    return {"status": "ok"}
+    return Response(_OK_BODY, media_type="application/json")
 
 @app.get("/health")
 def health():
-    return {"status": "healthy"}
+    return Response(_HEALTHY_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import os
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Multiple workers need the app as an import string. uvloop and httptools
+    # come with uvicorn[standard] and are picked up by the default "auto" loop/http.
+    uvicorn.run(
+        "test_railway:app",
+        host="0.0.0.0",
+        port=port,
+        workers=int(os.environ.get("WEB_CONCURRENCY", 2)),
+        access_log=False
+    )
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the interactive refinement data models.
+"""
+
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+import src.refinement.models as refinement_models
+from src.refinement.models import RefinementSession, UserDecision, UserDecisionAction
+
+
+@pytest.mark.skipif(not refinement_models.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_session_dump_matches_without_orjson(monkeypatch):
+    """Session files are the same document whichever encoder wrote them."""
+    timestamp = datetime(2026, 1, 2, 3, 4, 5)
+    session = RefinementSession(
+        session_id="dump-parity",
+        original_spec={"intent": "Café — ✅", "requirements": ["a", "b"]},
+        iterations=[],
+        user_decisions=[
+            UserDecision(
+                suggestion_id="s1",
+                suggestion={"title": "Handle ✅ input"},
+                action=UserDecisionAction.ACCEPT,
+                timestamp=timestamp
+            )
+        ],
+        current_state={
+            "action": UserDecisionAction.MODIFY,
+            "seen_at": timestamp,
+            "nested": {"when": [timestamp]}
+        },
+        created_at=timestamp,
+        updated_at=timestamp
+    )
+
+    with_orjson = io.BytesIO()
+    session.dump(with_orjson)
+
+    monkeypatch.setattr(refinement_models, "ORJSON_AVAILABLE", False)
+    without_orjson = io.BytesIO()
+    session.dump(without_orjson)
+
+    document = json.loads(with_orjson.getvalue())
+    assert json.loads(without_orjson.getvalue()) == document
+    assert without_orjson.getvalue() == with_orjson.getvalue()
+    assert document["current_state"] == {
+        "action": "modify",
+        "seen_at": "2026-01-02T03:04:05",
+        "nested": {"when": ["2026-01-02T03:04:05"]}
+    }
+    assert document["original_spec"]["intent"] == "Café — ✅"